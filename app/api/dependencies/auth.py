@@ -1,59 +1,109 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from app.core.security import verify_token
+from cachetools import TTLCache
+from app.core.security import decode_token
+from app.core.redis import redis_client
 from app.db.supabase import get_supabase_client
-from typing import Optional
+from typing import Annotated, Optional
+import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    """Dependency to get current authenticated user."""
+# User columns exposed to dependants; never includes the password hash
+USER_COLUMNS = "id,username,email,is_active,is_admin"
+
+# Resolved users keyed by token digest. Each entry stores its own deadline so
+# a cached user never outlives the token it was resolved from.
+TOKEN_CACHE_TTL = 30  # seconds
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL)
+
+def _token_cache_key(token: str) -> bytes:
+    """Build the token cache key without keeping raw tokens in memory."""
+    return hashlib.sha256(token.encode()).digest()
+
+def _get_cached_user(key: bytes) -> Optional[dict]:
+    """Get cached user for a token digest if the entry is still valid."""
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, user = entry
+    if expires_at <= time.time():
+        _token_cache.pop(key, None)
+        return None
+    return user
+
+def _cache_user(key: bytes, payload: dict, user: dict) -> None:
+    """Cache a resolved user for at most TOKEN_CACHE_TTL or the token's exp."""
+    expires_at = time.time() + TOKEN_CACHE_TTL
+    if payload.get("exp") is not None:
+        expires_at = min(expires_at, float(payload["exp"]))
+    _token_cache[key] = (expires_at, user)
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme)
+):
+    """
+    Dependency to get current authenticated user.
+    
+    The resolved user is also stored on request.state.user so middleware
+    and nested helpers can read it without resolving it again.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    cache_key = _token_cache_key(token)
+    cached_user = _get_cached_user(cache_key)
+    if cached_user is not None:
+        request.state.user = cached_user
+        return cached_user
+
     try:
         # Verify JWT token
-        user_id = verify_token(token)
+        payload = decode_token(token)
+        user_id = payload.get("sub") if payload else None
         if user_id is None:
             raise credentials_exception
         
-        # Get user from database
-        supabase = get_supabase_client()
-        result = await supabase.table("users").select("*").eq("id", user_id).execute()
-        
-        if not result.data:
-            raise credentials_exception
+        # Get user from Redis, falling back to the database
+        user = await redis_client.get_cached_user(user_id)
+        if user is None:
+            result = await get_supabase_client().table("users").select(USER_COLUMNS).eq("id", user_id).execute()
+            
+            if not result.data:
+                raise credentials_exception
+            
+            user = result.data[0]
+            await redis_client.cache_user(user_id, user)
         
-        user = result.data[0]
         if not user.get("is_active"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Inactive user"
             )
-            
+
+        _cache_user(cache_key, payload, user)
+        request.state.user = user
         return user
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Authentication error: {str(e)}")
         raise credentials_exception
 
-async def get_current_active_user(
-    current_user = Depends(get_current_user)
-):
-    """Dependency to get current active user."""
-    if not current_user.get("is_active"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-    return current_user
+# get_current_user already rejects inactive users; aliasing keeps the same
+# callable so FastAPI's dependency cache resolves it only once per request.
+get_current_active_user = get_current_user
 
 def check_admin_access(user: dict) -> bool:
     """Check if user has admin access."""
@@ -70,3 +120,8 @@ async def get_current_admin_user(
             detail="Admin access required"
         )
     return current_user
+
+# Canonical annotated dependencies. Using the same callable everywhere lets
+# FastAPI resolve the user once per request.
+CurrentUser = Annotated[dict, Depends(get_current_user)]
+AdminUser = Annotated[dict, Depends(get_current_admin_user)]
@@ -1,9 +1,8 @@
-from typing import Generator
-from app.db.supabase import supabase_client
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import async_session
 
-def get_db() -> Generator:
-    """Get database connection."""
-    try:
-        yield supabase_client
-    finally:
-        pass  # Connection is managed by Supabase client
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get a database session, closed when the request finishes."""
+    async with async_session() as session:
+        yield session
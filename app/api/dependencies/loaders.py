@@ -0,0 +1,24 @@
+import asyncio
+from typing import Optional
+from aiodataloader import DataLoader
+from app.models.backtest import BacktestStrategyDB
+
+_strategy_loader: Optional[DataLoader] = None
+
+async def get_strategy_loader() -> DataLoader:
+    """
+    Dependency to get the strategy loader.
+    
+    Lookups issued in the same event-loop tick, across concurrent requests,
+    are coalesced into a single WHERE id IN (...) query. Results are not
+    cached between batches so a request never sees stale strategies.
+    """
+    global _strategy_loader
+    loop = asyncio.get_running_loop()
+    if _strategy_loader is None or _strategy_loader.loop is not loop:
+        _strategy_loader = DataLoader(
+            BacktestStrategyDB.get_by_ids,
+            cache=False,
+            loop=loop
+        )
+    return _strategy_loader
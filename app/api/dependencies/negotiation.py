@@ -0,0 +1,64 @@
+from fastapi import Depends, Header, Response
+from pydantic import BaseModel
+from typing import Annotated, Any, Optional
+import orjson
+import ormsgpack
+
+from app.models.technical import ARRAY_CONTEXT
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Accept values that select MessagePack; anything else gets JSON
+_MSGPACK_ACCEPT = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# Models, numpy arrays and naive UTC datetimes pack directly, without a JSON
+# round trip
+MSGPACK_OPTIONS = (
+    ormsgpack.OPT_SERIALIZE_PYDANTIC
+    | ormsgpack.OPT_SERIALIZE_NUMPY
+    | ormsgpack.OPT_NAIVE_UTC
+)
+
+# numpy arrays are written by orjson directly; naive datetimes stay naive,
+# matching pydantic's own JSON output
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def negotiated_media_type(accept: Optional[str] = Header(None)) -> str:
+    """Pick the response encoding for numeric endpoints from the Accept header."""
+    if accept and any(media_type in accept for media_type in _MSGPACK_ACCEPT):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+MediaType = Annotated[str, Depends(negotiated_media_type)]
+
+def packb(data: Any) -> bytes:
+    """Serialize data as MessagePack."""
+    return ormsgpack.packb(data, option=MSGPACK_OPTIONS)
+
+def dumps_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model as JSON bytes with orjson.
+    
+    Array fields reach orjson as numpy arrays and are written in one call
+    each, instead of as Python lists built from every element.
+    """
+    return orjson.dumps(model.model_dump(context=ARRAY_CONTEXT), option=JSON_OPTIONS)
+
+def fast_json_response(model: BaseModel) -> Response:
+    """A ready JSON Response for a model; the route's response_model is not reapplied."""
+    return Response(dumps_json(model), media_type=JSON_MEDIA_TYPE)
+
+def negotiated_response(data: Any, media_type: str, fast_json: bool = False) -> Any:
+    """
+    Encode data for the negotiated media type.
+    
+    JSON data is returned unchanged so the route's response_model still
+    applies, unless fast_json is set and data is a model; MessagePack is
+    returned as a ready Response.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return Response(packb(data), media_type=MSGPACK_MEDIA_TYPE)
+    if fast_json and isinstance(data, BaseModel):
+        return fast_json_response(data)
+    return data
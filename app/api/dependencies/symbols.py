@@ -0,0 +1,28 @@
+from fastapi import Depends, HTTPException, Path
+from functools import lru_cache
+from typing import Annotated
+import re
+import sys
+
+# Ticker symbols: a letter followed by up to nine letters, digits, dots or
+# dashes (e.g. AAPL, BRK.B, BF-B)
+_SYMBOL_RE = re.compile(r"[A-Z][A-Z0-9.\-]{0,9}", re.ASCII)
+
+@lru_cache(maxsize=8192)
+def _normalize_symbol(symbol: str) -> str:
+    """Uppercase, validate and intern a symbol; memoized per raw input."""
+    upper = symbol.upper()
+    if not _SYMBOL_RE.fullmatch(upper):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid symbol: {symbol}"
+        )
+    return sys.intern(upper)
+
+def validated_symbol(
+    symbol: str = Path(..., description="Stock symbol (e.g., AAPL)")
+) -> str:
+    """Dependency returning the validated, uppercased symbol path parameter."""
+    return _normalize_symbol(symbol)
+
+SymbolDep = Annotated[str, Depends(validated_symbol)]
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from app.api.dependencies.auth import get_current_admin_user
-from app.core.security import get_password_hash
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from app.api.dependencies.auth import AdminUser
+from app.core.security import get_password_hash_async
+from app.core.redis import redis_client
 from app.db.supabase import get_supabase_client
+from postgrest.exceptions import APIError
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
 import logging
@@ -10,6 +13,9 @@ from uuid import UUID
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Postgres error code for unique constraint violations
+UNIQUE_VIOLATION = "23505"
+
 class UserCreate(BaseModel):
     username: str
     password: str
@@ -29,32 +35,37 @@ class UserResponse(BaseModel):
     is_active: bool
     is_admin: bool
 
+# Columns matching UserResponse; rows selected with these are returned as-is
+# through ORJSONResponse instead of being re-validated against the model.
+USER_RESPONSE_COLUMNS = ",".join(UserResponse.model_fields)
+
 @router.post("/users", response_model=UserResponse)
 async def create_user(
     user_in: UserCreate,
-    current_user: dict = Depends(get_current_admin_user)
+    current_user: AdminUser
 ):
     """
     Create new user (admin only).
     """
     try:
-        supabase = get_supabase_client()
+        # Create new user; the username UNIQUE constraint rejects duplicates
+        user_data = user_in.model_dump()
+        user_data["hashed_password"] = await get_password_hash_async(user_data.pop("password"))
+        
+        result = await get_supabase_client().table("users").insert(user_data).select(USER_RESPONSE_COLUMNS).execute()
+        return ORJSONResponse(result.data[0])
         
-        # Check if username already exists
-        result = await supabase.table("users").select("*").eq("username", user_in.username).execute()
-        if result.data:
+    except APIError as e:
+        if e.code == UNIQUE_VIOLATION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered"
             )
-        
-        # Create new user
-        user_data = user_in.dict()
-        user_data["hashed_password"] = get_password_hash(user_data.pop("password"))
-        
-        result = await supabase.table("users").insert(user_data).execute()
-        return result.data[0]
-        
+        logger.error(f"User creation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Could not create user"
+        )
     except Exception as e:
         logger.error(f"User creation error: {str(e)}")
         raise HTTPException(
@@ -64,15 +75,22 @@ async def create_user(
 
 @router.get("/users", response_model=List[UserResponse])
 async def list_users(
-    current_user: dict = Depends(get_current_admin_user)
+    current_user: AdminUser,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
 ):
     """
-    List all users (admin only).
+    List users, one page at a time (admin only).
     """
     try:
-        supabase = get_supabase_client()
-        result = await supabase.table("users").select("*").execute()
-        return result.data
+        result = await (
+            get_supabase_client().table("users")
+            .select(USER_RESPONSE_COLUMNS)
+            .order("username")
+            .range(skip, skip + limit - 1)
+            .execute()
+        )
+        return ORJSONResponse(result.data)
         
     except Exception as e:
         logger.error(f"User listing error: {str(e)}")
@@ -85,26 +103,15 @@ async def list_users(
 async def update_user(
     user_id: UUID,
     user_in: UserUpdate,
-    current_user: dict = Depends(get_current_admin_user)
+    current_user: AdminUser
 ):
     """
     Update user (admin only).
     """
     try:
-        supabase = get_supabase_client()
-        
-        # Check if user exists
-        result = await supabase.table("users").select("*").eq("id", str(user_id)).execute()
-        if not result.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        # Update user
-        update_data = user_in.dict(exclude_unset=True)
-        result = await supabase.table("users").update(update_data).eq("id", str(user_id)).execute()
-        return result.data[0]
+        # Update user; PostgREST returns the updated rows
+        update_data = user_in.model_dump(exclude_unset=True)
+        result = await get_supabase_client().table("users").update(update_data).eq("id", str(user_id)).select(USER_RESPONSE_COLUMNS).execute()
         
     except Exception as e:
         logger.error(f"User update error: {str(e)}")
@@ -112,29 +119,27 @@ async def update_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Could not update user"
         )
+    
+    if not result.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    await redis_client.invalidate_user(str(user_id))
+    return ORJSONResponse(result.data[0])
 
 @router.delete("/users/{user_id}")
 async def delete_user(
     user_id: UUID,
-    current_user: dict = Depends(get_current_admin_user)
+    current_user: AdminUser
 ):
     """
     Delete user (admin only).
     """
     try:
-        supabase = get_supabase_client()
-        
-        # Check if user exists
-        result = await supabase.table("users").select("*").eq("id", str(user_id)).execute()
-        if not result.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        # Delete user
-        await supabase.table("users").delete().eq("id", str(user_id)).execute()
-        return {"message": "User deleted successfully"}
+        # Delete user; PostgREST returns the deleted rows
+        result = await get_supabase_client().table("users").delete().eq("id", str(user_id)).select("id").execute()
         
     except Exception as e:
         logger.error(f"User deletion error: {str(e)}")
@@ -142,10 +147,19 @@ async def delete_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Could not delete user"
         )
+    
+    if not result.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    await redis_client.invalidate_user(str(user_id))
+    return {"message": "User deleted successfully"}
 
 @router.post("/generate-key")
 async def generate_new_key(
-    current_admin: dict = Depends(get_current_admin_user)
+    current_admin: AdminUser
 ) -> dict:
     """Generate a new 32-bit key."""
     from app.core.security import generate_random_key
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-from app.core.security import verify_password, create_access_token, verify_token
+from app.core.security import verify_password_async, create_access_token, verify_token
 from app.db.supabase import get_supabase_client
 from datetime import timedelta
 from app.core.config import get_settings
@@ -19,9 +19,8 @@ async def login(
     """
     OAuth2 compatible token login.
     """
-    # Find user by username
-    supabase = get_supabase_client()
-    result = await supabase.table("users").select("*").eq("username", form_data.username).execute()
+    # Find user by username; only the columns needed to authenticate
+    result = await get_supabase_client().table("users").select("id,is_active,hashed_password").eq("username", form_data.username).execute()
     
     if not result.data:
         raise HTTPException(
@@ -32,8 +31,8 @@ async def login(
     
     user = result.data[0]
     
-    # Verify password
-    if not verify_password(form_data.password, user["hashed_password"]):
+    # Verify password (bcrypt is CPU-bound, keep it off the event loop)
+    if not await verify_password_async(form_data.password, user["hashed_password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -86,6 +85,8 @@ async def refresh_token(
             "token_type": "bearer"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Token refresh error: {str(e)}")
         raise HTTPException(
@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
-from datetime import datetime
 from uuid import UUID
 
-from app.api.dependencies.auth import get_current_user
+from aiodataloader import DataLoader
+
+from app.api.dependencies.auth import CurrentUser
+from app.api.dependencies.loaders import get_strategy_loader
 from app.models.backtest import (
     BacktestConfig,
     BacktestResult,
+    BacktestResultDB,
     BacktestStrategy,
+    BacktestStrategyDB,
     StrategyConfig,
     TimeFrame
 )
 from app.services.backtest import backtest_service
-from app.models.user import User
 
 router = APIRouter()
 
@@ -20,24 +23,29 @@ router = APIRouter()
 async def run_backtest(
     config: BacktestConfig,
     strategy_id: UUID,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ):
     """Run a backtest with the given configuration and strategy."""
     try:
         # Get strategy
-        strategy = await BacktestStrategy.get_by_id(strategy_id)
+        strategy = await strategy_loader.load(strategy_id)
         if not strategy:
             raise HTTPException(
                 status_code=404,
                 detail="Strategy not found"
             )
             
-        if strategy.user_id != current_user.id and not strategy.is_public:
+        if str(strategy.user_id) != current_user["id"] and not strategy.is_public:
             raise HTTPException(
                 status_code=403,
                 detail="Not authorized to use this strategy"
             )
         
+        # The service reads config as a StrategyConfig; strategy_config
+        # reuses the cached parse of the stored JSONB
+        strategy = BacktestStrategy.model_validate(strategy, from_attributes=True)
+        
         # Run backtest
         result = await backtest_service.run_backtest(
             strategy=strategy,
@@ -46,6 +54,8 @@ async def run_backtest(
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -55,12 +65,12 @@ async def run_backtest(
 @router.post("/backtest/strategy", response_model=BacktestStrategy)
 async def create_strategy(
     strategy: StrategyConfig,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
 ):
     """Create a new backtest strategy."""
     try:
         new_strategy = BacktestStrategy(
-            user_id=current_user.id,
+            user_id=current_user["id"],
             name=strategy.name,
             description=strategy.description,
             config=strategy,
@@ -81,17 +91,18 @@ async def create_strategy(
 @router.get("/backtest/strategy/{strategy_id}", response_model=BacktestStrategy)
 async def get_strategy(
     strategy_id: UUID,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ):
     """Get a backtest strategy by ID."""
-    strategy = await BacktestStrategy.get_by_id(strategy_id)
+    strategy = await strategy_loader.load(strategy_id)
     if not strategy:
         raise HTTPException(
             status_code=404,
             detail="Strategy not found"
         )
         
-    if strategy.user_id != current_user.id and not strategy.is_public:
+    if str(strategy.user_id) != current_user["id"] and not strategy.is_public:
         raise HTTPException(
             status_code=403,
             detail="Not authorized to view this strategy"
@@ -101,70 +112,65 @@ async def get_strategy(
 
 @router.get("/backtest/strategy", response_model=List[BacktestStrategy])
 async def list_strategies(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
     include_public: bool = False
 ):
     """List all strategies owned by the user."""
-    strategies = await BacktestStrategy.get_by_user(current_user.id)
-    
-    if include_public:
-        public_strategies = await BacktestStrategy.get_public()
-        strategies.extend([s for s in public_strategies if s.user_id != current_user.id])
+    return await BacktestStrategyDB.get_for_user(
+        current_user["id"],
+        include_public=include_public
+    )
+
+async def _raise_strategy_write_error(
+    strategy_loader: DataLoader,
+    strategy_id: UUID,
+    action: str
+) -> None:
+    """Raise 404 or 403 after an owner-scoped write matched no strategy."""
+    strategy = await strategy_loader.load(strategy_id)
+    if not strategy:
+        raise HTTPException(
+            status_code=404,
+            detail="Strategy not found"
+        )
         
-    return strategies
+    raise HTTPException(
+        status_code=403,
+        detail=f"Not authorized to {action} this strategy"
+    )
 
 @router.put("/backtest/strategy/{strategy_id}", response_model=BacktestStrategy)
 async def update_strategy(
     strategy_id: UUID,
     strategy: StrategyConfig,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ):
     """Update a backtest strategy."""
-    existing_strategy = await BacktestStrategy.get_by_id(strategy_id)
-    if not existing_strategy:
-        raise HTTPException(
-            status_code=404,
-            detail="Strategy not found"
-        )
-        
-    if existing_strategy.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403,
-            detail="Not authorized to update this strategy"
-        )
-        
-    # Update strategy
-    existing_strategy.name = strategy.name
-    existing_strategy.description = strategy.description
-    existing_strategy.config = strategy
-    existing_strategy.updated_at = datetime.utcnow()
-    
-    # Save to database
-    await existing_strategy.save()
+    # Update only if owned by the user; existence is checked on failure only
+    updated_strategy = await BacktestStrategyDB.update_owned(
+        strategy_id,
+        current_user["id"],
+        name=strategy.name,
+        description=strategy.description,
+        config=strategy.model_dump(mode="json")
+    )
+    if not updated_strategy:
+        await _raise_strategy_write_error(strategy_loader, strategy_id, "update")
     
-    return existing_strategy
+    return updated_strategy
 
 @router.delete("/backtest/strategy/{strategy_id}")
 async def delete_strategy(
     strategy_id: UUID,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ):
     """Delete a backtest strategy."""
-    strategy = await BacktestStrategy.get_by_id(strategy_id)
-    if not strategy:
-        raise HTTPException(
-            status_code=404,
-            detail="Strategy not found"
-        )
-        
-    if strategy.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403,
-            detail="Not authorized to delete this strategy"
-        )
-        
-    # Delete from database
-    await strategy.delete()
+    # Delete only if owned by the user; existence is checked on failure only
+    deleted = await BacktestStrategyDB.delete_owned(strategy_id, current_user["id"])
+    if not deleted:
+        await _raise_strategy_write_error(strategy_loader, strategy_id, "delete")
     
     return {"message": "Strategy deleted successfully"}
 
@@ -172,27 +178,26 @@ async def delete_strategy(
 async def share_strategy(
     strategy_id: UUID,
     is_public: bool,
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ):
     """Make a strategy public or private."""
-    strategy = await BacktestStrategy.get_by_id(strategy_id)
-    if not strategy:
-        raise HTTPException(
-            status_code=404,
-            detail="Strategy not found"
-        )
-        
-    if strategy.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403,
-            detail="Not authorized to share this strategy"
-        )
-        
-    # Update visibility
-    strategy.is_public = is_public
-    strategy.updated_at = datetime.utcnow()
-    
-    # Save to database
-    await strategy.save()
+    # Update visibility only if owned by the user
+    updated_strategy = await BacktestStrategyDB.update_owned(
+        strategy_id,
+        current_user["id"],
+        is_public=is_public
+    )
+    if not updated_strategy:
+        await _raise_strategy_write_error(strategy_loader, strategy_id, "share")
     
     return {"message": f"Strategy is now {'public' if is_public else 'private'}"}
+
+@router.get("/backtest/results")
+async def list_results(
+    current_user: CurrentUser
+):
+    """List summaries of the user's backtest results, newest first."""
+    # Projected rows only; full results are fetched one at a time by ID
+    rows = await BacktestResultDB.list_summaries(current_user["id"])
+    return [dict(row) for row in rows]
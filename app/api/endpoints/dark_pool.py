@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from typing import Dict, List
 
@@ -9,16 +10,22 @@ from app.models.technical import (
     PriceLevel
 )
 from app.services.dark_pool import dark_pool_service
-from app.core.dependencies import get_current_user
+from app.api.dependencies.auth import CurrentUser
+from app.core.cache import cache_response, symbol_key_builder
 
-router = APIRouter(prefix="/dark-pool", tags=["Dark Pool Analysis"])
+router = APIRouter(
+    prefix="/dark-pool",
+    tags=["Dark Pool Analysis"],
+    default_response_class=ORJSONResponse
+)
 
 @router.get("/{symbol}/analysis", response_model=DarkPoolAnalysis)
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_dark_pool_analysis(
     symbol: str,
+    current_user: CurrentUser,
     timeframe: TimeFrame = TimeFrame.MINUTE,
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get complete dark pool analysis for a symbol."""
     try:
@@ -39,8 +46,8 @@ async def get_dark_pool_analysis(
 @router.get("/{symbol}/real-time", response_model=DarkPoolAnalysis)
 async def get_real_time_dark_pool(
     symbol: str,
-    window_minutes: int = Query(default=5, ge=1, le=60),
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser,
+    window_minutes: int = Query(default=5, ge=1, le=60)
 ):
     """Get real-time dark pool analysis."""
     try:
@@ -58,25 +65,20 @@ async def get_real_time_dark_pool(
         )
 
 @router.get("/{symbol}/venues", response_model=List[DarkPoolVenue])
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_dark_pool_venues(
     symbol: str,
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser,
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get dark pool venue statistics."""
     try:
-        analysis = await dark_pool_service.get_dark_pool_analysis(
+        return await dark_pool_service.get_dark_pool_venues(
             symbol=symbol,
             timeframe=TimeFrame.MINUTE,
             lookback_minutes=lookback_minutes
         )
         
-        return sorted(
-            analysis.venues,
-            key=lambda x: x.volume,
-            reverse=True
-        )
-        
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -84,26 +86,22 @@ async def get_dark_pool_venues(
         )
 
 @router.get("/{symbol}/levels", response_model=List[PriceLevel])
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_dark_pool_levels(
     symbol: str,
+    current_user: CurrentUser,
     significant_only: bool = Query(default=False),
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get dark pool price levels."""
     try:
-        analysis = await dark_pool_service.get_dark_pool_analysis(
+        return await dark_pool_service.get_dark_pool_levels(
             symbol=symbol,
             timeframe=TimeFrame.MINUTE,
-            lookback_minutes=lookback_minutes
+            lookback_minutes=lookback_minutes,
+            significant_only=significant_only
         )
         
-        levels = analysis.price_levels
-        if significant_only:
-            levels = [level for level in levels if level.is_significant]
-        
-        return sorted(levels, key=lambda x: x.price)
-        
     except Exception as e:
         raise HTTPException(
             status_code=500,
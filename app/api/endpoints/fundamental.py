@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from typing import Dict, List
 
@@ -14,14 +15,20 @@ from app.models.fundamental import (
     DividendAnalysis
 )
 from app.services.fundamental import fundamental_service
-from app.core.dependencies import get_current_user
+from app.api.dependencies.auth import CurrentUser
+from app.core.cache import cache_response, symbol_key_builder
 
-router = APIRouter(prefix="/fundamental", tags=["Fundamental Analysis"])
+router = APIRouter(
+    prefix="/fundamental",
+    tags=["Fundamental Analysis"],
+    default_response_class=ORJSONResponse
+)
 
 @router.get("/{symbol}/analysis", response_model=FundamentalAnalysis)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_fundamental_analysis(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get complete fundamental analysis for a company."""
     try:
@@ -38,9 +45,10 @@ async def get_fundamental_analysis(
         )
 
 @router.get("/{symbol}/ratios", response_model=FinancialRatios)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_financial_ratios(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get financial ratios for a company."""
     try:
@@ -57,9 +65,10 @@ async def get_financial_ratios(
         )
 
 @router.get("/{symbol}/financials", response_model=List[FinancialStatement])
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_financial_statements(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get historical financial statements."""
     try:
@@ -80,9 +89,10 @@ async def get_financial_statements(
         )
 
 @router.get("/{symbol}/industry", response_model=IndustryMetrics)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_industry_metrics(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get industry metrics and analysis."""
     try:
@@ -99,9 +109,10 @@ async def get_industry_metrics(
         )
 
 @router.get("/{symbol}/peers", response_model=List[PeerComparison])
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_peer_comparison(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get peer comparison data."""
     try:
@@ -122,9 +133,10 @@ async def get_peer_comparison(
         )
 
 @router.get("/{symbol}/valuation", response_model=ValuationModel)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_valuation(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get company valuation analysis."""
     try:
@@ -141,9 +153,10 @@ async def get_valuation(
         )
 
 @router.get("/{symbol}/risk", response_model=RiskAssessment)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_risk_assessment(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get company risk assessment."""
     try:
@@ -160,9 +173,10 @@ async def get_risk_assessment(
         )
 
 @router.get("/{symbol}/growth", response_model=GrowthAnalysis)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_growth_analysis(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get company growth analysis."""
     try:
@@ -179,9 +193,10 @@ async def get_growth_analysis(
         )
 
 @router.get("/{symbol}/dividends", response_model=DividendAnalysis)
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_dividend_analysis(
     symbol: str,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser
 ):
     """Get dividend analysis if applicable."""
     try:
@@ -197,6 +212,8 @@ async def get_dividend_analysis(
         
         return analysis.dividends
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,18 +1,25 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from typing import Dict, List
 
 from app.models.technical import TimeFrame, LiquidityAnalysis, LiquidityLevel
 from app.services.liquidity import liquidity_service
-from app.core.dependencies import get_current_user
+from app.api.dependencies.auth import CurrentUser
+from app.core.cache import cache_response, symbol_key_builder
 
-router = APIRouter(prefix="/liquidity", tags=["Liquidity Analysis"])
+router = APIRouter(
+    prefix="/liquidity",
+    tags=["Liquidity Analysis"],
+    default_response_class=ORJSONResponse
+)
 
 @router.get("/{symbol}/analysis", response_model=LiquidityAnalysis)
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_liquidity_analysis(
     symbol: str,
-    timeframe: TimeFrame = TimeFrame.MINUTE,
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser,
+    timeframe: TimeFrame = TimeFrame.MINUTE
 ):
     """Get complete liquidity analysis for a symbol."""
     try:
@@ -30,10 +37,11 @@ async def get_liquidity_analysis(
         )
 
 @router.get("/{symbol}/levels", response_model=List[LiquidityLevel])
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_liquidity_levels(
     symbol: str,
-    min_strength: float = Query(default=0.7, ge=0.0, le=1.0),
-    current_user=Depends(get_current_user)
+    current_user: CurrentUser,
+    min_strength: float = Query(default=0.7, ge=0.0, le=1.0)
 ):
     """Get significant liquidity levels for a symbol."""
     try:
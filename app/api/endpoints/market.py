@@ -1,13 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from app.services.market_data import market_data_service, DataSource
 from app.api.dependencies.auth import get_current_user
-from typing import Dict, List, Optional
+from app.api.dependencies.symbols import SymbolDep
+from app.api.dependencies.negotiation import MSGPACK_MEDIA_TYPE, MediaType, packb
+from app.core.cache import cache_response, symbol_key_builder
+from app.core.singleflight import singleflight
+from typing import Annotated, Dict, List, Optional
 from datetime import datetime
 import logging
+import orjson
+import re
 from enum import Enum
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class PeriodEnum(str, Enum):
     ONE_DAY = "1d"
@@ -30,9 +37,29 @@ class IntervalEnum(str, Enum):
     ONE_WEEK = "1wk"
     ONE_MONTH = "1mo"
 
+# Query patterns built from the enums above. Validating plain strings against
+# these skips constructing an Enum member for every request.
+PERIOD_PATTERN = f"^({'|'.join(p.value for p in PeriodEnum)})$"
+INTERVAL_PATTERN = f"^({'|'.join(i.value for i in IntervalEnum)})$"
+
+# Indicator resolution: D, W, M or a multiple such as 5D
+_RESOLUTION_RE = re.compile(r"[1-9][0-9]*[DMW]|D", re.ASCII)
+
+def validated_resolution(
+    resolution: str = Query("D", description="Time resolution")
+) -> str:
+    """Validate the indicator resolution against the precompiled pattern."""
+    if not _RESOLUTION_RE.fullmatch(resolution):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid resolution: {resolution}"
+        )
+    return resolution
+
 @router.get("/quote/{symbol}")
+@cache_response(expire=5, key_builder=symbol_key_builder)
 async def get_quote(
-    symbol: str,
+    symbol: SymbolDep,
     source: Optional[DataSource] = Query(DataSource.FINNHUB, description="Data source"),
     current_user: dict = Depends(get_current_user)
 ) -> Dict:
@@ -42,7 +69,10 @@ async def get_quote(
     - **symbol**: Stock symbol (e.g., AAPL)
     - **source**: Data source (finnhub, yahoo, or fmp)
     """
-    quote = await market_data_service.get_real_time_quote(symbol.upper(), source)
+    quote = await singleflight.do(
+        f"quote:{symbol}:{source.value}",
+        lambda: market_data_service.get_real_time_quote(symbol, source)
+    )
     if not quote:
         raise HTTPException(
             status_code=404,
@@ -52,36 +82,66 @@ async def get_quote(
 
 @router.get("/historical/{symbol}")
 async def get_historical_data(
-    symbol: str,
-    period: PeriodEnum = Query(PeriodEnum.ONE_DAY, description="Time period"),
-    interval: IntervalEnum = Query(IntervalEnum.ONE_MINUTE, description="Time interval"),
+    symbol: SymbolDep,
+    media_type: MediaType,
+    period: Annotated[str, Query(pattern=PERIOD_PATTERN, description="Time period")] = PeriodEnum.ONE_DAY.value,
+    interval: Annotated[str, Query(pattern=INTERVAL_PATTERN, description="Time interval")] = IntervalEnum.ONE_MINUTE.value,
     source: Optional[DataSource] = Query(DataSource.YAHOO, description="Data source"),
     current_user: dict = Depends(get_current_user)
-) -> List[Dict]:
+) -> StreamingResponse:
     """
-    Get historical price data.
+    Get historical price data, streamed as NDJSON (one bar per line).
+    
+    Clients sending Accept: application/msgpack get a stream of MessagePack
+    maps instead, one per bar.
     
     - **symbol**: Stock symbol (e.g., AAPL)
     - **period**: Time period (1d, 5d, 1mo, etc.)
     - **interval**: Time interval (1m, 5m, 1h, etc.)
-    - **source**: Data source (finnhub, yahoo, or fmp)
+    - **source**: Data source (yahoo or fmp)
     """
-    data = await market_data_service.get_historical_data(
-        symbol.upper(),
-        period=period.value,
-        interval=interval.value,
+    pages = market_data_service.stream_historical_data(
+        symbol,
+        period=period,
+        interval=interval,
         source=source
     )
-    if not data:
+    
+    # Resolve the first page up front so a missing symbol is still a 404
+    try:
+        first_page = await anext(pages, None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not first_page:
         raise HTTPException(
             status_code=404,
             detail=f"Historical data not found for symbol: {symbol}"
         )
-    return data
+    
+    if media_type == MSGPACK_MEDIA_TYPE:
+        encode_page, stream_media_type = _msgpack_page, MSGPACK_MEDIA_TYPE
+    else:
+        encode_page, stream_media_type = _ndjson_page, "application/x-ndjson"
+    
+    async def generate():
+        yield encode_page(first_page)
+        async for page in pages:
+            yield encode_page(page)
+    
+    return StreamingResponse(generate(), media_type=stream_media_type)
+
+def _ndjson_page(rows: List[Dict]) -> bytes:
+    """Serialize rows as newline-delimited JSON."""
+    return b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+def _msgpack_page(rows: List[Dict]) -> bytes:
+    """Serialize rows as a sequence of MessagePack maps."""
+    return b"".join(packb(row) for row in rows)
 
 @router.get("/profile/{symbol}")
+@cache_response(expire=3600, key_builder=symbol_key_builder)
 async def get_company_profile(
-    symbol: str,
+    symbol: SymbolDep,
     source: Optional[DataSource] = Query(DataSource.FMP, description="Data source"),
     current_user: dict = Depends(get_current_user)
 ) -> Dict:
@@ -91,7 +151,10 @@ async def get_company_profile(
     - **symbol**: Stock symbol (e.g., AAPL)
     - **source**: Data source (finnhub or fmp)
     """
-    profile = await market_data_service.get_company_profile(symbol.upper(), source)
+    profile = await singleflight.do(
+        f"profile:{symbol}:{source.value}",
+        lambda: market_data_service.get_company_profile(symbol, source)
+    )
     if not profile:
         raise HTTPException(
             status_code=404,
@@ -101,7 +164,7 @@ async def get_company_profile(
 
 @router.get("/insider/{symbol}")
 async def get_insider_trading(
-    symbol: str,
+    symbol: SymbolDep,
     current_user: dict = Depends(get_current_user)
 ) -> List[Dict]:
     """
@@ -109,7 +172,7 @@ async def get_insider_trading(
     
     - **symbol**: Stock symbol (e.g., AAPL)
     """
-    data = await market_data_service.get_insider_trading(symbol.upper())
+    data = await market_data_service.get_insider_trading(symbol)
     if not data:
         raise HTTPException(
             status_code=404,
@@ -119,7 +182,7 @@ async def get_insider_trading(
 
 @router.get("/institutional/{symbol}")
 async def get_institutional_holders(
-    symbol: str,
+    symbol: SymbolDep,
     current_user: dict = Depends(get_current_user)
 ) -> List[Dict]:
     """
@@ -127,7 +190,7 @@ async def get_institutional_holders(
     
     - **symbol**: Stock symbol (e.g., AAPL)
     """
-    data = await market_data_service.get_institutional_holders(symbol.upper())
+    data = await market_data_service.get_institutional_holders(symbol)
     if not data:
         raise HTTPException(
             status_code=404,
@@ -136,8 +199,9 @@ async def get_institutional_holders(
     return data
 
 @router.get("/ratios/{symbol}")
+@cache_response(expire=3600, key_builder=symbol_key_builder)
 async def get_financial_ratios(
-    symbol: str,
+    symbol: SymbolDep,
     current_user: dict = Depends(get_current_user)
 ) -> Dict:
     """
@@ -145,7 +209,10 @@ async def get_financial_ratios(
     
     - **symbol**: Stock symbol (e.g., AAPL)
     """
-    data = await market_data_service.get_financial_ratios(symbol.upper())
+    data = await singleflight.do(
+        f"ratios:{symbol}",
+        lambda: market_data_service.get_financial_ratios(symbol)
+    )
     if not data:
         raise HTTPException(
             status_code=404,
@@ -154,9 +221,10 @@ async def get_financial_ratios(
     return data
 
 @router.get("/indicators/{symbol}")
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_technical_indicators(
-    symbol: str,
-    resolution: str = Query("D", regex="^[1-9][0-9]*[DMW]$|^D$", description="Time resolution"),
+    symbol: SymbolDep,
+    resolution: str = Depends(validated_resolution),
     current_user: dict = Depends(get_current_user)
 ) -> Dict:
     """
@@ -172,7 +240,7 @@ async def get_technical_indicators(
     - Bollinger Bands (20,2)
     """
     indicators = await market_data_service.get_technical_indicators(
-        symbol.upper(),
+        symbol,
         resolution=resolution
     )
     if not indicators:
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, HTTPException, Query, Path, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from app.services.market_data import market_data_service
 from app.models.technical import TimeFrame
 from app.api.dependencies.auth import get_current_user
+from app.core.cache import cache_response, symbol_key_builder
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 @router.get("/{symbol}/price")
 async def get_stock_price(
@@ -12,28 +14,23 @@ async def get_stock_price(
     current_user = Depends(get_current_user)
 ):
     """Get current stock price."""
-    try:
-        data = await market_data_service.get_current_price(symbol)
-        if not data:
-            raise HTTPException(status_code=404, detail="Price data not found")
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await market_data_service.get_current_price(symbol)
+    if not data:
+        raise HTTPException(status_code=404, detail="Price data not found")
+    return data
 
 @router.get("/{symbol}/indicators")
+@cache_response(expire=60, key_builder=symbol_key_builder)
 async def get_technical_indicators(
     symbol: str = Path(..., min_length=1),
     timeframe: TimeFrame = TimeFrame.DAILY,
     current_user = Depends(get_current_user)
 ):
     """Get technical indicators for a stock."""
-    try:
-        data = await market_data_service.get_technical_indicators(symbol, timeframe)
-        if not data:
-            raise HTTPException(status_code=404, detail="Technical data not found")
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await market_data_service.get_technical_indicators(symbol, timeframe)
+    if not data:
+        raise HTTPException(status_code=404, detail="Technical data not found")
+    return data
 
 @router.get("/{symbol}/financials/{statement_type}")
 async def get_financial_statements(
@@ -42,41 +39,31 @@ async def get_financial_statements(
     current_user = Depends(get_current_user)
 ):
     """Get financial statements for a stock."""
-    try:
-        data = await market_data_service.get_financial_statements(symbol, statement_type)
-        if not data:
-            raise HTTPException(status_code=404, detail="Financial data not found")
-        return data
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await market_data_service.get_financial_statements(symbol, statement_type)
+    if not data:
+        raise HTTPException(status_code=404, detail="Financial data not found")
+    return data
 
 @router.get("/{symbol}/news")
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_stock_news(
     symbol: str,
     limit: int = Query(10, ge=1, le=100),
     current_user = Depends(get_current_user)
 ):
     """Get news for a stock."""
-    try:
-        data = await market_data_service.get_stock_news(symbol, limit)
-        if not data:
-            raise HTTPException(status_code=404, detail="News data not found")
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await market_data_service.get_stock_news(symbol, limit)
+    if not data:
+        raise HTTPException(status_code=404, detail="News data not found")
+    return data
 
 @router.get("/watchlist")
 async def get_watchlist(
     current_user = Depends(get_current_user)
 ):
     """Get user's watchlist."""
-    try:
-        data = await market_data_service.get_watchlist(current_user.id)
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await market_data_service.get_watchlist(current_user.id)
+    return data
 
 @router.post("/watchlist/{symbol}")
 async def add_to_watchlist(
@@ -84,13 +71,10 @@ async def add_to_watchlist(
     current_user = Depends(get_current_user)
 ):
     """Add symbol to watchlist."""
-    try:
-        success = await market_data_service.add_to_watchlist(current_user.id, symbol)
-        if not success:
-            raise HTTPException(status_code=400, detail="Failed to add to watchlist")
-        return {"message": "Added to watchlist"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await market_data_service.add_to_watchlist(current_user.id, symbol)
+    if not success:
+        raise HTTPException(status_code=400, detail="Failed to add to watchlist")
+    return {"message": "Added to watchlist"}
 
 @router.delete("/watchlist/{symbol}")
 async def remove_from_watchlist(
@@ -98,10 +82,7 @@ async def remove_from_watchlist(
     current_user = Depends(get_current_user)
 ):
     """Remove symbol from watchlist."""
-    try:
-        success = await market_data_service.remove_from_watchlist(current_user.id, symbol)
-        if not success:
-            raise HTTPException(status_code=404, detail="Symbol not found in watchlist")
-        return {"message": "Removed from watchlist"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await market_data_service.remove_from_watchlist(current_user.id, symbol)
+    if not success:
+        raise HTTPException(status_code=404, detail="Symbol not found in watchlist")
+    return {"message": "Removed from watchlist"}
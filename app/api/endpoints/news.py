@@ -1,16 +1,37 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from app.services.news import news_service, NewsSource
 from app.api.dependencies.auth import get_current_user
-from typing import Dict, List, Optional, Set
+from app.api.dependencies.symbols import SymbolDep
+from app.core.cache import cache_response, filter_key_builder, symbol_key_builder
+from app.core.singleflight import singleflight
+from typing import Dict, FrozenSet, List, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+def ticker_filter(
+    tickers: Optional[List[str]] = Query(None, description="Stock tickers to filter by")
+) -> Optional[FrozenSet[str]]:
+    """Normalize requested tickers against the known ticker universe."""
+    if not tickers:
+        return None
+    
+    known = news_service.normalize_tickers(tickers)
+    if not known:
+        raise HTTPException(
+            status_code=404,
+            detail="No articles found matching the criteria"
+        )
+    
+    return known
 
 @router.get("/articles")
+@cache_response(expire=300, key_builder=filter_key_builder)
 async def get_news_articles(
-    tickers: Optional[Set[str]] = Query(None, description="Stock tickers to filter by"),
+    tickers: Optional[FrozenSet[str]] = Depends(ticker_filter),
     topics: Optional[List[str]] = Query(None, description="Topics to filter by"),
     sources: Optional[List[NewsSource]] = Query(None, description="News sources to use"),
     min_sentiment: Optional[float] = Query(
@@ -36,7 +57,7 @@ async def get_news_articles(
     """
     Get news articles filtered by tickers and topics.
     
-    - **tickers**: Optional set of stock tickers (e.g., ["AAPL", "MSFT"])
+    - **tickers**: Optional stock tickers (e.g., ["AAPL", "MSFT"]); unknown tickers are dropped
     - **topics**: Optional list of topics (e.g., ["artificial intelligence", "earnings"])
     - **sources**: Optional list of news sources
     - **min_sentiment**: Optional minimum sentiment score (-1 to 1)
@@ -77,6 +98,7 @@ async def get_news_articles(
     return articles
 
 @router.get("/trending")
+@cache_response(expire=300, key_builder=symbol_key_builder)
 async def get_trending_topics(
     penny_stocks_only: bool = Query(
         False,
@@ -107,7 +129,7 @@ async def get_trending_topics(
 
 @router.get("/filings/{symbol}")
 async def get_sec_filings(
-    symbol: str,
+    symbol: SymbolDep,
     current_user: dict = Depends(get_current_user)
 ) -> List[Dict]:
     """
@@ -121,7 +143,10 @@ async def get_sec_filings(
     - filing date
     - link to filing
     """
-    filings = await news_service._get_sec_filings(symbol.upper())
+    filings = await singleflight.do(
+        f"filings:{symbol}",
+        lambda: news_service._get_sec_filings(symbol)
+    )
     
     if not filings:
         raise HTTPException(
@@ -133,7 +158,7 @@ async def get_sec_filings(
 
 @router.get("/social/{symbol}")
 async def get_social_mentions(
-    symbol: str,
+    symbol: SymbolDep,
     current_user: dict = Depends(get_current_user)
 ) -> List[Dict]:
     """
@@ -148,7 +173,10 @@ async def get_social_mentions(
     - sentiment
     - social metrics (score, comments, etc.)
     """
-    mentions = await news_service._get_social_media_mentions(symbol.upper())
+    mentions = await singleflight.do(
+        f"social:{symbol}",
+        lambda: news_service._get_social_media_mentions(symbol)
+    )
     
     if not mentions:
         raise HTTPException(
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 
@@ -12,14 +14,18 @@ from app.models.notification import (
 )
 from app.services.notification import notification_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Validates and serializes whole notification lists in one pydantic-core call
+_NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
 
 @router.get("/notifications", response_model=List[NotificationResponse])
 async def get_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     status: Optional[NotificationStatus] = None,
-    db: Session = Depends(get_db),
+    symbol: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get notifications for the current user."""
@@ -28,15 +34,23 @@ async def get_notifications(
         user_id=current_user["id"],
         skip=skip,
         limit=limit,
-        status=status
+        status=status,
+        data_filter={"symbol": symbol} if symbol else None
     )
     
-    return [n.to_response() for n in notifications]
+    responses = _NOTIFICATION_LIST_ADAPTER.validate_python(
+        notifications,
+        from_attributes=True
+    )
+    return Response(
+        _NOTIFICATION_LIST_ADAPTER.dump_json(responses),
+        media_type="application/json"
+    )
 
 @router.post("/notifications/{notification_id}/read")
 async def mark_as_read(
     notification_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Mark a notification as read."""
@@ -75,37 +89,25 @@ async def update_notification_preferences(
 
 @router.get("/notifications/unread/count")
 async def get_unread_count(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get count of unread notifications."""
-    notifications = await notification_service.get_notifications(
+    unread_count = await notification_service.get_unread_count(
         db=db,
-        user_id=current_user["id"],
-        limit=1000
+        user_id=current_user["id"]
     )
-    
-    unread_count = sum(1 for n in notifications if not n.read)
     return {"unread_count": unread_count}
 
 @router.post("/notifications/mark-all-read")
 async def mark_all_as_read(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Mark all notifications as read."""
-    notifications = await notification_service.get_notifications(
+    await notification_service.mark_all_as_read_bulk(
         db=db,
-        user_id=current_user["id"],
-        limit=1000
+        user_id=current_user["id"]
     )
     
-    for notification in notifications:
-        if not notification.read:
-            await notification_service.mark_as_read(
-                db=db,
-                notification_id=notification.id,
-                user_id=current_user["id"]
-            )
-    
     return {"message": "All notifications marked as read"}
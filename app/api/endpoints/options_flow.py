@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 from datetime import datetime
 from typing import Dict, List
 
@@ -9,97 +11,87 @@ from app.models.technical import (
     OptionsFlowAnalysis
 )
 from app.services.options_flow import options_flow_service
-from app.core.dependencies import get_current_user
+from app.api.dependencies.auth import CurrentUser
+from app.api.dependencies.symbols import SymbolDep
+from app.api.dependencies.negotiation import fast_json_response
 
-router = APIRouter(prefix="/options-flow", tags=["Options Flow Analysis"])
+router = APIRouter(
+    prefix="/options-flow",
+    tags=["Options Flow Analysis"],
+    default_response_class=ORJSONResponse
+)
+
+# Serialize whole model lists to JSON bytes in one pydantic-core call
+_EXPIRY_LIST_ADAPTER = TypeAdapter(List[ExpiryAnalysis])
+_OPTION_FLOW_LIST_ADAPTER = TypeAdapter(List[OptionFlow])
 
 @router.get("/{symbol}/analysis", response_model=OptionsFlowAnalysis)
 async def get_options_flow_analysis(
-    symbol: str,
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    symbol: SymbolDep,
+    current_user: CurrentUser,
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get complete options flow analysis for a symbol."""
-    try:
-        analysis = await options_flow_service.get_options_flow_analysis(
-            symbol=symbol,
-            lookback_minutes=lookback_minutes
-        )
-        
-        return analysis
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting options flow analysis: {str(e)}"
-        )
+    analysis = await options_flow_service.get_options_flow_analysis(
+        symbol=symbol,
+        lookback_minutes=lookback_minutes
+    )
+    
+    return fast_json_response(analysis)
 
 @router.get("/{symbol}/real-time", response_model=OptionsFlowAnalysis)
 async def get_real_time_flow(
-    symbol: str,
-    window_minutes: int = Query(default=5, ge=1, le=60),
-    current_user=Depends(get_current_user)
+    symbol: SymbolDep,
+    current_user: CurrentUser,
+    window_minutes: int = Query(default=5, ge=1, le=60)
 ):
     """Get real-time options flow analysis."""
-    try:
-        analysis = await options_flow_service.get_real_time_flow(
-            symbol=symbol,
-            window_minutes=window_minutes
-        )
-        
-        return analysis
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting real-time options flow: {str(e)}"
-        )
+    analysis = await options_flow_service.get_real_time_flow(
+        symbol=symbol,
+        window_minutes=window_minutes
+    )
+    
+    return fast_json_response(analysis)
 
 @router.get("/{symbol}/expiries", response_model=List[ExpiryAnalysis])
 async def get_expiry_analysis(
-    symbol: str,
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    symbol: SymbolDep,
+    current_user: CurrentUser,
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get options analysis by expiry date."""
-    try:
-        analysis = await options_flow_service.get_options_flow_analysis(
-            symbol=symbol,
-            lookback_minutes=lookback_minutes
-        )
-        
-        return sorted(
-            analysis.expiries,
-            key=lambda x: x.expiry
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting expiry analysis: {str(e)}"
-        )
+    analysis = await options_flow_service.get_options_flow_analysis(
+        symbol=symbol,
+        lookback_minutes=lookback_minutes
+    )
+    
+    expiries = sorted(
+        analysis.expiries,
+        key=lambda x: x.expiry
+    )
+    return Response(
+        _EXPIRY_LIST_ADAPTER.dump_json(expiries),
+        media_type="application/json"
+    )
 
 @router.get("/{symbol}/unusual", response_model=List[OptionFlow])
 async def get_unusual_activity(
-    symbol: str,
-    lookback_minutes: int = Query(default=60, ge=1, le=1440),
-    current_user=Depends(get_current_user)
+    symbol: SymbolDep,
+    current_user: CurrentUser,
+    lookback_minutes: int = Query(default=60, ge=1, le=1440)
 ):
     """Get unusual options activity."""
-    try:
-        analysis = await options_flow_service.get_options_flow_analysis(
-            symbol=symbol,
-            lookback_minutes=lookback_minutes
-        )
-        
-        return sorted(
-            analysis.unusual_activity,
-            key=lambda x: x.premium,
-            reverse=True
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting unusual activity: {str(e)}"
-        )
+    analysis = await options_flow_service.get_options_flow_analysis(
+        symbol=symbol,
+        lookback_minutes=lookback_minutes
+    )
+    
+    unusual_activity = sorted(
+        analysis.unusual_activity,
+        key=lambda x: x.premium,
+        reverse=True
+    )
+    return Response(
+        _OPTION_FLOW_LIST_ADAPTER.dump_json(unusual_activity),
+        media_type="application/json"
+    )
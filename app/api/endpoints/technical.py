@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Optional
 from datetime import datetime
+import asyncio
+import logging
 
 from app.api.dependencies.auth import get_current_user
 from app.models.technical import (
@@ -14,7 +17,11 @@ from app.models.technical import (
 )
 from app.services.technical_analysis import technical_analysis_service
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Upper bound on the time spent analysing any one symbol in a batch
+BATCH_SYMBOL_TIMEOUT = 10  # seconds
 
 @router.get("/technical/{symbol}/indicators", response_model=Dict)
 async def get_technical_indicators(
@@ -37,6 +44,19 @@ async def get_technical_indicators(
     
     return indicators
 
+@router.get("/technical/indicators", response_model=Dict[str, Dict])
+async def get_indicators_batch(
+    symbols: List[str] = Query(..., max_length=100),
+    timeframe: TimeFrame = TimeFrame.DAILY,
+    lookback_periods: int = Query(100, ge=1, le=1000)
+):
+    """Get core technical indicators for multiple symbols."""
+    return await technical_analysis_service.get_indicators_batch(
+        symbols=symbols,
+        timeframe=timeframe,
+        lookback_periods=lookback_periods
+    )
+
 @router.get("/technical/{symbol}/patterns", response_model=List[Dict])
 async def get_patterns(
     symbol: str,
@@ -74,27 +94,30 @@ async def get_batch_analysis(
     symbols: List[str] = Query(..., max_length=20),
     timeframe: TimeFrame = TimeFrame.DAILY
 ):
-    """Get technical analysis for multiple symbols."""
+    """
+    Get technical analysis for multiple symbols.
+    
+    Symbols are analysed concurrently; a symbol that fails or exceeds
+    BATCH_SYMBOL_TIMEOUT gets an error entry instead of failing the batch.
+    """
+    analyses = await asyncio.gather(
+        *[
+            asyncio.wait_for(
+                technical_analysis_service.get_full_analysis(symbol, timeframe),
+                timeout=BATCH_SYMBOL_TIMEOUT
+            )
+            for symbol in symbols
+        ],
+        return_exceptions=True
+    )
+    
     results = {}
-    for symbol in symbols:
-        indicators = await technical_analysis_service.get_technical_indicators(
-            symbol=symbol,
-            timeframe=timeframe
-        )
-        signals = await technical_analysis_service.get_signals(
-            symbol=symbol,
-            timeframe=timeframe
-        )
-        patterns = await technical_analysis_service.get_patterns(
-            symbol=symbol,
-            timeframe=timeframe
-        )
-        
-        results[symbol] = {
-            "indicators": indicators,
-            "signals": signals,
-            "patterns": patterns
-        }
+    for symbol, analysis in zip(symbols, analyses):
+        if isinstance(analysis, Exception):
+            logger.error(f"Batch analysis error for {symbol}: {analysis!r}")
+            results[symbol] = {"error": f"Analysis failed for {symbol}"}
+        else:
+            results[symbol] = analysis
     
     return results
 
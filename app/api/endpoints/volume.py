@@ -1,28 +1,59 @@
-from fastapi import APIRouter, HTTPException, Query
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
+from datetime import timedelta
 from typing import Dict, List
 
 from app.models.technical import TimeFrame, VolumeProfile
 from app.services.volume_analysis import volume_analysis_service
-from app.core.dependencies import get_current_user
+from app.api.dependencies.auth import CurrentUser
+from app.api.dependencies.symbols import SymbolDep
+from app.api.dependencies.negotiation import MediaType, negotiated_response
+from app.utils.clock import coarse_utcnow_minute
+from app.core.cache import cache_response, symbol_key_builder
+from app.core.singleflight import singleflight
 
-router = APIRouter(prefix="/volume", tags=["Volume Analysis"])
+router = APIRouter(
+    prefix="/volume",
+    tags=["Volume Analysis"],
+    default_response_class=ORJSONResponse
+)
 
 @router.get("/{symbol}/profile", response_model=VolumeProfile)
 async def get_volume_profile(
-    symbol: str,
+    symbol: SymbolDep,
+    current_user: CurrentUser,
+    media_type: MediaType,
     timeframe: TimeFrame = TimeFrame.DAILY,
     lookback_days: int = Query(default=30, ge=1, le=365),
     num_bins: int = Query(default=50, ge=10, le=200),
-    value_area_pct: float = Query(default=0.68, ge=0.1, le=1.0),
-    current_user=Depends(get_current_user)
+    value_area_pct: float = Query(default=0.68, ge=0.1, le=1.0)
 ):
-    """Get volume profile for a symbol."""
-    try:
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=lookback_days)
-        
-        profile = await volume_analysis_service.get_volume_profile(
+    """Get volume profile for a symbol, as JSON or MessagePack."""
+    profile = await _get_volume_profile(
+        symbol=symbol,
+        timeframe=timeframe,
+        lookback_days=lookback_days,
+        num_bins=num_bins,
+        value_area_pct=value_area_pct
+    )
+    
+    return negotiated_response(profile, media_type)
+
+@cache_response(expire=300, key_builder=symbol_key_builder)
+async def _get_volume_profile(
+    symbol: str,
+    timeframe: TimeFrame,
+    lookback_days: int,
+    num_bins: int,
+    value_area_pct: float
+):
+    """Build the volume profile; cached apart from the response encoding."""
+    end_date = coarse_utcnow_minute()
+    start_date = end_date - timedelta(days=lookback_days)
+    
+    return await singleflight.do(
+        ("volume_profile", symbol, timeframe, lookback_days, num_bins, value_area_pct),
+        lambda: volume_analysis_service.get_volume_profile(
             symbol=symbol,
             timeframe=timeframe,
             start_date=start_date,
@@ -30,34 +61,20 @@ async def get_volume_profile(
             num_bins=num_bins,
             value_area_pct=value_area_pct
         )
-        
-        return profile
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting volume profile: {str(e)}"
-        )
+    )
 
 @router.get("/{symbol}/analysis", response_model=Dict)
 async def get_volume_analysis(
-    symbol: str,
+    symbol: SymbolDep,
+    current_user: CurrentUser,
     timeframe: TimeFrame = TimeFrame.DAILY,
-    lookback_periods: int = Query(default=100, ge=1, le=1000),
-    current_user=Depends(get_current_user)
+    lookback_periods: int = Query(default=100, ge=1, le=1000)
 ):
     """Get comprehensive volume analysis for a symbol."""
-    try:
-        analysis = await volume_analysis_service.get_volume_analysis(
-            symbol=symbol,
-            timeframe=timeframe,
-            lookback_periods=lookback_periods
-        )
-        
-        return analysis
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting volume analysis: {str(e)}"
-        )
+    analysis = await volume_analysis_service.get_volume_analysis(
+        symbol=symbol,
+        timeframe=timeframe,
+        lookback_periods=lookback_periods
+    )
+    
+    return analysis
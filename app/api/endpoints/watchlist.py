@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 
 from app.api.dependencies.auth import get_current_user
 from app.api.dependencies.db import get_db
+from app.core.cache import cache_response, invalidate_cache, user_key_builder
+from app.models._fast import _from_orm_fast
 from app.models.watchlist import (
     Alert, AlertCreate,
     WatchlistItem, WatchlistItemCreate,
@@ -16,10 +18,34 @@ from app.services.market_data import market_data_service
 
 router = APIRouter()
 
+# Reads are cached per user for a short time, under a namespace holding the
+# user ID; a mutation drops only the caller's entries
+WATCHLIST_CACHE_NAMESPACE = "watchlist"
+
+def _watchlist_cache_namespace(kwargs: dict) -> str:
+    """Cache namespace of the current user's watchlist reads."""
+    return f"{WATCHLIST_CACHE_NAMESPACE}:{kwargs['current_user']['id']}"
+
+async def _invalidate_watchlist_cache(user_id) -> None:
+    """Drop the user's cached watchlist reads."""
+    await invalidate_cache(f"{WATCHLIST_CACHE_NAMESPACE}:{user_id}:*")()
+
+def _item_response(item: WatchlistItem, quote: Optional[dict]) -> WatchlistItemResponse:
+    """Combine a watchlist item from the service with its current quote, if any."""
+    quote = quote or {}
+    return _from_orm_fast(
+        WatchlistItemResponse,
+        item,
+        current_price=quote.get("price"),
+        price_change_24h=quote.get("change"),
+        volume_24h=quote.get("volume"),
+        market_cap=quote.get("market_cap")
+    )
+
 @router.post("/watchlists", response_model=WatchlistResponse)
 async def create_watchlist(
     watchlist: WatchlistCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new watchlist."""
@@ -29,44 +55,35 @@ async def create_watchlist(
         watchlist=watchlist
     )
     
-    return WatchlistResponse(
-        **db_watchlist.dict(),
-        items_count=len(db_watchlist.items),
-        alerts_count=len(db_watchlist.alerts)
-    )
+    await _invalidate_watchlist_cache(current_user["id"])
+    
+    return WatchlistResponse.model_validate(db_watchlist)
 
 @router.get("/watchlists", response_model=List[WatchlistResponse])
+@cache_response(expire=30, key_builder=user_key_builder, namespace=_watchlist_cache_namespace)
 async def get_watchlists(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     type: Optional[WatchlistType] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get all watchlists for the current user."""
-    watchlists = await watchlist_service.get_watchlists(
+    watchlists = await watchlist_service.get_watchlist_summaries(
         db=db,
         user_id=current_user["id"],
         skip=skip,
-        limit=limit
+        limit=limit,
+        type=type
     )
     
-    if type:
-        watchlists = [w for w in watchlists if w.type == type]
-    
-    return [
-        WatchlistResponse(
-            **w.dict(),
-            items_count=len(w.items),
-            alerts_count=len(w.alerts)
-        )
-        for w in watchlists
-    ]
+    return watchlists
 
 @router.get("/watchlists/{watchlist_id}", response_model=WatchlistDetailResponse)
+@cache_response(expire=30, key_builder=user_key_builder, namespace=_watchlist_cache_namespace)
 async def get_watchlist(
     watchlist_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get a specific watchlist by ID."""
@@ -82,13 +99,13 @@ async def get_watchlist(
             detail="Watchlist not found"
         )
     
-    return watchlist
+    return _from_orm_fast(WatchlistDetailResponse, watchlist)
 
 @router.put("/watchlists/{watchlist_id}", response_model=WatchlistDetailResponse)
 async def update_watchlist(
     watchlist_id: UUID,
     updates: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Update a watchlist."""
@@ -105,12 +122,14 @@ async def update_watchlist(
             detail="Watchlist not found"
         )
     
-    return watchlist
+    await _invalidate_watchlist_cache(current_user["id"])
+    
+    return _from_orm_fast(WatchlistDetailResponse, watchlist)
 
 @router.delete("/watchlists/{watchlist_id}")
 async def delete_watchlist(
     watchlist_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Delete a watchlist."""
@@ -126,13 +145,15 @@ async def delete_watchlist(
             detail="Watchlist not found"
         )
     
+    await _invalidate_watchlist_cache(current_user["id"])
+    
     return {"message": "Watchlist deleted successfully"}
 
 @router.post("/watchlists/{watchlist_id}/items", response_model=WatchlistItemResponse)
 async def add_watchlist_item(
     watchlist_id: UUID,
     item: WatchlistItemCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Add an item to a watchlist."""
@@ -149,22 +170,18 @@ async def add_watchlist_item(
             detail="Watchlist not found"
         )
     
+    await _invalidate_watchlist_cache(current_user["id"])
+    
     # Get current market data
-    market_data = await market_data_service.get_quote(db_item.symbol)
+    quotes = await market_data_service.get_quotes([db_item.symbol])
     
-    return WatchlistItemResponse(
-        **db_item.dict(),
-        current_price=market_data.get("price"),
-        price_change_24h=market_data.get("price_change_24h"),
-        volume_24h=market_data.get("volume_24h"),
-        market_cap=market_data.get("market_cap")
-    )
+    return _item_response(db_item, quotes.get(db_item.symbol))
 
 @router.delete("/watchlists/{watchlist_id}/items/{item_id}")
 async def remove_watchlist_item(
     watchlist_id: UUID,
     item_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Remove an item from a watchlist."""
@@ -181,13 +198,15 @@ async def remove_watchlist_item(
             detail="Watchlist item not found"
         )
     
+    await _invalidate_watchlist_cache(current_user["id"])
+    
     return {"message": "Watchlist item removed successfully"}
 
 @router.post("/watchlists/{watchlist_id}/alerts", response_model=Alert)
 async def add_alert(
     watchlist_id: UUID,
     alert: AlertCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Add an alert to a watchlist."""
@@ -204,13 +223,15 @@ async def add_alert(
             detail="Watchlist not found"
         )
     
+    await _invalidate_watchlist_cache(current_user["id"])
+    
     return db_alert
 
 @router.delete("/watchlists/{watchlist_id}/alerts/{alert_id}")
 async def remove_alert(
     watchlist_id: UUID,
     alert_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Remove an alert from a watchlist."""
@@ -227,12 +248,15 @@ async def remove_alert(
             detail="Alert not found"
         )
     
+    await _invalidate_watchlist_cache(current_user["id"])
+    
     return {"message": "Alert removed successfully"}
 
 @router.get("/watchlists/{watchlist_id}/items", response_model=List[WatchlistItemResponse])
+@cache_response(expire=30, key_builder=user_key_builder, namespace=_watchlist_cache_namespace)
 async def get_watchlist_items(
     watchlist_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get all items in a watchlist with current market data."""
@@ -248,25 +272,21 @@ async def get_watchlist_items(
             detail="Watchlist not found"
         )
     
-    items_with_data = []
-    for item in watchlist.items:
-        market_data = await market_data_service.get_quote(item.symbol)
-        items_with_data.append(
-            WatchlistItemResponse(
-                **item.dict(),
-                current_price=market_data.get("price"),
-                price_change_24h=market_data.get("price_change_24h"),
-                volume_24h=market_data.get("volume_24h"),
-                market_cap=market_data.get("market_cap")
-            )
-        )
+    # One batched quote lookup for the whole watchlist
+    quotes = await market_data_service.get_quotes(
+        [item.symbol for item in watchlist.items]
+    )
     
-    return items_with_data
+    return [
+        _item_response(item, quotes.get(item.symbol))
+        for item in watchlist.items
+    ]
 
 @router.get("/watchlists/{watchlist_id}/alerts", response_model=List[Alert])
+@cache_response(expire=30, key_builder=user_key_builder, namespace=_watchlist_cache_namespace)
 async def get_watchlist_alerts(
     watchlist_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Get all alerts for a watchlist."""
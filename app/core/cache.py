@@ -1,53 +1,111 @@
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Union
 import hashlib
 import json
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.redis import redis_client
 import logging
 
 logger = logging.getLogger(__name__)
 
-def cache_response(expire: int = 300):
+# Endpoint arguments injected by dependencies rather than supplied by the caller
+DEPENDENCY_KWARGS = frozenset({"current_user", "db"})
+
+def default_key_builder(func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build a cache key from the function name and all of its arguments.
+    
+    Sessions and requests are skipped (their reprs differ on every call) and
+    current_user contributes only its ID.
+    """
+    parts = (
+        str(arg) for arg in args
+        if not isinstance(arg, (AsyncSession, Request))
+    )
+    params = (
+        f"{k}:{v}" for k, v in sorted(kwargs.items())
+        if k not in DEPENDENCY_KWARGS and not isinstance(v, (AsyncSession, Request))
+    )
+    user = kwargs.get("current_user")
+    user_part = f"user:{user.get('id')}" if isinstance(user, dict) else ""
+    return ":".join((func.__name__, *parts, *params, user_part))
+
+def symbol_key_builder(func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build a cache key from the endpoint and its request parameters only.
+    
+    Dependency values such as current_user are left out so every caller of a
+    shared, non user-specific endpoint hits the same entry.
+    """
+    params = ":".join(
+        f"{k}:{v}" for k, v in sorted(kwargs.items())
+        if k not in DEPENDENCY_KWARGS
+    )
+    return f"{func.__module__}:{func.__name__}:{params}"
+
+def user_key_builder(func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build a cache key like symbol_key_builder, scoped to the current user.
+    
+    For endpoints whose response depends on who is asking (e.g. ownership
+    checks), so one user's cached response is never served to another.
+    """
+    user = kwargs.get("current_user") or {}
+    return f"{symbol_key_builder(func, args, kwargs)}:user:{user.get('id')}"
+
+def filter_key_builder(func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build a cache key like symbol_key_builder, treating collection parameters
+    as unordered filters so ?tickers=A&tickers=B and ?tickers=B&tickers=A
+    share an entry.
+    """
+    normalized = {
+        k: tuple(sorted(map(str, v))) if isinstance(v, (list, set, frozenset, tuple)) else v
+        for k, v in kwargs.items()
+    }
+    return symbol_key_builder(func, args, normalized)
+
+def cache_response(
+    expire: int = 300,
+    key_builder: Callable[[Callable, tuple, dict], str] = default_key_builder,
+    namespace: Union[str, Callable[[dict], str]] = ""
+):
     """
     Cache decorator for API responses.
     
     Args:
         expire: Cache expiration time in seconds (default: 5 minutes)
+        key_builder: Builds the raw cache key from (func, args, kwargs)
+        namespace: Readable prefix kept in front of the hashed key, so the
+            entries can be dropped with invalidate_cache(f"{namespace}:*").
+            A callable builds it from the call's kwargs, e.g. to put the
+            user ID in it.
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # Generate cache key from function name and arguments
-            key_parts = [func.__name__]
-            
-            # Add args to key
-            for arg in args:
-                if hasattr(arg, '__dict__'):
-                    # For objects like Request, only use relevant attributes
-                    key_parts.append(str(getattr(arg, 'url', arg)))
-                else:
-                    key_parts.append(str(arg))
-            
-            # Add kwargs to key
-            for k, v in sorted(kwargs.items()):
-                key_parts.append(f"{k}:{v}")
-            
             # Create deterministic cache key
-            key_str = ":".join(key_parts)
-            cache_key = hashlib.sha256(key_str.encode()).hexdigest()
+            key_str = key_builder(func, args, kwargs)
+            # Non-cryptographic use: BLAKE2b is faster than SHA-256 here
+            cache_key = hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
+            prefix = namespace(kwargs) if callable(namespace) else namespace
+            if prefix:
+                cache_key = f"{prefix}:{cache_key}"
             
             # Try to get from cache
             cached_value = await redis_client.cache_get(cache_key)
             if cached_value is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
+                logger.debug("Cache hit for key: %s", cache_key)
                 return cached_value
             
             # If not in cache, execute function
-            logger.debug(f"Cache miss for key: {cache_key}")
+            logger.debug("Cache miss for key: %s", cache_key)
             result = await func(*args, **kwargs)
             
-            # Cache the result
-            await redis_client.cache_set(cache_key, result, expire)
+            # Cache the result (models are stored in their JSON form)
+            await redis_client.cache_set(cache_key, jsonable_encoder(result), expire)
             
             return result
         return wrapper
@@ -61,12 +119,8 @@ def invalidate_cache(pattern: str) -> None:
         pattern: Redis key pattern to match (e.g., "market:*")
     """
     async def _invalidate():
-        try:
-            keys = await redis_client._redis.keys(f"cache:{pattern}")
-            if keys:
-                await redis_client._redis.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache entries matching pattern: {pattern}")
-        except Exception as e:
-            logger.error(f"Cache invalidation error: {str(e)}")
+        deleted = await redis_client.delete_pattern(f"cache:{pattern}")
+        if deleted:
+            logger.info(f"Invalidated {deleted} cache entries matching pattern: {pattern}")
     
     return _invalidate
@@ -20,9 +20,18 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_KEY: str
     DATABASE_URL: str
+    DATABASE_POOL_MIN_SIZE: int = 2
+    DATABASE_POOL_MAX_SIZE: int = 10
+    DATABASE_SESSION_POOL_SIZE: int = 20
+    DATABASE_SESSION_MAX_OVERFLOW: int = 10
+    SUPABASE_MAX_CONNECTIONS: int = 40
+    SUPABASE_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    SUPABASE_KEEPALIVE_EXPIRY: float = 30.0
+    SUPABASE_TIMEOUT: float = 10.0
     
     # Redis
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 64
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str]
@@ -35,6 +44,10 @@ class Settings(BaseSettings):
     
     # Rate Limiting
     RATE_LIMIT_PER_SECOND: int = 10
+
+    # Response Compression
+    COMPRESSION_QUALITY: int = 4
+    COMPRESSION_MINIMUM_SIZE: int = 1024
     
     # SMTP Settings
     SMTP_HOST: str
@@ -0,0 +1,2 @@
+class UpstreamDataError(Exception):
+    """Market data could not be fetched or analysed from an upstream provider."""
@@ -1,47 +1,94 @@
-from fastapi import Request, HTTPException
+from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
-from typing import Callable
+from typing import Callable, Optional
 import logging
 from app.core.redis import redis_client
 from app.core.config import get_settings
+from app.core.security import verify_token
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
-        response = await call_next(request)
-        
-        process_time = (time.time() - start_time) * 1000
-        formatted_process_time = '{0:.2f}'.format(process_time)
-        
-        logger.info(
-            f"path={request.url.path} "
-            f"method={request.method} "
-            f"status_code={response.status_code} "
-            f"duration={formatted_process_time}ms"
-        )
-        
-        return response
+# Probe endpoints are polled constantly and not worth a log line each
+LOGGING_SKIP_PATHS = frozenset({"/health", "/metrics"})
+
+class LoggingMiddleware:
+    """
+    Log method, path, status and duration of each request.
+    
+    Plain ASGI rather than BaseHTTPMiddleware, which costs an extra task and
+    stream hop per request.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in LOGGING_SKIP_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Formatting is deferred to the handler and skipped when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                process_time = (time.perf_counter_ns() - start_time) / 1e6
+                logger.info(
+                    "path=%s method=%s status_code=%s duration=%.2fms",
+                    scope["path"],
+                    scope["method"],
+                    status_code,
+                    process_time
+                )
+
+# Health checks and API docs are never rate limited
+RATE_LIMIT_EXEMPT_PATHS = frozenset({"/health", "/metrics", "/docs", "/redoc", "/openapi.json"})
+
+RATE_LIMIT_WINDOW_SECONDS = 1
+
+def _user_client_id(authorization: Optional[str]) -> Optional[str]:
+    """
+    Rate-limit identity for a bearer token: the user ID from its subject.
+    
+    Token verification is memoized in app.core.security, so repeat
+    requests with the same token skip the signature check.
+    """
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    user_id = verify_token(token)
+    return f"user:{user_id}" if user_id else None
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip rate limiting for certain paths
-        if request.url.path in ["/health", "/metrics"]:
+        # Skip rate limiting for CORS preflights and certain paths
+        if request.method == "OPTIONS" or request.url.path in RATE_LIMIT_EXEMPT_PATHS:
             return await call_next(request)
 
-        # Get client identifier (IP or user ID if authenticated)
-        client_id = "test_client"
-        if request.client and request.client.host:
-            client_id = request.client.host
-        elif "authorization" in request.headers:
-            # TODO: Extract user ID from JWT token
-            client_id = request.headers["authorization"]
-            pass
+        # Get client identifier (user ID if authenticated, else IP)
+        client_id = _user_client_id(request.headers.get("authorization"))
+        if client_id is None:
+            client_id = "test_client"
+            if request.client and request.client.host:
+                client_id = request.client.host
 
         # Create rate limit key
         rate_key = f"rate_limit:{client_id}:{request.url.path}"
@@ -50,13 +97,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         is_allowed, current_count = await redis_client.check_rate_limit(
             rate_key,
             settings.RATE_LIMIT_PER_SECOND,
-            1  # 1 second window
+            RATE_LIMIT_WINDOW_SECONDS
         )
         
+        # Returned, not raised: exceptions from dispatch never reach the
+        # app's exception handlers
         if not is_allowed:
-            raise HTTPException(
+            return JSONResponse(
+                {"detail": "Too many requests"},
                 status_code=429,
-                detail="Too many requests"
+                headers={"Retry-After": str(RATE_LIMIT_WINDOW_SECONDS)}
             )
         
         # Add rate limit headers
@@ -68,13 +118,27 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return response
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
+# Raw ASGI header pairs, built once
+SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+
+class SecurityHeadersMiddleware:
+    """Add security headers to every HTTP response, preflights included."""
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,16 +1,46 @@
 import redis.asyncio as redis
+import asyncio
 from typing import Optional, Any
-import json
 import logging
+import orjson
+import secrets
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Values are stored as JSON. orjson writes bytes, which redis-py sends as-is.
+# Non-string keys are stringified as json did; numpy values and datetimes
+# (naive ones as UTC) serialize directly.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=ORJSON_OPTIONS)
+
+# Sliding-window-log rate limit in one round trip. Each admitted request is
+# a sorted-set member scored by Redis server time in ms; members older than
+# the window are trimmed first. Returns the count including this request,
+# which is only recorded when it is within the limit.
+RATE_LIMIT_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+end
+return count + 1
+"""
+
 class RedisClient:
     """Redis client wrapper."""
     def __init__(self):
         self._redis = None
+        self._pool = None
+        self._connect_lock = asyncio.Lock()
+        self._rate_limit_script = None
     
     async def init(self):
         await self._connect()
@@ -19,31 +49,47 @@ class RedisClient:
         if self._redis:
             await self._redis.close()
             self._redis = None
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
+        self._rate_limit_script = None
 
     async def _connect(self):
-        """Connect to Redis."""
-        try:
-            if not self._redis:
-                self._redis = redis.from_url(
+        """
+        Connect to Redis on first use.
+        
+        Nothing connects at import time. Concurrent first callers share one
+        connection pool, created under a lock.
+        """
+        if self._redis:
+            return
+        async with self._connect_lock:
+            if self._redis:
+                return
+            try:
+                self._pool = redis.ConnectionPool.from_url(
                     settings.REDIS_URL,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                    socket_keepalive=True,
                     encoding="utf-8",
                     decode_responses=True
                 )
-        except Exception as e:
-            logger.error(f"Redis connection error: {str(e)}")
-            # Create a mock Redis client for testing
-            if settings.ENVIRONMENT == "test":
-                self._redis = MockRedis()
-            else:
-                raise
+                self._redis = redis.Redis(connection_pool=self._pool)
+            except Exception as e:
+                logger.error(f"Redis connection error: {str(e)}")
+                # Create a mock Redis client for testing
+                if settings.ENVIRONMENT == "test":
+                    self._redis = MockRedis()
+                else:
+                    raise
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from Redis."""
         try:
             if not self._redis:
-                self._connect()
+                await self._connect()
             value = await self._redis.get(key)
-            return json.loads(value) if value else None
+            return orjson.loads(value) if value else None
         except Exception as e:
             logger.error(f"Redis get error: {str(e)}")
             return None
@@ -57,11 +103,11 @@ class RedisClient:
         """Set value in Redis with expiration."""
         try:
             if not self._redis:
-                self._connect()
+                await self._connect()
             await self._redis.setex(
                 key,
                 expire,
-                json.dumps(value)
+                _dumps(value)
             )
             return True
         except Exception as e:
@@ -72,7 +118,7 @@ class RedisClient:
         """Delete key from Redis."""
         try:
             if not self._redis:
-                self._connect()
+                await self._connect()
             await self._redis.delete(key)
             return True
         except Exception as e:
@@ -83,7 +129,7 @@ class RedisClient:
         """Increment counter in Redis."""
         try:
             if not self._redis:
-                self._connect()
+                await self._connect()
             async with self._redis.pipeline() as pipe:
                 await pipe.incr(key)
                 await pipe.expire(key, 3600)  # 1 hour expiry
@@ -94,15 +140,39 @@ class RedisClient:
             return None
 
     async def get_keys(self, pattern: str) -> list:
-        """Get keys matching pattern."""
+        """Get keys matching pattern, using incremental SCAN rather than KEYS."""
         try:
             if not self._redis:
-                self._connect()
-            return await self._redis.keys(pattern)
+                await self._connect()
+            return [key async for key in self._redis.scan_iter(match=pattern, count=500)]
         except Exception as e:
             logger.error(f"Redis get_keys error: {str(e)}")
             return []
 
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Delete keys matching pattern; returns the number of keys deleted.
+        
+        Keys are found with SCAN and removed with UNLINK in batches, so
+        neither the lookup nor freeing the values blocks Redis.
+        """
+        try:
+            if not self._redis:
+                await self._connect()
+            deleted = 0
+            batch = []
+            async for key in self._redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self._redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self._redis.unlink(*batch)
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis delete_pattern error: {str(e)}")
+            return 0
+
     async def get_json(self, key: str) -> Optional[Any]:
         """Get JSON value from Redis."""
         return await self.get(key)
@@ -123,9 +193,15 @@ class RedisClient:
         Returns (is_allowed, current_count).
         """
         try:
-            current = await self.increment(key)
-            if current == 1:  # First request in window
-                await self._redis.expire(key, window)
+            if not self._redis:
+                await self._connect()
+            if self._rate_limit_script is None:
+                self._rate_limit_script = self._redis.register_script(RATE_LIMIT_SCRIPT)
+            
+            current = await self._rate_limit_script(
+                keys=[key],
+                args=[window * 1000, limit, secrets.token_hex(8)]
+            )
             
             is_allowed = current <= limit
             return is_allowed, current
@@ -161,6 +237,66 @@ class RedisClient:
         """Get cached market data for a symbol."""
         return await self.cache_get(f"market:{symbol}")
 
+    async def get_market_data_many(self, symbols: list) -> list:
+        """Get cached market data for several symbols with a single MGET."""
+        try:
+            if not self._redis:
+                await self._connect()
+            if not symbols:
+                return []
+            values = await self._redis.mget([f"cache:market:{symbol}" for symbol in symbols])
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Redis get_market_data_many error: {str(e)}")
+            return [None] * len(symbols)
+
+    async def cache_market_data_many(
+        self,
+        data: dict,
+        expire: int = 60
+    ) -> bool:
+        """Cache market data for several symbols in one round trip."""
+        try:
+            if not self._redis:
+                await self._connect()
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for symbol, value in data.items():
+                    pipe.setex(f"cache:market:{symbol}", expire, _dumps(value))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis cache_market_data_many error: {str(e)}")
+            return False
+
+    # User Cache Methods
+    async def cache_user(
+        self,
+        user_id: str,
+        user: dict,
+        expire: int = 60
+    ) -> bool:
+        """Cache a user row for auth lookups (default 1 minute)."""
+        return await self.cache_set(f"user:{user_id}", user, expire)
+
+    async def get_cached_user(self, user_id: str) -> Optional[dict]:
+        """Get cached user row."""
+        return await self.cache_get(f"user:{user_id}")
+
+    async def invalidate_user(self, user_id: str) -> bool:
+        """Drop a cached user row after it changes."""
+        return await self.delete(f"cache:user:{user_id}")
+
+    # Pub/Sub Methods
+    async def publish(self, channel: str, message: Any) -> int:
+        """Publish a JSON message; returns the number of receiving subscribers."""
+        try:
+            if not self._redis:
+                await self._connect()
+            return await self._redis.publish(channel, _dumps(message))
+        except Exception as e:
+            logger.error(f"Redis publish error: {str(e)}")
+            return 0
+
     # News Cache Methods
     async def cache_news(
         self,
@@ -209,8 +345,31 @@ class MockRedis:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
 
+    async def publish(self, channel: str, message: str) -> int:
+        return 0
+
+    def register_script(self, script: str):
+        async def rate_limit(keys: list, args: list) -> int:
+            return await self.incr(keys[0])
+        return rate_limit
+
+    async def mget(self, keys: list) -> list:
+        return [self.data.get(key) for key in keys]
+
     async def keys(self, pattern: str) -> list:
         import fnmatch
         return [k for k in self.data.keys() if fnmatch.fnmatch(k, pattern)]
 
+    async def scan_iter(self, match: str = "*", count: int = None):
+        for key in await self.keys(match):
+            yield key
+
+    async def unlink(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
 redis_client = RedisClient()
+
+async def get_redis() -> redis.Redis:
+    """Get the shared Redis connection, connecting on first use."""
+    await redis_client._connect()
+    return redis_client._redis
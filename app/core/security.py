@@ -1,9 +1,12 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional, Union
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from app.core.config import get_settings
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -11,6 +14,10 @@ settings = get_settings()
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# JWT signing key, encoded once rather than on every encode/decode
+JWT_ALGORITHM = "HS256"
+_SIGNING_KEY = settings.JWT_SECRET_KEY.encode()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -19,40 +26,73 @@ def get_password_hash(password: str) -> str:
     """Generate password hash."""
     return pwd_context.hash(password)
 
+# bcrypt is deliberately slow; request handlers use these variants so it
+# runs in a worker thread instead of blocking the event loop.
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash in a worker thread."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash in a worker thread."""
+    return await asyncio.to_thread(get_password_hash, password)
+
 def create_access_token(
     subject: Union[str, int],
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create JWT access token."""
+    # exp as integer epoch seconds, without building datetimes per token
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
     to_encode = {"exp": expire, "sub": str(subject)}
     
     try:
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm="HS256"
+            _SIGNING_KEY,
+            algorithm=JWT_ALGORITHM
         )
         return encoded_jwt
     except Exception as e:
         logger.error(f"Token creation error: {str(e)}")
         raise
 
-def verify_token(token: str) -> Optional[str]:
-    """Verify JWT token and return subject (user ID)."""
+@lru_cache(maxsize=4096)
+def _decode_verified(token: str) -> dict:
+    """
+    Verify JWT signature and claims; results are memoized per token.
+    
+    Failures raise, and lru_cache does not keep exceptions, so invalid
+    tokens never take cache slots from valid ones.
+    """
+    return jwt.decode(
+        token,
+        _SIGNING_KEY,
+        algorithms=[JWT_ALGORITHM]
+    )
+
+def decode_token(token: str) -> Optional[dict]:
+    """Verify JWT token and return its payload."""
+    # Checked on every request (rate limiting included); a bad token is
+    # the client's problem, not a server error
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=["HS256"]
-        )
-        return payload.get("sub")
-    except JWTError as e:
-        logger.error(f"Token verification error: {str(e)}")
+        payload = _decode_verified(token)
+    except jwt.InvalidTokenError as e:
+        logger.debug(f"Token verification error: {str(e)}")
+        return None
+    
+    # A memoized payload may have expired since it was first verified
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        logger.debug("Token verification error: Signature has expired.")
         return None
+    
+    return payload
+
+def verify_token(token: str) -> Optional[str]:
+    """Verify JWT token and return subject (user ID)."""
+    payload = decode_token(token)
+    return payload.get("sub") if payload else None
@@ -0,0 +1,2 @@
+# Declarative base shared by all ORM models; models import it from here
+from app.db.base_class import Base  # noqa: F401
@@ -0,0 +1,95 @@
+"""
+Bulk writes over the asyncpg pool.
+
+copy_order_flow_trades and copy_dark_pool_trades have no caller yet: no
+trade tables exist. They are meant for those tables once they do.
+"""
+import asyncpg
+import numpy as np
+from datetime import datetime, timezone
+from typing import List, Sequence, Tuple
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from app.db.pg import get_pool
+from app.models.technical import (
+    FLAG_AGGRESSIVE,
+    FLAG_BLOCK,
+    SIDE_SELL,
+    DarkPoolTrade,
+    OrderFlowTradeBatch,
+    to_naive_utc_datetimes
+)
+
+# Batches up to this size are INSERTed; COPY's extra round trips only pay
+# off for larger ones
+COPY_THRESHOLD = 100
+
+# Renders Core statements with asyncpg's $n placeholders
+_asyncpg_dialect = asyncpg_dialect()
+
+ORDER_FLOW_TRADE_COLUMNS = ("timestamp", "price", "volume", "side", "is_aggressive", "is_block_trade")
+DARK_POOL_TRADE_COLUMNS = ("timestamp", "symbol", "price", "volume", "venue", "trade_id", "is_block")
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    """Timestamps are stored as naive UTC, like every DateTime column here."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+async def copy_records(table: str, columns: Sequence[str], records: Sequence[tuple]) -> None:
+    """Write records to a table over the asyncpg pool."""
+    if not records:
+        return
+    async with get_pool().acquire() as con:
+        await write_records(con, table, columns, records)
+
+async def write_records(
+    con: asyncpg.Connection,
+    table: str,
+    columns: Sequence[str],
+    records: Sequence[tuple]
+) -> None:
+    """
+    Write records to a table on con, so they can share its transaction.
+    
+    table and columns are interpolated into SQL for small batches, so they
+    must come from code, never from request data.
+    """
+    if not records:
+        return
+    if len(records) > COPY_THRESHOLD:
+        await con.copy_records_to_table(table, records=records, columns=list(columns))
+    else:
+        placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+        await con.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            records
+        )
+
+def compile_query(query) -> Tuple[str, list]:
+    """SQL and positional arguments for running a Core statement on asyncpg."""
+    compiled = query.compile(dialect=_asyncpg_dialect)
+    return str(compiled), [compiled.params[name] for name in compiled.positiontup]
+
+def _trade_batch_records(trades: OrderFlowTradeBatch) -> List[tuple]:
+    """Rows for ORDER_FLOW_TRADE_COLUMNS, converted column by column."""
+    # Naive UTC; asyncpg rejects aware values for timestamp without time zone
+    return list(zip(
+        to_naive_utc_datetimes(trades.timestamps),
+        trades.prices.tolist(),
+        trades.volumes.tolist(),
+        np.where(trades.sides == SIDE_SELL, "sell", "buy").tolist(),
+        ((trades.flags & FLAG_AGGRESSIVE) != 0).tolist(),
+        ((trades.flags & FLAG_BLOCK) != 0).tolist()
+    ))
+
+async def copy_order_flow_trades(table: str, trades: OrderFlowTradeBatch) -> None:
+    """Bulk write an order flow trade batch to table."""
+    await copy_records(table, ORDER_FLOW_TRADE_COLUMNS, _trade_batch_records(trades))
+
+async def copy_dark_pool_trades(table: str, trades: Sequence[DarkPoolTrade]) -> None:
+    """Bulk write dark pool trades to table."""
+    records = [
+        (_naive_utc(t.timestamp), t.symbol, t.price, t.volume, t.venue, t.trade_id, t.is_block)
+        for t in trades
+    ]
+    await copy_records(table, DARK_POOL_TRADE_COLUMNS, records)
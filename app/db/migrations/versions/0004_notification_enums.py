@@ -0,0 +1,60 @@
+"""store notification type, priority and status as native enums
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-01-06 10:00:00.000000
+
+The columns were created as varchar. Native Postgres enums take 4 bytes per
+value and compare as integers, which keeps the (user_id, status, created_at)
+index small. Labels are the member names, which is what SQLAlchemy's Enum
+type has been writing.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# (column, enum type name, labels)
+ENUM_COLUMNS = (
+    ('type', 'notification_type', ('EMAIL', 'WEBHOOK', 'SMS', 'PUSH')),
+    ('priority', 'notification_priority', ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
+    ('status', 'notification_status', ('PENDING', 'DELIVERED', 'FAILED', 'SKIPPED')),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    for column, name, labels in ENUM_COLUMNS:
+        postgresql.ENUM(*labels, name=name).create(bind, checkfirst=True)
+        op.alter_column(
+            'notifications',
+            column,
+            type_=postgresql.ENUM(*labels, name=name, create_type=False),
+            postgresql_using=f'{column}::{name}'
+        )
+
+    # Covers "notifications for a user by status, newest first"
+    op.create_index(
+        'ix_notifications_user_status_created',
+        'notifications',
+        ['user_id', 'status', 'created_at']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_status_created', table_name='notifications')
+
+    bind = op.get_bind()
+    for column, name, labels in ENUM_COLUMNS:
+        op.alter_column(
+            'notifications',
+            column,
+            type_=sa.String(),
+            postgresql_using=f'{column}::text'
+        )
+        postgresql.ENUM(*labels, name=name).drop(bind, checkfirst=True)
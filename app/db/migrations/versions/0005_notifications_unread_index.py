@@ -0,0 +1,30 @@
+"""add partial index for unread notifications
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-01-06 10:30:00.000000
+
+Only unread rows are indexed, so the index tracks the unread backlog rather
+than lifetime notification volume. Queries must keep the literal
+"read = false" predicate for the planner to match it.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_unread "
+            "ON notifications (user_id, created_at DESC) WHERE read = false"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_unread")
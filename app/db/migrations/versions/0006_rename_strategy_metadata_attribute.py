@@ -0,0 +1,24 @@
+"""rename BacktestStrategyDB.metadata attribute to meta (no-op)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-01-06 11:00:00.000000
+
+"metadata" is reserved on SQLAlchemy declarative classes, so the ORM
+attribute is now "meta". The column is still named "metadata"; this
+revision only records the change and leaves the schema untouched.
+"""
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
@@ -0,0 +1,37 @@
+"""add backtest equity points
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-01-07 09:00:00.000000
+
+One row per equity curve point so charts can fetch a time range without
+decoding the whole JSONB curve. Points are written in (result_id, ts) order
+by COPY, which keeps the BRIN index to a few kilobytes per million rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'backtest_equity_points',
+        sa.Column('result_id', UUID(), nullable=False),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('equity', sa.Float(precision=53), nullable=False),
+        sa.ForeignKeyConstraint(['result_id'], ['backtest_results.id'], ondelete='CASCADE')
+    )
+    op.execute(
+        "CREATE INDEX ix_backtest_equity_points_result_ts "
+        "ON backtest_equity_points USING BRIN (result_id, ts)"
+    )
+
+
+def downgrade():
+    op.drop_table('backtest_equity_points')
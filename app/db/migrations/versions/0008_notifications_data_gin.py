@@ -0,0 +1,31 @@
+"""index notification data with GIN
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-01-07 09:30:00.000000
+
+notifications.data is already jsonb (0002); only the index is added, built
+concurrently so writes are not blocked. jsonb_path_ops serves only
+containment (data @> '{...}'), at about half the size of the default
+jsonb_ops.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_data_gin "
+            "ON notifications USING GIN (data jsonb_path_ops)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_data_gin")
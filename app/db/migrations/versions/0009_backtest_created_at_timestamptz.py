@@ -0,0 +1,42 @@
+"""store backtest created_at as timestamptz with a server default
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-01-07 10:00:00.000000
+
+Existing values were written with datetime.utcnow(), so they are read as
+UTC. The type change rewrites both tables under an exclusive lock; run it
+in a quiet window on large installs.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+TABLES = ('backtest_strategies', 'backtest_results')
+
+
+def upgrade():
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'created_at',
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            postgresql_using="created_at AT TIME ZONE 'UTC'"
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'created_at',
+            type_=sa.DateTime(),
+            server_default=None,
+            postgresql_using="created_at AT TIME ZONE 'UTC'"
+        )
@@ -0,0 +1,55 @@
+import asyncpg
+import logging
+import orjson
+import re
+from typing import Optional
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Direct Postgres pool for hot analytics reads that would otherwise go through
+# PostgREST. Created on startup and shared by the whole process.
+pool: Optional[asyncpg.Pool] = None
+
+def _dsn() -> str:
+    """Strip any SQLAlchemy driver suffix (e.g. postgresql+asyncpg://)."""
+    return re.sub(r"^postgres(ql)?\+\w+://", "postgresql://", settings.DATABASE_URL)
+
+async def _init_connection(con: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects with orjson."""
+    for type_name in ("json", "jsonb"):
+        await con.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog"
+        )
+
+async def init_pool() -> asyncpg.Pool:
+    """Create the connection pool."""
+    global pool
+    if pool is None:
+        # statement_cache_size=0: prepared statements cannot be reused behind
+        # Supavisor/PgBouncer in transaction pooling mode
+        pool = await asyncpg.create_pool(
+            _dsn(),
+            min_size=settings.DATABASE_POOL_MIN_SIZE,
+            max_size=settings.DATABASE_POOL_MAX_SIZE,
+            statement_cache_size=0,
+            init=_init_connection
+        )
+    return pool
+
+async def close_pool() -> None:
+    """Close the connection pool."""
+    global pool
+    if pool is not None:
+        await pool.close()
+        pool = None
+
+def get_pool() -> asyncpg.Pool:
+    """Get the connection pool, which must have been initialized on startup."""
+    if pool is None:
+        raise RuntimeError("Postgres pool is not initialized")
+    return pool
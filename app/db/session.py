@@ -0,0 +1,31 @@
+import orjson
+import re
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import get_settings
+
+settings = get_settings()
+
+def _async_url() -> str:
+    """Point DATABASE_URL at the asyncpg driver (e.g. postgresql+asyncpg://)."""
+    return re.sub(r"^postgres(ql)?(\+\w+)?://", "postgresql+asyncpg://", settings.DATABASE_URL)
+
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB parameters with orjson (numpy values and naive datetimes as UTC)."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC).decode()
+
+# Async engine for ORM sessions, shared by the whole process. The cache sizes
+# are 0 for the same reason as in app.db.pg: prepared statements cannot be
+# reused behind Supavisor/PgBouncer in transaction pooling mode.
+engine = create_async_engine(
+    _async_url(),
+    pool_size=settings.DATABASE_SESSION_POOL_SIZE,
+    max_overflow=settings.DATABASE_SESSION_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+)
+
+# expire_on_commit=False: committed objects stay readable without an implicit
+# (and, under asyncio, illegal) lazy refresh
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -1,13 +1,55 @@
-from supabase import create_client
+import httpx
+import os
+from typing import Optional
+from supabase import AsyncClient, AsyncClientOptions
 from app.core.config import get_settings
-from functools import lru_cache
 
 settings = get_settings()
 
-@lru_cache()
-def get_supabase_client():
-    """Get Supabase client instance."""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+# Async Supabase client, created lazily in each worker process and shared
+# by its handlers so they share one HTTP pool without blocking the event loop.
+client: Optional[AsyncClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
 
-# Create singleton instance
-supabase_client = get_supabase_client()
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled keep-alive HTTP client shared by Supabase requests."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY
+        ),
+        timeout=settings.SUPABASE_TIMEOUT
+    )
+
+def _forget_client() -> None:
+    """Drop the client inherited across fork(); the child builds its own pool."""
+    global client, _http_client
+    client = None
+    _http_client = None
+
+# A worker forked from a preloaded parent must not share the parent's sockets
+os.register_at_fork(after_in_child=_forget_client)
+
+async def close_client() -> None:
+    """Close the Supabase client's HTTP pool."""
+    global client, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    client = None
+    _http_client = None
+
+def get_supabase_client() -> AsyncClient:
+    """Get the Supabase client for this process, creating it on first use."""
+    global client, _http_client
+    if client is None:
+        _http_client = _build_http_client()
+        client = AsyncClient(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_KEY,
+            options=AsyncClientOptions(
+                postgrest_client_timeout=settings.SUPABASE_TIMEOUT,
+                httpx_client=_http_client
+            )
+        )
+    return client
@@ -1,9 +1,15 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.core.config import get_settings
+from app.core.exceptions import UpstreamDataError
 from app.core.logging import setup_logging
 from app.core.middleware import LoggingMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
 from app.core.redis import redis_client
+from app.db import pg, supabase
+from app.db.session import engine
 from app.api.router import api_router
 from app.services.news import news_service
 import logging
@@ -13,18 +19,52 @@ setup_logging()
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown."""
+    try:
+        # Initialize Redis
+        await redis_client.init()
+        # Initialize Postgres pool
+        await pg.init_pool()
+        # Initialize Supabase client
+        app.state.supabase = supabase.get_supabase_client()
+        # Initialize news service
+        await news_service.initialize()
+        logger.info("Application startup complete")
+    except Exception as e:
+        logger.error(f"Startup error: {str(e)}")
+        raise
+
+    yield
+
+    try:
+        # Close Redis connection
+        await redis_client.close()
+        # Close Postgres pool
+        await pg.close_pool()
+        # Close Supabase HTTP pool
+        await supabase.close_client()
+        # Close ORM session connections
+        await engine.dispose()
+        logger.info("Application shutdown complete")
+    except Exception as e:
+        logger.error(f"Shutdown error: {str(e)}")
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    description="A high-performance stock analysis and trading bot"
+    description="A high-performance stock analysis and trading bot",
+    lifespan=lifespan
 )
 
-# Configure CORS
-if settings.BACKEND_CORS_ORIGINS:
+# Configure CORS (origins normalized once at import)
+_CORS_ORIGINS = tuple(origin.strip('"') for origin in settings.BACKEND_CORS_ORIGINS)
+if _CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[origin.strip('"') for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -34,32 +74,33 @@ if settings.BACKEND_CORS_ORIGINS:
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(LoggingMiddleware)
+# Compress large JSON payloads (brotli, falling back to gzip for older clients)
+app.add_middleware(
+    BrotliMiddleware,
+    quality=settings.COMPRESSION_QUALITY,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    try:
-        # Initialize Redis
-        await redis_client.init()
-        # Initialize news service
-        await news_service.initialize()
-        logger.info("Application startup complete")
-    except Exception as e:
-        logger.error(f"Startup error: {str(e)}")
-        raise
+@app.exception_handler(UpstreamDataError)
+async def upstream_data_error_handler(request: Request, exc: UpstreamDataError):
+    """Report upstream data failures as 502 Bad Gateway."""
+    logger.warning(f"Upstream data error on {request.url.path}: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={"detail": str(exc)}
+    )
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    try:
-        # Close Redis connection
-        await redis_client.close()
-        logger.info("Application shutdown complete")
-    except Exception as e:
-        logger.error(f"Shutdown error: {str(e)}")
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Log unhandled errors once and return a generic 500."""
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
 
 @app.get("/health")
 async def health_check():
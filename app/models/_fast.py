@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+import time
+from typing import Any, Optional, Tuple, Type, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+# (epoch second, naive UTC datetime); rebound as a whole so readers on
+# other threads never see a second paired with another second's datetime
+_now_cache: Tuple[int, Optional[datetime]] = (0, None)
+
+def _now_cached() -> datetime:
+    """
+    Naive UTC now truncated to the second, as a created_at/updated_at default.
+
+    The datetime is built once per wall-clock second and shared; datetimes
+    are immutable, so instances created within the same second can share it.
+    """
+    global _now_cache
+    t = int(time.time())
+    if t != _now_cache[0]:
+        _now_cache = (t, datetime.fromtimestamp(t, timezone.utc).replace(tzinfo=None))
+    return _now_cache[1]
+
+@lru_cache(maxsize=None)
+def _field_plan(cls: Type[BaseModel]) -> Tuple[Tuple[str, Optional[Type[BaseModel]]], ...]:
+    """Field names of cls, each with its item model if it is a list of models."""
+    plan = []
+    for name, field in cls.model_fields.items():
+        nested = None
+        if get_origin(field.annotation) is list:
+            (item_type,) = get_args(field.annotation)
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                nested = item_type
+        plan.append((name, nested))
+    return tuple(plan)
+
+def _from_orm_fast(cls: Type[M], obj: Any, **values: Any) -> M:
+    """
+    Build cls from a trusted ORM object without running validation.
+
+    Only for rows loaded from our own database; request bodies and other
+    external input must still be validated. Lists of models (items, alerts)
+    are converted the same way. Keyword values are used as given, for
+    fields the ORM object does not have.
+    """
+    for name, nested in _field_plan(cls):
+        if name in values:
+            continue
+        value = getattr(obj, name)
+        if nested is not None:
+            value = [_from_orm_fast(nested, child) for child in value]
+        values[name] = value
+    return cls.model_construct(**values)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from app.utils._njit import njit
+
+@njit(cache=True, fastmath=True)
+def _compute_ofi_loop(bid_px, bid_q, ask_px, ask_q):
+    """
+    Multi-level order flow imbalance between consecutive book snapshots.
+
+    Inputs are (snapshots, levels) float64 arrays, best level first. Row t
+    of the returned (bOF, aOF) arrays is the bid and ask order flow from
+    snapshot t to t + 1 at each level; OFI is bOF - aOF.
+    """
+    n, m = bid_px.shape
+    bof = np.empty((n - 1, m))
+    aof = np.empty((n - 1, m))
+    for t in range(1, n):
+        for k in range(m):
+            # Bid: a higher price adds the new queue, a lower one removes the old
+            if bid_px[t, k] > bid_px[t - 1, k]:
+                bof[t - 1, k] = bid_q[t, k]
+            elif bid_px[t, k] == bid_px[t - 1, k]:
+                bof[t - 1, k] = bid_q[t, k] - bid_q[t - 1, k]
+            else:
+                bof[t - 1, k] = -bid_q[t - 1, k]
+            # Ask: mirrored, a lower price adds the new queue
+            if ask_px[t, k] < ask_px[t - 1, k]:
+                aof[t - 1, k] = ask_q[t, k]
+            elif ask_px[t, k] == ask_px[t - 1, k]:
+                aof[t - 1, k] = ask_q[t, k] - ask_q[t - 1, k]
+            else:
+                aof[t - 1, k] = -ask_q[t - 1, k]
+    return bof, aof
+
+def _level_flow(px, q, ask=False):
+    """Per-event order flow at each level; rows are snapshot t to t + 1."""
+    # Bid: a higher price adds the new queue, a lower one removes the old.
+    # Ask: mirrored, so flip the price sign and reuse the bid rule.
+    if ask:
+        px = -px
+    prev_px, curr_px = px[:-1], px[1:]
+    prev_q, curr_q = q[:-1], q[1:]
+    return np.where(
+        curr_px > prev_px,
+        curr_q,
+        np.where(curr_px == prev_px, curr_q - prev_q, -prev_q)
+    )
+
+def _bucket_order_flow(bid_px, bid_q, ask_px, ask_q, bucket_idx, levels=10):
+    """
+    Bid and ask order flow summed per time bucket.
+
+    Inputs are (snapshots, levels) arrays, best level first, and a
+    non-decreasing bucket label per snapshot. The event from snapshot t to
+    t + 1 counts towards the bucket of snapshot t + 1. Returns two
+    (num_buckets, levels) arrays, one row per distinct bucket in order.
+    """
+    levels = min(levels, bid_px.shape[1])
+    event_bucket = np.asarray(bucket_idx)[1:]
+    if len(event_bucket) == 0:
+        empty = np.empty((0, levels))
+        return empty, empty
+    starts = np.flatnonzero(np.r_[True, event_bucket[1:] != event_bucket[:-1]])
+    bof = _level_flow(bid_px[:, :levels], bid_q[:, :levels])
+    aof = _level_flow(ask_px[:, :levels], ask_q[:, :levels], ask=True)
+    return np.add.reduceat(bof, starts, axis=0), np.add.reduceat(aof, starts, axis=0)
+
+def mlofi(bid_px, bid_q, ask_px, ask_q, bucket_idx, levels=10):
+    """
+    Multi-level order flow imbalance per time bucket.
+
+    Vectorized counterpart of summing _compute_ofi_loop over the events
+    of each bucket. Returns a (num_buckets, levels) array of bOF - aOF.
+    """
+    bof, aof = _bucket_order_flow(bid_px, bid_q, ask_px, ask_q, bucket_idx, levels)
+    return bof - aof
@@ -1,7 +1,8 @@
 from enum import Enum
-from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Optional, Union
-from datetime import datetime
+from cachetools import LRUCache
+from pydantic import AliasChoices, BaseModel, Field, model_validator, validator
+from typing import Dict, List, Optional, Sequence, Union
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from app.models.technical import TimeFrame, TrendDirection, SignalStrength
@@ -33,6 +34,12 @@ class OrderStatus(str, Enum):
 
 
 class BacktestOrder(BaseModel):
+    """
+    Simulated order.
+    
+    Validators run for externally supplied data; the simulation builds
+    orders from already-typed values with model_construct to skip them.
+    """
     id: UUID = Field(default_factory=uuid4)
     symbol: str
     type: OrderType
@@ -122,11 +129,44 @@ class BacktestConfig(BaseModel):
         return v
 
 
+class EquityCurve(BaseModel):
+    """
+    Equity curve as parallel arrays, one entry per bar.
+    
+    Storing columns instead of a list of {timestamp, equity, ...} objects
+    avoids repeating the keys on every point, so the JSONB is several times
+    smaller and compresses (TOAST) and parses much faster.
+    """
+    t: List[int] = []  # Epoch seconds (UTC)
+    equity: List[float] = []
+    cash: List[float] = []
+    positions_value: List[float] = []
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_points(cls, data):
+        """Accept the legacy list of {timestamp, equity, cash, positions_value} points."""
+        if not isinstance(data, list):
+            return data
+        columns = {"t": [], "equity": [], "cash": [], "positions_value": []}
+        for point in data:
+            timestamp = point["timestamp"]
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            columns["t"].append(int(timestamp.timestamp()))
+            columns["equity"].append(point["equity"])
+            columns["cash"].append(point["cash"])
+            columns["positions_value"].append(point["positions_value"])
+        return columns
+
+
 class BacktestResult(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     config: BacktestConfig
     stats: TradeStats
-    equity_curve: List[Dict[str, Union[datetime, float]]]
+    equity_curve: EquityCurve
     trades: List[Dict[str, Union[str, float, datetime]]]
     positions: List[Dict[str, Union[str, float, datetime]]]
     orders: List[BacktestOrder]
@@ -146,6 +186,9 @@ class BacktestSignal(BaseModel):
     price: float
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+
 
 class StrategyConfig(BaseModel):
     name: str
@@ -171,29 +214,130 @@ class StrategyConfig(BaseModel):
     timeframes: List[TimeFrame] = [TimeFrame.DAILY]
     metadata: Optional[Dict] = None
 
+    @classmethod
+    def from_jsonb(
+        cls,
+        strategy_id: UUID,
+        updated_at: datetime,
+        raw: Dict
+    ) -> "StrategyConfig":
+        """
+        Validate a stored config, reusing the parse for an unchanged strategy.
+        
+        Every write bumps updated_at, so (id, updated_at) identifies the
+        config contents. Cached instances are shared and must not be mutated.
+        """
+        key = (strategy_id, updated_at)
+        config = _strategy_config_cache.get(key)
+        if config is None:
+            config = cls.model_validate(raw)
+            _strategy_config_cache[key] = config
+        return config
+
+
+# Validated strategy configs keyed by (strategy id, updated_at)
+_strategy_config_cache = LRUCache(maxsize=4096)
+
 
 class BacktestStrategy(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     user_id: UUID
     name: str
     description: str
-    config: StrategyConfig
+    # BacktestStrategyDB exposes its config column already validated, and
+    # cached, as "strategy_config"
+    config: StrategyConfig = Field(
+        validation_alias=AliasChoices("strategy_config", "config")
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
     is_public: bool = False
     performance: Optional[Dict[str, float]] = None
-    metadata: Optional[Dict] = None
+    # BacktestStrategyDB exposes the metadata column as "meta"
+    metadata: Optional[Dict] = Field(
+        default=None,
+        validation_alias=AliasChoices("meta", "metadata")
+    )
 
     class Config:
         from_attributes = True
 
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Float, ForeignKey, Index, Table, func, or_, select
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, UUID as PGUUID, JSONB
+from sqlalchemy.orm import relationship
+from app.db.bulk import compile_query, write_records
+from app.db.pg import get_pool
 from app.db.base import Base
 
 
+def _json_float(column, key: str):
+    """(column->>'key')::float, the form used by the expression indexes."""
+    return column[key].astext.cast(Float)
+
+
+def _column_values(instance) -> dict:
+    """Column values set on an instance by column name, leaving out relationships."""
+    values = instance.__dict__
+    return {
+        column.name: values[key]
+        for key, column in instance.__mapper__.columns.items()
+        if key in values
+    }
+
+
+def _bulk_row(instance) -> dict:
+    """
+    Column values for a multi-row INSERT.
+    
+    Every row must bind the same columns, so unset columns are sent as NULL
+    (or their server default expression) unless they have a Python-side
+    default, which is then applied per row.
+    """
+    values = instance.__dict__
+    return {
+        column.name: values[key] if key in values else _unset_value(column)
+        for key, column in instance.__mapper__.columns.items()
+        if key in values or column.default is None
+    }
+
+
+def _unset_value(column):
+    """Value a multi-row INSERT sends for a column the row did not set."""
+    if column.server_default is not None:
+        return column.server_default.arg
+    return None
+
+
+# Rows per multi-row INSERT; keeps bind parameters well under Postgres' 32767
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+# Equity curve points, one row per bar, for time-range reads. A plain table
+# with no primary key: a btree would dwarf the BRIN index that serves it.
+backtest_equity_points = Table(
+    "backtest_equity_points",
+    Base.metadata,
+    Column("result_id", PGUUID, ForeignKey("backtest_results.id", ondelete="CASCADE"), nullable=False),
+    Column("ts", DateTime(timezone=True), nullable=False),
+    Column("equity", DOUBLE_PRECISION, nullable=False),
+    Index(
+        "ix_backtest_equity_points_result_ts", "result_id", "ts",
+        postgresql_using="brin"
+    )
+)
+
+
+def _equity_records(result) -> List[tuple]:
+    """(result_id, ts, equity) records for a result's equity curve."""
+    curve = result.equity_curve
+    return [
+        (result.id, datetime.fromtimestamp(t, tz=timezone.utc), float(equity))
+        for t, equity in zip(curve["t"], curve["equity"])
+    ]
+
+
 # SQLAlchemy Models
 class BacktestStrategyDB(Base):
     __tablename__ = "backtest_strategies"
@@ -203,70 +347,170 @@ class BacktestStrategyDB(Base):
     name = Column(String, nullable=False)
     description = Column(Text)
     config = Column(JSONB, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     is_active = Column(Boolean, nullable=False, default=True)
     is_public = Column(Boolean, nullable=False, default=False)
     performance = Column(JSONB)
-    metadata = Column(JSONB)
+    # "metadata" is reserved on declarative classes; the column keeps its name
+    meta = Column("metadata", JSONB)
+
+    # Results carry whole equity curves, so they are only loaded on request;
+    # rows are removed by the ON DELETE CASCADE foreign key
+    results = relationship(
+        "BacktestResultDB",
+        back_populates="strategy",
+        cascade="all, delete",
+        passive_deletes=True
+    )
 
     __table_args__ = (
         Index("ix_backtest_strategies_user_id", "user_id"),
-        Index("ix_backtest_strategies_is_public", "is_public")
+        Index("ix_backtest_strategies_is_public", "is_public"),
+        # Filter strategy contents with containment, e.g.
+        # config.contains({"name": ...}), so these GIN indexes apply
+        Index(
+            "ix_backtest_strategies_config_gin", "config",
+            postgresql_using="gin", postgresql_ops={"config": "jsonb_path_ops"}
+        ),
+        Index(
+            "ix_backtest_strategies_performance_gin", "performance",
+            postgresql_using="gin", postgresql_ops={"performance": "jsonb_path_ops"}
+        ),
+        Index(
+            "ix_backtest_strategies_metadata_gin", "metadata",
+            postgresql_using="gin", postgresql_ops={"metadata": "jsonb_path_ops"}
+        )
     )
 
+    @property
+    def strategy_config(self) -> StrategyConfig:
+        """The config column as a validated StrategyConfig."""
+        return StrategyConfig.from_jsonb(self.id, self.updated_at, self.config)
+
+    @classmethod
+    def _from_row(cls, row) -> "BacktestStrategyDB":
+        """Build an instance from a row keyed by column name."""
+        return cls(**{
+            key: row[column.name]
+            for key, column in cls.__mapper__.columns.items()
+        })
+
     @classmethod
     async def get_by_id(cls, strategy_id: UUID) -> Optional["BacktestStrategyDB"]:
         """Get strategy by ID."""
         query = cls.__table__.select().where(cls.id == strategy_id)
         result = await cls._db.fetch_one(query)
-        return cls(**result) if result else None
+        return cls._from_row(result) if result else None
+
+    @classmethod
+    async def get_by_ids(
+        cls,
+        strategy_ids: List[UUID]
+    ) -> List[Optional["BacktestStrategyDB"]]:
+        """Get strategies by ID in one query, in the order requested."""
+        query = cls.__table__.select().where(cls.id.in_(strategy_ids))
+        results = await cls._db.fetch_all(query)
+        by_id = {row["id"]: cls._from_row(row) for row in results}
+        return [by_id.get(strategy_id) for strategy_id in strategy_ids]
 
     @classmethod
     async def get_by_user(cls, user_id: UUID) -> List["BacktestStrategyDB"]:
         """Get all strategies for a user."""
         query = cls.__table__.select().where(cls.user_id == user_id)
         results = await cls._db.fetch_all(query)
-        return [cls(**row) for row in results]
+        return [cls._from_row(row) for row in results]
 
     @classmethod
     async def get_public(cls) -> List["BacktestStrategyDB"]:
         """Get all public strategies."""
         query = cls.__table__.select().where(cls.is_public == True)
         results = await cls._db.fetch_all(query)
-        return [cls(**row) for row in results]
+        return [cls._from_row(row) for row in results]
+
+    @classmethod
+    async def get_for_user(
+        cls,
+        user_id: UUID,
+        include_public: bool = False
+    ) -> List["BacktestStrategyDB"]:
+        """Get strategies owned by a user, optionally with all public ones."""
+        condition = cls.user_id == user_id
+        if include_public:
+            condition = or_(condition, cls.is_public == True)
+        query = cls.__table__.select().where(condition)
+        results = await cls._db.fetch_all(query)
+        return [cls._from_row(row) for row in results]
 
     async def save(self) -> None:
         """Save strategy to database."""
         if not self.id:
             query = self.__table__.insert().values(
-                **{
-                    k: v
-                    for k, v in self.__dict__.items()
-                    if not k.startswith("_")
-                }
+                **_column_values(self)
             )
             await self._db.execute(query)
         else:
+            # The new updated_at changes the key; drop the superseded parse
+            _strategy_config_cache.pop((self.id, self.updated_at), None)
             self.updated_at = datetime.utcnow()
             query = (
                 self.__table__.update()
                 .where(self.__table__.c.id == self.id)
                 .values(
-                    **{
-                        k: v
-                        for k, v in self.__dict__.items()
-                        if not k.startswith("_")
-                    }
+                    **_column_values(self)
                 )
             )
             await self._db.execute(query)
 
+    @classmethod
+    async def bulk_save(cls, strategies: Sequence["BacktestStrategyDB"]) -> None:
+        """Insert many strategies with one multi-row INSERT per chunk."""
+        for start in range(0, len(strategies), BULK_INSERT_CHUNK_SIZE):
+            chunk = strategies[start:start + BULK_INSERT_CHUNK_SIZE]
+            query = cls.__table__.insert().values(
+                [_bulk_row(row) for row in chunk]
+            )
+            await cls._db.execute(query)
+
     async def delete(self) -> None:
         """Delete strategy from database."""
         query = self.__table__.delete().where(self.__table__.c.id == self.id)
         await self._db.execute(query)
 
+    @classmethod
+    async def update_owned(
+        cls,
+        strategy_id: UUID,
+        user_id: UUID,
+        **values
+    ) -> Optional["BacktestStrategyDB"]:
+        """Update a strategy owned by the user in a single statement.
+
+        Returns None when no strategy matched both id and owner.
+        """
+        values.setdefault("updated_at", datetime.utcnow())
+        query = (
+            cls.__table__.update()
+            .where(cls.id == strategy_id)
+            .where(cls.user_id == user_id)
+            .values(**values)
+            .returning(cls.__table__)
+        )
+        result = await cls._db.fetch_one(query)
+        return cls._from_row(result) if result else None
+
+    @classmethod
+    async def delete_owned(cls, strategy_id: UUID, user_id: UUID) -> bool:
+        """Delete a strategy owned by the user in a single statement."""
+        query = (
+            cls.__table__.delete()
+            .where(cls.id == strategy_id)
+            .where(cls.user_id == user_id)
+            .returning(cls.__table__.c.id)
+        )
+        result = await cls._db.fetch_one(query)
+        return result is not None
+
 
 class BacktestResultDB(Base):
     __tablename__ = "backtest_results"
@@ -281,11 +525,23 @@ class BacktestResultDB(Base):
     positions = Column(JSONB, nullable=False)
     orders = Column(JSONB, nullable=False)
     metrics = Column(JSONB, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Parents of a loaded batch come back in one WHERE id IN (...) query
+    strategy = relationship("BacktestStrategyDB", back_populates="results", lazy="selectin")
 
     __table_args__ = (
         Index("ix_backtest_results_strategy_id", "strategy_id"),
-        Index("ix_backtest_results_user_id", "user_id")
+        Index("ix_backtest_results_user_id", "user_id"),
+        # Expression indexes on hot metric paths; queries must sort/filter on
+        # the same expression (see _json_float) to use them
+        Index("ix_backtest_results_sharpe", _json_float(metrics, "sharpe_ratio").desc()),
+        Index("ix_backtest_results_max_drawdown", _json_float(metrics, "max_drawdown")),
+        Index("ix_backtest_results_total_pnl", _json_float(stats, "total_pnl").desc()),
+        Index(
+            "ix_backtest_results_stats_gin", "stats",
+            postgresql_using="gin", postgresql_ops={"stats": "jsonb_path_ops"}
+        )
     )
 
     @classmethod
@@ -295,31 +551,125 @@ class BacktestResultDB(Base):
         result = await cls._db.fetch_one(query)
         return cls(**result) if result else None
 
+    @classmethod
+    async def _with_strategies(
+        cls,
+        results: List["BacktestResultDB"]
+    ) -> List["BacktestResultDB"]:
+        """Attach parent strategies to results with a single IN query."""
+        strategy_ids = list({result.strategy_id for result in results})
+        if strategy_ids:
+            strategies = await BacktestStrategyDB.get_by_ids(strategy_ids)
+            by_id = {
+                strategy_id: strategy
+                for strategy_id, strategy in zip(strategy_ids, strategies)
+            }
+            for result in results:
+                result.strategy = by_id.get(result.strategy_id)
+        return results
+
     @classmethod
     async def get_by_strategy(cls, strategy_id: UUID) -> List["BacktestResultDB"]:
-        """Get all results for a strategy."""
-        query = cls.__table__.select().where(cls.strategy_id == strategy_id)
+        """Get all results for a strategy, best Sharpe ratio first."""
+        query = (
+            cls.__table__.select()
+            .where(cls.strategy_id == strategy_id)
+            .order_by(_json_float(cls.metrics, "sharpe_ratio").desc())
+        )
         results = await cls._db.fetch_all(query)
-        return [cls(**row) for row in results]
+        return await cls._with_strategies([cls(**row) for row in results])
 
     @classmethod
     async def get_by_user(cls, user_id: UUID) -> List["BacktestResultDB"]:
         """Get all results for a user."""
         query = cls.__table__.select().where(cls.user_id == user_id)
         results = await cls._db.fetch_all(query)
-        return [cls(**row) for row in results]
+        return await cls._with_strategies([cls(**row) for row in results])
+
+    @classmethod
+    async def list_summaries(cls, user_id: UUID) -> list:
+        """
+        List a user's results as lightweight rows, newest first.
+        
+        Selects only the summary columns, so the equity curve, trades,
+        positions and orders JSONB never leave Postgres.
+        """
+        strategies = BacktestStrategyDB.__table__
+        query = (
+            select(
+                cls.id,
+                cls.strategy_id,
+                strategies.c.name.label("strategy_name"),
+                cls.created_at,
+                _json_float(cls.stats, "total_pnl").label("total_pnl"),
+                _json_float(cls.metrics, "sharpe_ratio").label("sharpe_ratio"),
+                _json_float(cls.metrics, "max_drawdown").label("max_drawdown")
+            )
+            .join_from(cls.__table__, strategies, cls.strategy_id == strategies.c.id)
+            .where(cls.user_id == user_id)
+            .order_by(cls.created_at.desc())
+        )
+        return await cls._db.fetch_all(query)
+
+    @classmethod
+    async def get_equity_range(
+        cls,
+        result_id: UUID,
+        start: datetime,
+        end: datetime
+    ) -> list:
+        """Get (ts, equity) rows of a result's equity curve within [start, end]."""
+        query = (
+            select(backtest_equity_points.c.ts, backtest_equity_points.c.equity)
+            .where(backtest_equity_points.c.result_id == result_id)
+            .where(backtest_equity_points.c.ts.between(start, end))
+            .order_by(backtest_equity_points.c.ts)
+        )
+        return await cls._db.fetch_all(query)
+
+    @classmethod
+    async def _insert_with_equity_points(cls, results: Sequence["BacktestResultDB"]) -> None:
+        """
+        Insert results and their equity points in one transaction.
+        
+        Both go through one asyncpg connection, so a failed or cancelled
+        write never commits a result without its curve.
+        """
+        records = [
+            record
+            for result in results
+            for record in _equity_records(result)
+        ]
+        async with get_pool().acquire() as con:
+            async with con.transaction():
+                for start in range(0, len(results), BULK_INSERT_CHUNK_SIZE):
+                    chunk = results[start:start + BULK_INSERT_CHUNK_SIZE]
+                    query = cls.__table__.insert().values(
+                        [_bulk_row(row) for row in chunk]
+                    )
+                    await con.execute(*compile_query(query))
+                # COPY for long curves
+                await write_records(
+                    con,
+                    backtest_equity_points.name,
+                    [column.name for column in backtest_equity_points.columns],
+                    records
+                )
 
     async def save(self) -> None:
         """Save result to database."""
         if not self.id:
-            query = self.__table__.insert().values(
-                **{
-                    k: v
-                    for k, v in self.__dict__.items()
-                    if not k.startswith("_")
-                }
-            )
-            await self._db.execute(query)
+            # Assigned here so the equity points can reference the new row
+            self.id = uuid4()
+            await self._insert_with_equity_points([self])
+
+    @classmethod
+    async def bulk_save(cls, results: Sequence["BacktestResultDB"]) -> None:
+        """Insert many results with one multi-row INSERT per chunk."""
+        for result in results:
+            if not result.id:
+                result.id = uuid4()
+        await cls._insert_with_equity_points(results)
 
     async def delete(self) -> None:
         """Delete result from database."""
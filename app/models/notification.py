@@ -3,11 +3,12 @@ from enum import Enum
 from typing import Dict, Optional, Any
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
-from sqlalchemy import Boolean, Column, DateTime, Enum as SQLEnum, JSON, String, Text
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import Boolean, Column, DateTime, Enum as SQLEnum, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
+from app.models._fast import _now_cached
 
 class NotificationType(str, Enum):
     EMAIL = "email"
@@ -33,8 +34,8 @@ class NotificationBase(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
     priority: NotificationPriority = NotificationPriority.MEDIUM
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now_cached)
+    updated_at: datetime = Field(default_factory=_now_cached)
     read: bool = False
     read_at: Optional[datetime] = None
 
@@ -62,6 +63,9 @@ class NotificationResponse(BaseModel):
     read: bool
     read_at: Optional[datetime]
 
+    class Config:
+        from_attributes = True
+
 class NotificationPreferences(BaseModel):
     email: bool = True
     webhook: bool = True
@@ -78,18 +82,34 @@ class DBNotification(Base):
 
     id = Column(PGUUID, primary_key=True, default=uuid4)
     user_id = Column(PGUUID, index=True)
-    type = Column(SQLEnum(NotificationType))
+    # Native Postgres enums (see migration 0004)
+    type = Column(SQLEnum(NotificationType, name="notification_type", native_enum=True))
     title = Column(String)
     message = Column(Text)
-    data = Column(JSON, nullable=True)
-    priority = Column(SQLEnum(NotificationPriority))
-    status = Column(SQLEnum(NotificationStatus))
+    data = Column(JSONB, nullable=True)
+    priority = Column(SQLEnum(NotificationPriority, name="notification_priority", native_enum=True))
+    status = Column(SQLEnum(NotificationStatus, name="notification_status", native_enum=True))
     error = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     read = Column(Boolean, default=False)
     read_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index("ix_notifications_user_status_created", "user_id", "status", "created_at"),
+        # Partial: only the unread backlog is indexed (see migration 0005)
+        Index(
+            "ix_notifications_unread", "user_id", created_at.desc(),
+            postgresql_where=text("read = false")
+        ),
+        # Filter payloads with containment, data.contains({...}); GIN does
+        # not serve data->>'key' comparisons (see migration 0008)
+        Index(
+            "ix_notifications_data_gin", "data",
+            postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}
+        ),
+    )
+
     def to_response(self) -> NotificationResponse:
         return NotificationResponse(
             id=self.id,
@@ -1,7 +1,10 @@
 from enum import Enum
-from pydantic import BaseModel
-from typing import Dict, List, Optional, Union
-from datetime import datetime
+from pydantic import BaseModel, BeforeValidator, PlainSerializer, SerializationInfo, WithJsonSchema, model_serializer, model_validator, validator
+from typing import Annotated, Any, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+from app.models._technical_kernels import _bucket_order_flow, _compute_ofi_loop
 
 
 class TimeFrame(str, Enum):
@@ -49,6 +52,7 @@ class TechnicalIndicator(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class Signal(BaseModel):
@@ -61,6 +65,7 @@ class Signal(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class PatternSignal(BaseModel):
@@ -75,6 +80,7 @@ class PatternSignal(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class TrendAnalysis(BaseModel):
@@ -91,6 +97,85 @@ class TrendAnalysis(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
+
+
+# model_dump(context=ARRAY_CONTEXT) leaves ndarray fields as arrays, for
+# encoders that write numpy natively instead of walking Python lists
+ARRAY_CONTEXT = {"keep_arrays": True}
+
+
+def _dump_array(array: np.ndarray, info: SerializationInfo):
+    if info.mode == "python" and info.context and info.context.get("keep_arrays"):
+        return array
+    return array.tolist()
+
+
+def _array(dtype, item_type: str):
+    """ndarray field coerced to dtype and serialized as a JSON array."""
+    return Annotated[
+        np.ndarray,
+        BeforeValidator(lambda value: np.asarray(value, dtype=dtype)),
+        PlainSerializer(_dump_array, return_type=Any),
+        WithJsonSchema({"type": "array", "items": {"type": item_type}})
+    ]
+
+
+class PriceVolumeHistogram(BaseModel):
+    """
+    Volume at each price level, as parallel arrays with prices ascending.
+    
+    Serializes to the {price: volume} mapping clients expect, keyed by the
+    price as a string, and accepts that mapping back.
+    """
+    prices: _array(np.float64, "number")
+    volumes: _array(np.float64, "number")
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_mapping(cls, data):
+        """Accept the serialized {price: volume} form."""
+        if isinstance(data, dict) and set(data) != {"prices", "volumes"}:
+            prices = np.fromiter(map(float, data.keys()), dtype=np.float64, count=len(data))
+            volumes = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+            order = np.argsort(prices, kind="stable")
+            return {"prices": prices[order], "volumes": volumes[order]}
+        return data
+
+    @model_serializer
+    def to_mapping(self) -> Dict[str, float]:
+        return dict(zip(map(str, self.prices.tolist()), self.volumes.tolist()))
+
+    def point_of_control(self) -> float:
+        """Price level with the most volume."""
+        return float(self.prices[self.volumes.argmax()])
+
+    def value_area(self, value_area_pct: float) -> Tuple[float, float]:
+        """
+        Value area high and low.
+        
+        Grows a contiguous range of levels from the point of control, one
+        level at a time towards the busier neighbour, until it holds
+        value_area_pct of the total volume.
+        """
+        volumes = self.volumes
+        target = volumes.sum() * value_area_pct
+        low = high = int(volumes.argmax())
+        covered = volumes[low]
+        last = len(volumes) - 1
+        while covered < target and (low > 0 or high < last):
+            above = volumes[high + 1] if high < last else -1.0
+            below = volumes[low - 1] if low > 0 else -1.0
+            if above > below:
+                high += 1
+                covered += above
+            else:
+                low -= 1
+                covered += below
+        return float(self.prices[high]), float(self.prices[low])
 
 
 class VolumeProfile(BaseModel):
@@ -99,7 +184,7 @@ class VolumeProfile(BaseModel):
     timeframe: TimeFrame
     timestamp: datetime
     price_levels: List[float]
-    volume_at_price: Dict[str, float]  # Price level -> Volume
+    volume_at_price: PriceVolumeHistogram  # Price level -> Volume
     value_area_high: float
     value_area_low: float
     point_of_control: float
@@ -107,6 +192,7 @@ class VolumeProfile(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class OrderFlowTrade(BaseModel):
@@ -119,6 +205,97 @@ class OrderFlowTrade(BaseModel):
     is_block_trade: bool = False
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
+
+# OrderFlowTradeBatch encodings: sides holds SIDE_*, flags is a bitmask of FLAG_*
+SIDE_BUY = 0
+SIDE_SELL = 1
+FLAG_AGGRESSIVE = 1
+FLAG_BLOCK = 2
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_ns(timestamp: datetime) -> int:
+    """Epoch nanoseconds for a timestamp, treating naive values as UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def to_naive_utc_datetimes(timestamps: np.ndarray) -> List[datetime]:
+    """Naive UTC datetimes, as DateTime columns store them, for epoch nanoseconds."""
+    return [_EPOCH + timedelta(microseconds=ns // 1000) for ns in timestamps.tolist()]
+
+
+class OrderFlowTradeBatch(BaseModel):
+    """
+    Trades as parallel arrays rather than one model per trade.
+    
+    timestamps are epoch nanoseconds (UTC). Indexing a batch builds an
+    OrderFlowTrade; slicing returns a batch of views on the same arrays.
+    """
+    timestamps: _array(np.int64, "integer")
+    prices: _array(np.float64, "number")
+    volumes: _array(np.float64, "number")
+    sides: _array(np.uint8, "integer")
+    flags: _array(np.uint8, "integer")
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OrderFlowTradeBatch.model_construct(
+                timestamps=self.timestamps[index],
+                prices=self.prices[index],
+                volumes=self.volumes[index],
+                sides=self.sides[index],
+                flags=self.flags[index]
+            )
+        flags = int(self.flags[index])
+        return OrderFlowTrade.model_construct(
+            timestamp=_EPOCH + timedelta(microseconds=int(self.timestamps[index]) // 1000),
+            price=float(self.prices[index]),
+            volume=float(self.volumes[index]),
+            side="sell" if self.sides[index] == SIDE_SELL else "buy",
+            is_aggressive=bool(flags & FLAG_AGGRESSIVE),
+            is_block_trade=bool(flags & FLAG_BLOCK),
+            metadata=None
+        )
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[OrderFlowTrade]) -> "OrderFlowTradeBatch":
+        """Pack trade models into preallocated arrays in a single pass."""
+        count = len(trades)
+        timestamps = np.empty(count, dtype=np.int64)
+        prices = np.empty(count, dtype=np.float64)
+        volumes = np.empty(count, dtype=np.float64)
+        sides = np.empty(count, dtype=np.uint8)
+        flags = np.empty(count, dtype=np.uint8)
+        for i, trade in enumerate(trades):
+            timestamps[i] = _epoch_ns(trade.timestamp)
+            prices[i] = trade.price
+            volumes[i] = trade.volume
+            sides[i] = SIDE_SELL if trade.side == "sell" else SIDE_BUY
+            flags[i] = (
+                (FLAG_AGGRESSIVE if trade.is_aggressive else 0)
+                | (FLAG_BLOCK if trade.is_block_trade else 0)
+            )
+        return cls.model_construct(
+            timestamps=timestamps,
+            prices=prices,
+            volumes=volumes,
+            sides=sides,
+            flags=flags
+        )
+
 
 class OrderFlowImbalance(BaseModel):
     """Order flow imbalance at a price level."""
@@ -133,6 +310,99 @@ class OrderFlowImbalance(BaseModel):
     aggressive_sell_volume: float
     timestamp: datetime
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
+    @classmethod
+    def batch_from_snapshots(
+        cls,
+        prev: "OrderBookSnapshot",
+        curr: "OrderBookSnapshot"
+    ) -> List["OrderFlowImbalance"]:
+        """
+        Per-level order flow imbalance between two order book snapshots.
+        
+        buy_volume and sell_volume hold the bid and ask order flow at each
+        level, price_level the level's current mid. Levels are compared
+        best first, down to the shallower side of either book.
+        """
+        depth = min(
+            len(prev.bid_prices), len(prev.ask_prices),
+            len(curr.bid_prices), len(curr.ask_prices)
+        )
+        bid_px, bid_q, ask_px, ask_q = (
+            np.stack([getattr(prev, side)[:depth], getattr(curr, side)[:depth]])
+            for side in ("bid_prices", "bid_sizes", "ask_prices", "ask_sizes")
+        )
+        bof, aof = _compute_ofi_loop(bid_px, bid_q, ask_px, ask_q)
+        mids = (bid_px[1] + ask_px[1]) / 2
+        # Kernel outputs are already floats; skip per-row validation
+        return [
+            cls.model_construct(
+                price_level=float(mids[k]),
+                buy_volume=float(bof[0, k]),
+                sell_volume=float(aof[0, k]),
+                net_volume=float(bof[0, k] - aof[0, k]),
+                trade_count=0,
+                avg_trade_size=0.0,
+                max_trade_size=0.0,
+                aggressive_buy_volume=0.0,
+                aggressive_sell_volume=0.0,
+                timestamp=curr.timestamp
+            )
+            for k in range(depth)
+        ]
+
+    @classmethod
+    def batch_from_buckets(
+        cls,
+        snapshots: Sequence["OrderBookSnapshot"],
+        bucket: timedelta,
+        levels: int = 10
+    ) -> List["OrderFlowImbalance"]:
+        """
+        Multi-level order flow imbalance summed over fixed time buckets.
+        
+        Snapshots must be in time order. Each bucket yields one row per
+        level, stamped with and priced at the bucket's last snapshot.
+        """
+        if len(snapshots) < 2:
+            return []
+        depth = min(
+            levels,
+            *(min(len(s.bid_prices), len(s.ask_prices)) for s in snapshots)
+        )
+        bid_px, bid_q, ask_px, ask_q = (
+            np.stack([getattr(s, side)[:depth] for s in snapshots])
+            for side in ("bid_prices", "bid_sizes", "ask_prices", "ask_sizes")
+        )
+        seconds = np.array([_epoch_ns(s.timestamp) / 1e9 for s in snapshots])
+        bucket_idx = np.floor_divide(seconds, bucket.total_seconds())
+        bof, aof = _bucket_order_flow(bid_px, bid_q, ask_px, ask_q, bucket_idx, depth)
+        ofi = bof - aof
+        
+        # Last snapshot of each bucket; events start at the second snapshot
+        event_bucket = bucket_idx[1:]
+        last = np.flatnonzero(np.r_[event_bucket[1:] != event_bucket[:-1], True]) + 1
+        mids = (bid_px[last] + ask_px[last]) / 2
+        return [
+            cls.model_construct(
+                price_level=float(mids[b, k]),
+                buy_volume=float(bof[b, k]),
+                sell_volume=float(aof[b, k]),
+                net_volume=float(ofi[b, k]),
+                trade_count=0,
+                avg_trade_size=0.0,
+                max_trade_size=0.0,
+                aggressive_buy_volume=0.0,
+                aggressive_sell_volume=0.0,
+                timestamp=snapshots[i].timestamp
+            )
+            for b, i in enumerate(last)
+            for k in range(depth)
+        ]
+
 
 class OrderFlowAnalysis(BaseModel):
     """Complete order flow analysis for a time period."""
@@ -140,7 +410,7 @@ class OrderFlowAnalysis(BaseModel):
     timeframe: TimeFrame
     start_time: datetime
     end_time: datetime
-    trades: List[OrderFlowTrade]
+    trades: OrderFlowTradeBatch
     imbalances: List[OrderFlowImbalance]
     cumulative_volume_delta: float
     buy_volume_ratio: float
@@ -153,6 +423,17 @@ class OrderFlowAnalysis(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
+
+    @validator('trades', pre=True)
+    def pack_trades(cls, v):
+        """Accept a list of trades and pack it into a batch."""
+        if isinstance(v, (list, tuple)):
+            return OrderFlowTradeBatch.from_trades([
+                trade if isinstance(trade, OrderFlowTrade) else OrderFlowTrade(**trade)
+                for trade in v
+            ])
+        return v
 
 
 class LiquidityLevel(BaseModel):
@@ -166,12 +447,23 @@ class LiquidityLevel(BaseModel):
     last_test: datetime
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
 
 class OrderBookSnapshot(BaseModel):
-    """Snapshot of the order book at a point in time."""
+    """
+    Snapshot of the order book at a point in time.
+    
+    Each side is a pair of parallel arrays ordered best price first: bids
+    descending, asks ascending.
+    """
     timestamp: datetime
-    bids: Dict[float, float]  # price -> volume
-    asks: Dict[float, float]  # price -> volume
+    bid_prices: _array(np.float64, "number")
+    bid_sizes: _array(np.float64, "number")
+    ask_prices: _array(np.float64, "number")
+    ask_sizes: _array(np.float64, "number")
     bid_depth: float
     ask_depth: float
     spread: float
@@ -179,6 +471,81 @@ class OrderBookSnapshot(BaseModel):
     weighted_mid_price: float
     imbalance_ratio: float
 
+    class Config:
+        arbitrary_types_allowed = True
+
+    @classmethod
+    def from_dict(
+        cls,
+        timestamp: datetime,
+        bids: Dict[float, float],
+        asks: Dict[float, float]
+    ) -> "OrderBookSnapshot":
+        """Build a snapshot from price -> size maps, sorting each side once."""
+        if not bids or not asks:
+            raise ValueError("Order book needs at least one bid and one ask")
+        bid_prices, bid_sizes = _book_side(bids, descending=True)
+        ask_prices, ask_sizes = _book_side(asks, descending=False)
+        best_bid = bid_prices[0]
+        best_ask = ask_prices[0]
+        
+        # Weighted mid leans towards the side with less resting volume
+        total_bid_volume = bid_sizes.sum()
+        total_ask_volume = ask_sizes.sum()
+        weighted_mid = (
+            (best_bid * total_ask_volume + best_ask * total_bid_volume) /
+            (total_bid_volume + total_ask_volume)
+        )
+        
+        # Depth within 1% of the best price on each side
+        bid_depth = bid_sizes[:np.searchsorted(-bid_prices, -best_bid * 0.99, side="right")].sum()
+        ask_depth = ask_sizes[:np.searchsorted(ask_prices, best_ask * 1.01, side="right")].sum()
+        
+        return cls.model_construct(
+            timestamp=timestamp,
+            bid_prices=bid_prices,
+            bid_sizes=bid_sizes,
+            ask_prices=ask_prices,
+            ask_sizes=ask_sizes,
+            bid_depth=float(bid_depth),
+            ask_depth=float(ask_depth),
+            spread=float(best_ask - best_bid),
+            mid_price=float((best_ask + best_bid) / 2),
+            weighted_mid_price=float(weighted_mid),
+            imbalance_ratio=float((bid_depth - ask_depth) / (bid_depth + ask_depth))
+        )
+
+    def walk(self, side: str, size: float) -> Tuple[float, float, float]:
+        """
+        Fill a market order against the book, best price first.
+        
+        A buy takes the asks, a sell the bids. Returns the total cost, the
+        size left unfilled once the side runs out, and the last price
+        touched (0 if nothing was filled).
+        """
+        if side == "buy":
+            prices, sizes = self.ask_prices, self.ask_sizes
+        else:
+            prices, sizes = self.bid_prices, self.bid_sizes
+        
+        # Size taken at each level: what is left after the levels before it
+        filled_before = np.cumsum(sizes) - sizes
+        taken = np.clip(size - filled_before, 0, sizes)
+        touched = np.searchsorted(filled_before, size)
+        return (
+            float((taken * prices).sum()),
+            float(size - taken.sum()),
+            float(prices[touched - 1]) if touched else 0.0
+        )
+
+
+def _book_side(levels: Dict[float, float], descending: bool):
+    """Price and size arrays of one book side, best price first."""
+    prices = np.fromiter(levels.keys(), dtype=np.float64, count=len(levels))
+    sizes = np.fromiter(levels.values(), dtype=np.float64, count=len(levels))
+    order = np.argsort(-prices if descending else prices, kind="stable")
+    return prices[order], sizes[order]
+
 
 class MarketImpactEstimate(BaseModel):
     """Estimated market impact for different order sizes."""
@@ -208,6 +575,7 @@ class LiquidityAnalysis(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class DarkPoolTrade(BaseModel):
@@ -221,6 +589,10 @@ class DarkPoolTrade(BaseModel):
     is_block: bool = False
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
 
 class DarkPoolVenue(BaseModel):
     """Dark pool venue information."""
@@ -243,6 +615,10 @@ class PriceLevel(BaseModel):
     venue_breakdown: Dict[str, float]  # venue -> volume
     is_significant: bool = False
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
 
 class DarkPoolAnalysis(BaseModel):
     """Complete dark pool analysis for a symbol."""
@@ -263,6 +639,7 @@ class DarkPoolAnalysis(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
 
 
 class OptionContract(BaseModel):
@@ -285,6 +662,10 @@ class OptionContract(BaseModel):
     is_weekly: bool = False
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
 
 class OptionFlow(BaseModel):
     """Individual options flow trade."""
@@ -299,6 +680,167 @@ class OptionFlow(BaseModel):
     execution_type: str  # "market", "limit", "complex"
     metadata: Optional[Dict] = None
 
+    class Config:
+        frozen = True
+        from_attributes = True
+
+
+# OptionFlowRing encoding: side_flags is a bitmask of FLOW_*
+FLOW_SELL = 1
+FLOW_SWEEP = 2
+FLOW_BLOCK = 4
+FLOW_BEARISH = 8
+
+
+class OptionFlowRing(BaseModel):
+    """
+    Fixed-capacity ring of option flows stored as parallel arrays.
+    
+    Appending overwrites the oldest flow once the ring is full. Rows are
+    addressed oldest first; indexing builds an OptionFlow and iterating
+    yields them in that order. timestamps and expiries are epoch
+    nanoseconds (UTC). Contracts are shared references, not copies; per
+    flow metadata is not kept.
+    
+    Serializes to a list of flows and accepts one back, keeping the most
+    recent capacity flows (all of them if no capacity is given).
+    """
+    capacity: int
+    timestamps: _array(np.int64, "integer")
+    expiries: _array(np.int64, "integer")
+    strikes: _array(np.float64, "number")
+    sizes: _array(np.int64, "integer")
+    premiums: _array(np.float64, "number")
+    side_flags: _array(np.uint8, "integer")
+    contracts: _array(object, "object")
+    execution_types: _array(object, "string")
+    head: int = 0
+    count: int = 0
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @model_validator(mode="before")
+    @classmethod
+    def preallocate(cls, data):
+        """Allocate empty columns for OptionFlowRing(capacity=n) or pack a list of flows."""
+        if isinstance(data, (list, tuple)):
+            flows = [OptionFlow.model_validate(flow) for flow in data]
+            ring = cls.model_construct(**cls._allocate(len(flows)))
+            ring.extend(flows)
+            return dict(ring.__dict__)
+        if isinstance(data, dict) and "timestamps" not in data:
+            if data.get("capacity") is None:
+                raise ValueError("OptionFlowRing needs a capacity or its columns")
+            return cls._allocate(data["capacity"])
+        return data
+
+    @staticmethod
+    def _allocate(capacity: int) -> Dict:
+        return {
+            "capacity": capacity,
+            "timestamps": np.zeros(capacity, dtype=np.int64),
+            "expiries": np.zeros(capacity, dtype=np.int64),
+            "strikes": np.zeros(capacity, dtype=np.float64),
+            "sizes": np.zeros(capacity, dtype=np.int64),
+            "premiums": np.zeros(capacity, dtype=np.float64),
+            "side_flags": np.zeros(capacity, dtype=np.uint8),
+            "contracts": np.empty(capacity, dtype=object),
+            "execution_types": np.empty(capacity, dtype=object)
+        }
+
+    @model_serializer
+    def to_list(self) -> List[OptionFlow]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def _rows(self) -> np.ndarray:
+        """Storage positions of the live rows, oldest first."""
+        return (self.head - self.count + np.arange(self.count)) % max(self.capacity, 1)
+
+    def __getitem__(self, index: int) -> OptionFlow:
+        if not -self.count <= index < self.count:
+            raise IndexError("OptionFlowRing index out of range")
+        row = (self.head - self.count + index % self.count) % self.capacity
+        flags = int(self.side_flags[row])
+        return OptionFlow.model_construct(
+            timestamp=_EPOCH + timedelta(microseconds=int(self.timestamps[row]) // 1000),
+            contract=self.contracts[row],
+            side="sell" if flags & FLOW_SELL else "buy",
+            size=int(self.sizes[row]),
+            premium=float(self.premiums[row]),
+            is_sweep=bool(flags & FLOW_SWEEP),
+            is_block=bool(flags & FLOW_BLOCK),
+            sentiment="bearish" if flags & FLOW_BEARISH else "bullish",
+            execution_type=self.execution_types[row],
+            metadata=None
+        )
+
+    def append(self, flow: OptionFlow) -> None:
+        """
+        Write one flow over the oldest slot; no allocation once full.
+        
+        A ring with no capacity keeps nothing, like any full ring.
+        """
+        if self.capacity == 0:
+            return
+        row = self.head
+        self.timestamps[row] = _epoch_ns(flow.timestamp)
+        self.expiries[row] = _epoch_ns(flow.contract.expiry)
+        self.strikes[row] = flow.contract.strike
+        self.sizes[row] = flow.size
+        self.premiums[row] = flow.premium
+        self.side_flags[row] = (
+            (FLOW_SELL if flow.side == "sell" else 0)
+            | (FLOW_SWEEP if flow.is_sweep else 0)
+            | (FLOW_BLOCK if flow.is_block else 0)
+            | (FLOW_BEARISH if flow.sentiment == "bearish" else 0)
+        )
+        self.contracts[row] = flow.contract
+        self.execution_types[row] = flow.execution_type
+        self.head = (row + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def extend(self, flows: Sequence[OptionFlow]) -> None:
+        for flow in flows:
+            self.append(flow)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A column's live rows, oldest first.
+        
+        A view until the ring first wraps, a copy after that.
+        """
+        array = getattr(self, name)
+        if self.head >= self.count:
+            return array[self.head - self.count:self.head]
+        return array[self._rows()]
+
+    def filter(self, rows: np.ndarray) -> "OptionFlowRing":
+        """
+        A full ring holding the selected rows, in selection order.
+        
+        rows is a boolean mask or row indices over column() order.
+        """
+        positions = self._rows()[rows]
+        return OptionFlowRing.model_construct(
+            capacity=len(positions),
+            head=0,
+            count=len(positions),
+            **{
+                name: getattr(self, name)[positions]
+                for name in (
+                    "timestamps", "expiries", "strikes", "sizes", "premiums",
+                    "side_flags", "contracts", "execution_types"
+                )
+            }
+        )
+
 
 class StrikeAnalysis(BaseModel):
     """Analysis of activity at a strike price."""
@@ -338,9 +880,9 @@ class OptionsFlowAnalysis(BaseModel):
     put_call_ratio: float
     implied_volatility_rank: float
     implied_volatility_percentile: float
-    recent_flows: List[OptionFlow]
+    recent_flows: OptionFlowRing
     expiries: List[ExpiryAnalysis]
-    unusual_activity: List[OptionFlow]
+    unusual_activity: OptionFlowRing
     bullish_flow_ratio: float
     bearish_flow_ratio: float
     smart_money_indicator: float  # -1 to 1 scale
@@ -351,3 +893,4 @@ class OptionsFlowAnalysis(BaseModel):
 
     class Config:
         from_attributes = True
+        use_enum_values = True
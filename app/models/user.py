@@ -2,6 +2,10 @@ from pydantic import BaseModel, EmailStr, validator
 from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
+import re
+
+# Everything that is not a digit, stripped in one C-level pass
+_NON_DIGITS = re.compile(r"\D")
 
 
 class NotificationPreferences(BaseModel):
@@ -31,7 +35,7 @@ class NotificationPreferences(BaseModel):
     def validate_phone(cls, v):
         if v:
             # Remove any non-digit characters
-            cleaned = ''.join(filter(str.isdigit, v))
+            cleaned = _NON_DIGITS.sub("", v)
             # Add country code if missing
             if len(cleaned) == 10:  # US number without country code
                 cleaned = f"+1{cleaned}"
@@ -4,6 +4,8 @@ from typing import List, Optional
 from pydantic import BaseModel, Field, validator
 from uuid import UUID, uuid4
 
+from app.models._fast import _now_cached
+
 class AlertType(str, Enum):
     PRICE = "price"
     VOLUME = "volume"
@@ -46,8 +48,8 @@ class AlertBase(BaseModel):
     value: float | str
     priority: AlertPriority = AlertPriority.MEDIUM
     enabled: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now_cached)
+    updated_at: datetime = Field(default_factory=_now_cached)
     last_triggered: Optional[datetime] = None
     trigger_count: int = 0
     cooldown_minutes: int = 60
@@ -66,8 +68,8 @@ class WatchlistItemBase(BaseModel):
     notes: Optional[str] = None
     price_target: Optional[float] = None
     stop_loss: Optional[float] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now_cached)
+    updated_at: datetime = Field(default_factory=_now_cached)
     
     @validator('symbol')
     def validate_symbol(cls, v):
@@ -86,8 +88,8 @@ class WatchlistBase(BaseModel):
     description: Optional[str] = None
     type: WatchlistType = WatchlistType.TICKER
     is_public: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now_cached)
+    updated_at: datetime = Field(default_factory=_now_cached)
 
 class WatchlistCreate(WatchlistBase):
     pass
@@ -101,6 +103,14 @@ class Watchlist(WatchlistBase):
     class Config:
         use_enum_values = True
 
+    @property
+    def items_count(self) -> int:
+        return len(self.items)
+
+    @property
+    def alerts_count(self) -> int:
+        return len(self.alerts)
+
 # Response Models
 class WatchlistResponse(BaseModel):
     id: UUID
@@ -113,6 +123,9 @@ class WatchlistResponse(BaseModel):
     items_count: int
     alerts_count: int
 
+    class Config:
+        from_attributes = True
+
 class WatchlistDetailResponse(Watchlist):
     items: List[WatchlistItem]
     alerts: List[Alert]
@@ -125,7 +138,7 @@ class WatchlistItemResponse(WatchlistItem):
     alerts: List[Alert]
 
 # Database Models
-from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
@@ -142,8 +155,8 @@ class DBAlert(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_triggered = Column(DateTime, nullable=True)
-    trigger_count = Column(Float, default=0)
-    cooldown_minutes = Column(Float, default=60)
+    trigger_count = Column(Integer, default=0)
+    cooldown_minutes = Column(Integer, default=60)
     watchlist_id = Column(PGUUID, ForeignKey("watchlists.id"))
     
     watchlist = relationship("DBWatchlist", back_populates="alerts")
@@ -165,6 +178,9 @@ class DBWatchlistItem(Base):
 
 class DBWatchlist(Base):
     __tablename__ = "watchlists"
+    __table_args__ = (
+        Index("idx_watchlists_user_type", "user_id", "type"),
+    )
 
     id = Column(PGUUID, primary_key=True, default=uuid4)
     name = Column(String)
@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 import logging
 from uuid import UUID
@@ -24,6 +24,12 @@ from app.core.redis import redis_client
 
 logger = logging.getLogger(__name__)
 
+def _epoch_seconds(timestamp: datetime) -> int:
+    """Epoch seconds for a timestamp, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
 class BacktestService:
     def __init__(self):
         self.market_data = market_data_service
@@ -79,12 +85,13 @@ class BacktestService:
             'positions': {},
             'orders': [],
             'trades': [],
-            'equity_curve': [{
-                'timestamp': config.start_date,
-                'equity': config.initial_capital,
-                'cash': config.initial_capital,
-                'positions_value': 0.0
-            }]
+            # Column-wise, matching EquityCurve
+            'equity_curve': {
+                't': [_epoch_seconds(config.start_date)],
+                'equity': [config.initial_capital],
+                'cash': [config.initial_capital],
+                'positions_value': [0.0]
+            }
         }
 
     async def _get_historical_data(
@@ -168,8 +175,8 @@ class BacktestService:
         return {
             'equity_curve': portfolio['equity_curve'],
             'trades': portfolio['trades'],
-            'positions': [pos.dict() for pos in portfolio['positions'].values()],
-            'orders': [order.dict() for order in portfolio['orders']],
+            'positions': [pos.model_dump() for pos in portfolio['positions'].values()],
+            'orders': [order.model_dump() for order in portfolio['orders']],
             'metrics': self._calculate_metrics(portfolio)
         }
 
@@ -260,10 +267,10 @@ class BacktestService:
                     **config
                 )
             
-            # Check entry conditions
+            # Check entry conditions (signals skip validation: inputs are typed)
             for condition in strategy.config.entry_conditions:
                 if self._check_condition(condition, indicators, df.loc[timestamp]):
-                    signals.append(BacktestSignal(
+                    signals.append(BacktestSignal.model_construct(
                         symbol=symbol,
                         timestamp=timestamp,
                         type="ENTRY",
@@ -276,7 +283,7 @@ class BacktestService:
             # Check exit conditions
             for condition in strategy.config.exit_conditions:
                 if self._check_condition(condition, indicators, df.loc[timestamp]):
-                    signals.append(BacktestSignal(
+                    signals.append(BacktestSignal.model_construct(
                         symbol=symbol,
                         timestamp=timestamp,
                         type="EXIT",
@@ -343,6 +350,7 @@ class BacktestService:
         config: BacktestConfig
     ):
         """Process trading signals and create orders."""
+        # Orders are built from typed simulation values, so validation is skipped
         for signal in signals:
             symbol = signal.symbol
             current_position = portfolio['positions'].get(symbol)
@@ -361,7 +369,7 @@ class BacktestService:
                 quantity = position_value / signal.price
                 
                 # Create order
-                order = BacktestOrder(
+                order = BacktestOrder.model_construct(
                     symbol=symbol,
                     type=OrderType.MARKET,
                     side=OrderSide.BUY if signal.direction == TrendDirection.BULLISH else OrderSide.SELL,
@@ -372,7 +380,7 @@ class BacktestService:
                 
             else:  # EXIT
                 # Create order to close position
-                order = BacktestOrder(
+                order = BacktestOrder.model_construct(
                     symbol=symbol,
                     type=OrderType.MARKET,
                     side=OrderSide.SELL if current_position.type == PositionType.LONG else OrderSide.BUY,
@@ -425,7 +433,7 @@ class BacktestService:
                 
                 # Create or update position
                 if order.symbol not in portfolio['positions']:
-                    portfolio['positions'][order.symbol] = Position(
+                    portfolio['positions'][order.symbol] = Position.model_construct(
                         symbol=order.symbol,
                         type=PositionType.LONG,
                         quantity=order.quantity,
@@ -490,29 +498,28 @@ class BacktestService:
             for pos in portfolio['positions'].values()
         )
         
-        portfolio['equity_curve'].append({
-            'timestamp': timestamp,
-            'equity': portfolio['equity'],
-            'cash': portfolio['cash'],
-            'positions_value': positions_value
-        })
+        curve = portfolio['equity_curve']
+        curve['t'].append(_epoch_seconds(timestamp))
+        curve['equity'].append(portfolio['equity'])
+        curve['cash'].append(portfolio['cash'])
+        curve['positions_value'].append(positions_value)
 
     def _calculate_metrics(self, portfolio: Dict) -> Dict[str, float]:
         """Calculate performance metrics."""
         if not portfolio['trades']:
             return {}
             
-        equity_curve = pd.DataFrame(portfolio['equity_curve'])
-        returns = equity_curve['equity'].pct_change().dropna()
+        equity = pd.Series(portfolio['equity_curve']['equity'])
+        returns = equity.pct_change().dropna()
         
         return {
             'total_return': (
-                equity_curve['equity'].iloc[-1] / 
-                equity_curve['equity'].iloc[0] - 1
+                equity.iloc[-1] / 
+                equity.iloc[0] - 1
             ),
             'annualized_return': (
-                (1 + (equity_curve['equity'].iloc[-1] / 
-                     equity_curve['equity'].iloc[0] - 1)
+                (1 + (equity.iloc[-1] / 
+                     equity.iloc[0] - 1)
                 ) ** (252 / len(returns)) - 1
             ),
             'sharpe_ratio': (
@@ -525,9 +532,9 @@ class BacktestService:
                 if len(returns[returns < 0]) > 1 else 0
             ),
             'max_drawdown': (
-                (equity_curve['equity'].cummax() - 
-                 equity_curve['equity']) / 
-                equity_curve['equity'].cummax()
+                (equity.cummax() - 
+                 equity) / 
+                equity.cummax()
             ).max(),
             'win_rate': (
                 sum(1 for t in portfolio['trades'] if t['pnl'] > 0) /
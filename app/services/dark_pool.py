@@ -14,6 +14,7 @@ from app.models.technical import (
     DarkPoolAnalysis
 )
 from app.core.redis import redis_client
+from app.core.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class DarkPoolService:
         self.BLOCK_TRADE_THRESHOLD = 10000  # Minimum size for block trades
         self.SIGNIFICANT_LEVEL_THRESHOLD = 0.1  # 10% of total volume
         self.MAX_PRICE_LEVELS = 20  # Maximum number of price levels to track
+        self._inflight = SingleFlight()
 
     async def get_dark_pool_analysis(
         self,
@@ -30,7 +32,61 @@ class DarkPoolService:
         timeframe: TimeFrame,
         lookback_minutes: int = 60
     ) -> DarkPoolAnalysis:
-        """Get complete dark pool analysis for a symbol."""
+        """
+        Get complete dark pool analysis for a symbol.
+        
+        Concurrent requests for the same arguments share a single pipeline run.
+        """
+        return await self._inflight.do(
+            (symbol, timeframe, lookback_minutes),
+            lambda: self._build_dark_pool_analysis(
+                symbol,
+                timeframe,
+                lookback_minutes
+            )
+        )
+
+    async def get_dark_pool_venues(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        lookback_minutes: int = 60
+    ) -> List[DarkPoolVenue]:
+        """Get venue statistics, ordered by volume (descending)."""
+        analysis = await self.get_dark_pool_analysis(
+            symbol,
+            timeframe,
+            lookback_minutes
+        )
+        return analysis.venues
+
+    async def get_dark_pool_levels(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        lookback_minutes: int = 60,
+        significant_only: bool = False
+    ) -> List[PriceLevel]:
+        """Get price levels, ordered by price (ascending)."""
+        analysis = await self.get_dark_pool_analysis(
+            symbol,
+            timeframe,
+            lookback_minutes
+        )
+        if significant_only:
+            return [
+                level for level in analysis.price_levels
+                if level.is_significant
+            ]
+        return analysis.price_levels
+
+    async def _build_dark_pool_analysis(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        lookback_minutes: int
+    ) -> DarkPoolAnalysis:
+        """Build dark pool analysis from Redis or the full pipeline."""
         try:
             # Try to get from cache
             cache_key = f"dark_pool:{symbol}:{timeframe}:{lookback_minutes}"
@@ -52,7 +108,7 @@ class DarkPoolService:
                 raise ValueError(f"No dark pool trades found for {symbol}")
             
             # Process trades into DataFrame for analysis
-            df = pd.DataFrame([t.dict() for t in trades])
+            df = pd.DataFrame([t.model_dump() for t in trades])
             
             # Calculate venue statistics
             venues = self._analyze_venues(df)
@@ -104,7 +160,7 @@ class DarkPoolService:
             )
             
             # Cache for 30 seconds
-            await redis_client.set_json(cache_key, analysis.dict(), 30)
+            await redis_client.set_json(cache_key, analysis.model_dump(mode="json"), 30)
             
             return analysis
             
@@ -237,12 +293,13 @@ class DarkPoolService:
                 )
                 levels.append(level)
             
-            # Sort by volume and keep top levels
+            # Keep the top levels by volume, ordered by price for display
             levels = sorted(
                 levels,
                 key=lambda x: x.volume,
                 reverse=True
             )[:self.MAX_PRICE_LEVELS]
+            levels.sort(key=lambda x: x.price)
             
             # Get significant price levels
             significant_levels = [
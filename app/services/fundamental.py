@@ -3,6 +3,7 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+from cachetools import TTLCache
 from scipy.stats import norm
 
 from app.services.market_data import market_data_service
@@ -18,6 +19,8 @@ from app.models.fundamental import (
     FundamentalAnalysis
 )
 from app.core.redis import redis_client
+from app.core.singleflight import SingleFlight
+from app.db.pg import get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +28,45 @@ class FundamentalService:
     def __init__(self):
         self.market_data = market_data_service
         self.CACHE_TTL = 3600  # 1 hour
+        self.SNAPSHOT_TTL = 86400  # 24 hours
         self.PEER_COUNT = 5
         self.HISTORICAL_YEARS = 5
         self.PROJECTION_YEARS = 5
         self.RISK_FREE_RATE = 0.04  # 4% treasury yield
+        self.MEMO_TTL = 60  # 1 minute in-process memo
+        self._analysis_memo = TTLCache(maxsize=2048, ttl=self.MEMO_TTL)
+        self._inflight = SingleFlight()
 
     async def get_fundamental_analysis(
         self,
         symbol: str
     ) -> FundamentalAnalysis:
-        """Get complete fundamental analysis for a company."""
+        """
+        Get complete fundamental analysis for a company.
+        
+        Results are memoized in-process for MEMO_TTL seconds and concurrent
+        misses for the same symbol share a single pipeline run.
+        """
+        analysis = self._analysis_memo.get(symbol)
+        if analysis is not None:
+            return analysis
+
+        return await self._inflight.do(
+            symbol,
+            lambda: self._memoize_analysis(symbol)
+        )
+
+    async def _memoize_analysis(self, symbol: str) -> FundamentalAnalysis:
+        """Build the analysis and keep it in the in-process memo."""
+        analysis = await self._build_fundamental_analysis(symbol)
+        self._analysis_memo[symbol] = analysis
+        return analysis
+
+    async def _build_fundamental_analysis(
+        self,
+        symbol: str
+    ) -> FundamentalAnalysis:
+        """Build fundamental analysis from Redis, a snapshot or the full pipeline."""
         try:
             # Try to get from cache
             cache_key = f"fundamental:{symbol}"
@@ -42,6 +74,12 @@ class FundamentalService:
             if cached_data:
                 return FundamentalAnalysis(**cached_data)
 
+            # Try the precomputed snapshot before running the pipeline
+            snapshot = await self._get_snapshot(symbol)
+            if snapshot:
+                await redis_client.set_json(cache_key, snapshot, self.CACHE_TTL)
+                return FundamentalAnalysis(**snapshot)
+
             # Get company overview
             overview = await self.market_data.get_company_overview(symbol)
             
@@ -134,12 +172,10 @@ class FundamentalService:
                 key_risks=risks
             )
             
-            # Cache for 1 hour
-            await redis_client.set_json(
-                cache_key,
-                analysis.dict(),
-                self.CACHE_TTL
-            )
+            # Cache for 1 hour and persist the snapshot
+            data = analysis.model_dump(mode="json")
+            await redis_client.set_json(cache_key, data, self.CACHE_TTL)
+            await self._save_snapshot(symbol, data)
             
             return analysis
             
@@ -149,6 +185,43 @@ class FundamentalService:
             )
             raise
 
+    async def _get_snapshot(self, symbol: str) -> Optional[Dict]:
+        """Get the stored analysis for a symbol if it is still fresh."""
+        try:
+            async with get_pool().acquire() as con:
+                return await con.fetchval(
+                    """
+                    SELECT snapshot FROM fundamental_snapshots
+                    WHERE symbol = $1
+                      AND refreshed_at >= now() - $2::interval
+                    """,
+                    symbol,
+                    timedelta(seconds=self.SNAPSHOT_TTL)
+                )
+            
+        except Exception as e:
+            logger.error(f"Error reading fundamental snapshot for {symbol}: {str(e)}")
+            return None
+
+    async def _save_snapshot(self, symbol: str, data: Dict) -> None:
+        """Upsert the stored analysis for a symbol."""
+        try:
+            async with get_pool().acquire() as con:
+                await con.execute(
+                    """
+                    INSERT INTO fundamental_snapshots (symbol, snapshot, refreshed_at)
+                    VALUES ($1, $2, now())
+                    ON CONFLICT (symbol) DO UPDATE
+                    SET snapshot = EXCLUDED.snapshot,
+                        refreshed_at = EXCLUDED.refreshed_at
+                    """,
+                    symbol,
+                    data
+                )
+            
+        except Exception as e:
+            logger.error(f"Error saving fundamental snapshot for {symbol}: {str(e)}")
+
     async def _get_financial_statements(
         self,
         symbol: str
@@ -14,6 +14,7 @@ from app.models.technical import (
     LiquidityAnalysis
 )
 from app.core.redis import redis_client
+from app.core.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +24,29 @@ class LiquidityService:
         self.order_flow = order_flow_service
         self.LIQUIDITY_LEVEL_THRESHOLD = 0.7  # Minimum strength for significant levels
         self.IMPACT_SIZES = [1000, 5000, 10000, 50000, 100000]  # Standard sizes for impact estimation
+        self._inflight = SingleFlight()
 
     async def get_liquidity_analysis(
         self,
         symbol: str,
         timeframe: TimeFrame = TimeFrame.MINUTE
     ) -> LiquidityAnalysis:
-        """Get complete liquidity analysis for a symbol."""
+        """
+        Get complete liquidity analysis for a symbol.
+        
+        Concurrent requests for the same arguments share a single pipeline run.
+        """
+        return await self._inflight.do(
+            (symbol, timeframe),
+            lambda: self._build_liquidity_analysis(symbol, timeframe)
+        )
+
+    async def _build_liquidity_analysis(
+        self,
+        symbol: str,
+        timeframe: TimeFrame
+    ) -> LiquidityAnalysis:
+        """Build liquidity analysis from Redis or the full pipeline."""
         try:
             # Try to get from cache
             cache_key = f"liquidity:{symbol}:{timeframe}"
@@ -76,7 +93,7 @@ class LiquidityService:
             )
             
             # Cache for 1 minute
-            await redis_client.set_json(cache_key, analysis.dict(), 60)
+            await redis_client.set_json(cache_key, analysis.model_dump(mode="json"), 60)
             
             return analysis
             
@@ -89,48 +106,10 @@ class LiquidityService:
         try:
             order_book = await self.market_data.get_order_book(symbol)
             
-            # Calculate metrics
-            bids = {float(k): float(v) for k, v in order_book['bids'].items()}
-            asks = {float(k): float(v) for k, v in order_book['asks'].items()}
-            
-            bid_prices = list(bids.keys())
-            ask_prices = list(asks.keys())
-            best_bid = max(bid_prices)
-            best_ask = min(ask_prices)
-            
-            spread = best_ask - best_bid
-            mid_price = (best_ask + best_bid) / 2
-            
-            # Calculate weighted mid price
-            total_bid_volume = sum(bids.values())
-            total_ask_volume = sum(asks.values())
-            weighted_mid = (
-                (best_bid * total_ask_volume + best_ask * total_bid_volume) /
-                (total_bid_volume + total_ask_volume)
-            )
-            
-            # Calculate depth and imbalance
-            bid_depth = sum(
-                vol for price, vol in bids.items()
-                if price >= best_bid * 0.99  # Within 1% of best bid
-            )
-            ask_depth = sum(
-                vol for price, vol in asks.items()
-                if price <= best_ask * 1.01  # Within 1% of best ask
-            )
-            
-            imbalance = (bid_depth - ask_depth) / (bid_depth + ask_depth)
-            
-            return OrderBookSnapshot(
+            return OrderBookSnapshot.from_dict(
                 timestamp=datetime.utcnow(),
-                bids=bids,
-                asks=asks,
-                bid_depth=float(bid_depth),
-                ask_depth=float(ask_depth),
-                spread=float(spread),
-                mid_price=float(mid_price),
-                weighted_mid_price=float(weighted_mid),
-                imbalance_ratio=float(imbalance)
+                bids={float(k): float(v) for k, v in order_book['bids'].items()},
+                asks={float(k): float(v) for k, v in order_book['asks'].items()}
             )
             
         except Exception as e:
@@ -252,29 +231,7 @@ class LiquidityService:
             
             for size in self.IMPACT_SIZES:
                 for side in ["buy", "sell"]:
-                    book_side = (
-                        order_book.asks if side == "buy"
-                        else order_book.bids
-                    )
-                    
-                    # Calculate impact through order book walking
-                    remaining_size = size
-                    total_cost = 0
-                    max_price = 0
-                    
-                    for price in (
-                        sorted(book_side.keys())
-                        if side == "buy"
-                        else sorted(book_side.keys(), reverse=True)
-                    ):
-                        available = book_side[price]
-                        taken = min(remaining_size, available)
-                        total_cost += taken * price
-                        remaining_size -= taken
-                        max_price = price
-                        
-                        if remaining_size <= 0:
-                            break
+                    total_cost, remaining_size, max_price = order_book.walk(side, size)
                     
                     # Calculate metrics
                     avg_price = total_cost / size
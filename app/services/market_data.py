@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union, Any
+from typing import AsyncIterator, Dict, List, Optional, Union, Any
 import yfinance as yf
 import finnhub
 import requests
@@ -39,6 +39,9 @@ class TimeFrame(Enum):
     WEEK_1 = "1wk"
     MONTH_1 = "1mo"
 
+# Sources stream_historical_data can fetch bars from
+HISTORICAL_SOURCES = frozenset({DataSource.YAHOO, DataSource.FMP})
+
 @dataclass
 class MarketDataConfig:
     cache_times: Dict[str, int] = field(default_factory=dict)
@@ -113,20 +116,7 @@ class MarketDataService:
             elif source == DataSource.FMP:
                 quote = await self._fmp_request(f"quote/{symbol}")
                 if quote and quote[0]:
-                    q = quote[0]
-                    quote_data = {
-                        "symbol": symbol,
-                        "price": q["price"],
-                        "change": q["change"],
-                        "percent_change": q["changesPercentage"],
-                        "high": q["dayHigh"],
-                        "low": q["dayLow"],
-                        "open": q["open"],
-                        "previous_close": q["previousClose"],
-                        "volume": q["volume"],
-                        "market_cap": q["marketCap"],
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
+                    quote_data = self._fmp_quote_data(symbol, quote[0])
 
             if quote_data:
                 await redis_client.cache_market_data(
@@ -141,6 +131,64 @@ class MarketDataService:
             logger.error(f"Error getting quote for {symbol}: {str(e)}")
             return None
 
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get quotes for many symbols, keyed by symbol.
+        
+        Cached quotes are read in one Redis round trip; the rest come from a
+        single FMP batch quote request. Symbols without a quote are left out.
+        """
+        try:
+            symbols = list(dict.fromkeys(symbols))
+            cached = await redis_client.get_market_data_many(
+                [f"quote:{DataSource.FMP.value}:{symbol}" for symbol in symbols]
+            )
+            
+            quotes = {
+                symbol: quote for symbol, quote in zip(symbols, cached) if quote
+            }
+            missing = [symbol for symbol in symbols if symbol not in quotes]
+            if not missing:
+                return quotes
+
+            batch = await self._fmp_request(f"quote/{','.join(missing)}") or []
+            fetched = {
+                q["symbol"]: self._fmp_quote_data(q["symbol"], q)
+                for q in batch if q and q.get("symbol") in missing
+            }
+            
+            if fetched:
+                await redis_client.cache_market_data_many(
+                    {
+                        f"quote:{DataSource.FMP.value}:{symbol}": quote
+                        for symbol, quote in fetched.items()
+                    },
+                    self.config.cache_times["quote"]
+                )
+            
+            quotes.update(fetched)
+            return quotes
+
+        except Exception as e:
+            logger.error(f"Error getting quotes for {symbols}: {str(e)}")
+            return {}
+
+    def _fmp_quote_data(self, symbol: str, q: Dict) -> Dict:
+        """Convert an FMP quote to the common quote format."""
+        return {
+            "symbol": symbol,
+            "price": q["price"],
+            "change": q["change"],
+            "percent_change": q["changesPercentage"],
+            "high": q["dayHigh"],
+            "low": q["dayLow"],
+            "open": q["open"],
+            "previous_close": q["previousClose"],
+            "volume": q["volume"],
+            "market_cap": q["marketCap"],
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
     async def get_historical_data(
         self,
         symbol: str,
@@ -153,70 +201,94 @@ class MarketDataService:
             interval = self._convert_timeframe(timeframe)
             period = "1mo"  # Default to 1 month for timeframe-based queries
             
-            cache_key = f"historical:{source.value}:{symbol}:{period}:{interval}"
-            cached_data = await redis_client.get_market_data(cache_key)
-            if cached_data:
-                return cached_data
-
-            historical_data = None
-            if source == DataSource.YAHOO:
-                loop = asyncio.get_event_loop()
-                ticker = await loop.run_in_executor(
-                    self._executor,
-                    lambda: yf.Ticker(symbol)
-                )
-                
-                hist = await loop.run_in_executor(
-                    self._executor,
-                    lambda: ticker.history(period=period, interval=interval)
-                )
-                
-                if not hist.empty:
-                    historical_data = []
-                    for index, row in hist.iterrows():
-                        data_point = {
-                            "timestamp": index.isoformat(),
-                            "open": float(row["Open"]),
-                            "high": float(row["High"]),
-                            "low": float(row["Low"]),
-                            "close": float(row["Close"]),
-                            "volume": int(row["Volume"])
-                        }
-                        historical_data.append(data_point)
-
-            elif source == DataSource.FMP:
-                # Convert period to FMP format
-                if period.endswith('d'):
-                    days = int(period[:-1])
-                    fmp_period = f"{days}min" if interval.endswith('m') else "1hour"
-                    endpoint = f"historical-chart/{fmp_period}/{symbol}"
-                else:
-                    endpoint = f"historical-price-full/{symbol}"
-                
-                hist = await self._fmp_request(endpoint)
-                if hist and "historical" in hist:
-                    historical_data = []
-                    for item in hist["historical"]:
-                        data_point = {
-                            "timestamp": item["date"],
-                            "open": float(item["open"]),
-                            "high": float(item["high"]),
-                            "low": float(item["low"]),
-                            "close": float(item["close"]),
-                            "volume": int(item["volume"])
-                        }
-                        historical_data.append(data_point)
-
-            if historical_data:
-                cache_time = self.config.cache_times["intraday"] if interval.endswith('m') else self.config.cache_times["daily"]
-                await redis_client.cache_market_data(cache_key, historical_data, cache_time)
-                return historical_data
-            return None
+            historical_data = []
+            async for page in self.stream_historical_data(symbol, period, interval, source):
+                historical_data.extend(page)
+            return historical_data or None
 
         except Exception as e:
             logger.error(f"Error getting historical data for {symbol}: {str(e)}")
             raise Exception(f"Failed to get historical data: {str(e)}")
 
+    async def stream_historical_data(
+        self,
+        symbol: str,
+        period: str = "1mo",
+        interval: str = "1d",
+        source: DataSource = DataSource.YAHOO,
+        page_size: int = 1000
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Yield historical price and volume data in pages of up to page_size bars.
+        
+        Bars are converted page by page so callers can start sending before
+        the whole series is built; the full series is still cached at the end.
+        Raises ValueError for a source without historical bars.
+        """
+        if source not in HISTORICAL_SOURCES:
+            raise ValueError(f"Historical data is not available from {source.value}")
+
+        cache_key = f"historical:{source.value}:{symbol}:{period}:{interval}"
+        cached_data = await redis_client.get_market_data(cache_key)
+        if cached_data:
+            for start in range(0, len(cached_data), page_size):
+                yield cached_data[start:start + page_size]
+            return
+
+        historical_data = []
+        if source == DataSource.YAHOO:
+            loop = asyncio.get_event_loop()
+            hist = await loop.run_in_executor(
+                self._executor,
+                lambda: yf.Ticker(symbol).history(period=period, interval=interval)
+            )
+            
+            for start in range(0, len(hist), page_size):
+                chunk = hist.iloc[start:start + page_size]
+                page = [
+                    {
+                        "timestamp": index.isoformat(),
+                        "open": float(row.Open),
+                        "high": float(row.High),
+                        "low": float(row.Low),
+                        "close": float(row.Close),
+                        "volume": int(row.Volume)
+                    }
+                    for index, row in zip(chunk.index, chunk.itertuples(index=False))
+                ]
+                historical_data.extend(page)
+                yield page
+
+        elif source == DataSource.FMP:
+            # Convert period to FMP format
+            if period.endswith('d'):
+                days = int(period[:-1])
+                fmp_period = f"{days}min" if interval.endswith('m') else "1hour"
+                endpoint = f"historical-chart/{fmp_period}/{symbol}"
+            else:
+                endpoint = f"historical-price-full/{symbol}"
+            
+            hist = await self._fmp_request(endpoint)
+            items = hist.get("historical", []) if hist else []
+            for start in range(0, len(items), page_size):
+                page = [
+                    {
+                        "timestamp": item["date"],
+                        "open": float(item["open"]),
+                        "high": float(item["high"]),
+                        "low": float(item["low"]),
+                        "close": float(item["close"]),
+                        "volume": int(item["volume"])
+                    }
+                    for item in items[start:start + page_size]
+                ]
+                historical_data.extend(page)
+                yield page
+
+        if historical_data:
+            cache_time = self.config.cache_times["intraday"] if interval.endswith('m') else self.config.cache_times["daily"]
+            await redis_client.cache_market_data(cache_key, historical_data, cache_time)
+
     def _convert_timeframe(self, timeframe: TimeFrame) -> str:
         """Convert TimeFrame enum to yfinance interval string."""
         mapping = {
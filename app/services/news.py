@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 import aiohttp
 import asyncio
 from datetime import datetime, timedelta
@@ -67,8 +67,8 @@ class NewsService:
         self.config = NewsConfig()
         self.sia = SentimentIntensityAnalyzer()
         self.stop_words = set(stopwords.words('english'))
-        self._known_tickers: Set[str] = set()
-        self._penny_tickers: Set[str] = set()
+        self._known_tickers: FrozenSet[str] = frozenset()
+        self._penny_tickers: FrozenSet[str] = frozenset()
         self._executor = ThreadPoolExecutor(max_workers=10)
         self.yahoo_news_tool = YahooFinanceNewsTool()
         self.sec_api = QueryApi(api_key=settings.SEC_API_KEY)
@@ -88,8 +88,8 @@ class NewsService:
             cached_penny_tickers = await redis_client.get_market_data("penny_tickers")
             
             if cached_tickers and cached_penny_tickers:
-                self._known_tickers = set(cached_tickers)
-                self._penny_tickers = set(cached_penny_tickers)
+                self._known_tickers = frozenset(cached_tickers)
+                self._penny_tickers = frozenset(cached_penny_tickers)
                 return
 
             tickers = set()
@@ -129,8 +129,8 @@ class NewsService:
             if regular_stocks:
                 tickers.update(s['symbol'] for s in regular_stocks)
 
-            self._known_tickers = tickers
-            self._penny_tickers = penny_tickers
+            self._known_tickers = frozenset(tickers)
+            self._penny_tickers = frozenset(penny_tickers)
             
             await redis_client.cache_market_data("known_tickers", list(tickers), 86400)
             await redis_client.cache_market_data("penny_tickers", list(penny_tickers), 86400)
@@ -205,6 +205,17 @@ class NewsService:
 
         return mentions
 
+    def normalize_tickers(self, tickers: Iterable[str]) -> FrozenSet[str]:
+        """
+        Uppercase tickers and drop any outside the known ticker universe.
+        
+        Tickers pass through unfiltered if the universe failed to load.
+        """
+        normalized = frozenset(t.upper() for t in tickers)
+        if not self._known_tickers:
+            return normalized
+        return normalized & self._known_tickers
+
     def _is_penny_stock(self, symbol: str) -> bool:
         """Check if a stock is a penny stock."""
         return symbol in self._penny_tickers
@@ -6,7 +6,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import httpx
 from jinja2 import Environment, PackageLoader, select_autoescape
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.core.config import get_settings
@@ -17,6 +18,7 @@ from app.models.notification import (
     DBNotification
 )
 from app.core.redis import redis_client
+from app.db.supabase import get_supabase_client
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -39,7 +41,7 @@ class NotificationService:
 
     async def send_notification(
         self,
-        db: Session,
+        db: AsyncSession,
         user_id: UUID,
         type: NotificationType,
         title: str,
@@ -60,15 +62,14 @@ class NotificationService:
                 status=NotificationStatus.PENDING
             )
             db.add(notification)
-            db.commit()
-            db.refresh(notification)
+            await db.commit()
 
             # Get user preferences
             user_prefs = await self._get_user_notification_preferences(user_id)
             if not user_prefs.get(type.value, {}).get('enabled', True):
                 notification.status = NotificationStatus.SKIPPED
                 notification.error = "Notification type disabled by user"
-                db.commit()
+                await db.commit()
                 return notification
 
             # Send notification
@@ -90,11 +91,11 @@ class NotificationService:
                 if not success:
                     notification.error = "Delivery failed"
                 
-                db.commit()
+                await db.commit()
             else:
                 notification.status = NotificationStatus.FAILED
                 notification.error = f"No handler for notification type: {type}"
-                db.commit()
+                await db.commit()
 
             return notification
 
@@ -103,49 +104,110 @@ class NotificationService:
             if notification:
                 notification.status = NotificationStatus.FAILED
                 notification.error = str(e)
-                db.commit()
+                await db.commit()
             return notification
 
     async def get_notifications(
         self,
-        db: Session,
+        db: AsyncSession,
         user_id: UUID,
         skip: int = 0,
         limit: int = 50,
-        status: Optional[NotificationStatus] = None
+        status: Optional[NotificationStatus] = None,
+        data_filter: Optional[Dict[str, Any]] = None
     ) -> List[DBNotification]:
-        """Get notifications for a user."""
-        query = db.query(DBNotification).filter(
+        """Get notifications for a user, optionally matching payload fields."""
+        query = select(DBNotification).where(
             DBNotification.user_id == user_id
         )
         
         if status:
-            query = query.filter(DBNotification.status == status)
+            query = query.where(DBNotification.status == status)
+        if data_filter:
+            # data @> filter, served by the jsonb_path_ops GIN index
+            query = query.where(DBNotification.data.contains(data_filter))
         
-        return query.order_by(
-            DBNotification.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        result = await db.execute(
+            query.order_by(
+                DBNotification.created_at.desc()
+            ).offset(skip).limit(limit)
+        )
+        return result.scalars().all()
 
     async def mark_as_read(
         self,
-        db: Session,
+        db: AsyncSession,
         notification_id: UUID,
         user_id: UUID
     ) -> bool:
         """Mark a notification as read."""
-        notification = db.query(DBNotification).filter(
-            DBNotification.id == notification_id,
-            DBNotification.user_id == user_id
-        ).first()
+        result = await db.execute(
+            select(DBNotification).where(
+                DBNotification.id == notification_id,
+                DBNotification.user_id == user_id
+            )
+        )
+        notification = result.scalars().first()
         
         if not notification:
             return False
         
         notification.read = True
         notification.read_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
         return True
 
+    async def mark_all_as_read_bulk(
+        self,
+        db: AsyncSession,
+        user_id: UUID
+    ) -> List[UUID]:
+        """
+        Mark all unread notifications for a user as read in one UPDATE.
+        
+        Publishes a single notifications.bulk_read event with the affected
+        IDs and returns them.
+        """
+        result = await db.execute(
+            update(DBNotification)
+            .where(
+                DBNotification.user_id == user_id,
+                DBNotification.read == False
+            )
+            .values(read=True, read_at=datetime.utcnow())
+            .returning(DBNotification.id)
+            .execution_options(synchronize_session=False)
+        )
+        notification_ids = result.scalars().all()
+        await db.commit()
+        
+        if notification_ids:
+            await redis_client.delete(f"unread_count:{user_id}")
+            await redis_client.publish(
+                f"notifications:{user_id}",
+                {
+                    "event": "notifications.bulk_read",
+                    "notification_ids": [str(i) for i in notification_ids]
+                }
+            )
+        
+        return notification_ids
+
+    async def get_unread_count(
+        self,
+        db: AsyncSession,
+        user_id: UUID
+    ) -> int:
+        """Count unread notifications for a user without loading them."""
+        # "read == False" compiles to the literal read = false, which matches
+        # the ix_notifications_unread partial index predicate
+        return await db.scalar(
+            select(func.count(DBNotification.id)).where(
+                DBNotification.user_id == user_id,
+                DBNotification.read == False
+            )
+        )
+
     async def _get_user_notification_preferences(self, user_id: UUID) -> dict:
         """Get user's notification preferences from cache or database."""
         cache_key = f"notification_prefs:{user_id}"
@@ -355,7 +417,7 @@ class NotificationService:
         """Fetch user profile from database."""
         try:
             # Get user profile from Supabase
-            response = await supabase_client.table('user_profiles').select(
+            response = await get_supabase_client().table('user_profiles').select(
                 'phone_number',
                 'push_tokens',
                 'email',
@@ -380,7 +442,7 @@ class NotificationService:
                 return int(count)
 
             # Get from database
-            response = await supabase_client.table('notifications').select(
+            response = await get_supabase_client().table('notifications').select(
                 'id',
                 count='exact'
             ).eq('user_id', str(user_id)).eq('read', False).execute()
@@ -10,10 +10,14 @@ from app.models.technical import (
     TimeFrame,
     OptionContract,
     OptionFlow,
+    OptionFlowRing,
+    FLOW_BLOCK,
+    FLOW_SWEEP,
     StrikeAnalysis,
     ExpiryAnalysis,
     OptionsFlowAnalysis
 )
+from app.core.exceptions import UpstreamDataError
 from app.core.redis import redis_client
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,7 @@ class OptionsFlowService:
         self.market_data = market_data_service
         self.BLOCK_TRADE_THRESHOLD = 100  # contracts
         self.UNUSUAL_VOLUME_THRESHOLD = 2.0  # std deviations
+        self.RECENT_FLOWS_CAPACITY = 100  # flows kept in recent_flows
         self.IV_HISTORY_DAYS = 252  # 1 trading year
 
     async def get_options_flow_analysis(
@@ -58,7 +63,7 @@ class OptionsFlowService:
             
             # Process flows into DataFrame for analysis
             df = pd.DataFrame([
-                {**f.dict(), **f.contract.dict()}
+                {**f.model_dump(), **f.contract.model_dump()}
                 for f in flows
             ])
             
@@ -68,8 +73,14 @@ class OptionsFlowService:
             # Analyze by expiry
             expiries = await self._analyze_expiries(df, chain)
             
+            # Pack flows once; both flow lists are taken from these columns
+            packed = OptionFlowRing(capacity=len(flows))
+            packed.extend(flows)
+            recent = OptionFlowRing(capacity=self.RECENT_FLOWS_CAPACITY)
+            recent.extend(flows[-self.RECENT_FLOWS_CAPACITY:])
+            
             # Find unusual activity
-            unusual = self._detect_unusual_activity(df, flows)
+            unusual = self._detect_unusual_activity(packed)
             
             # Calculate sentiment metrics
             sentiment = self._calculate_sentiment_metrics(df)
@@ -93,11 +104,7 @@ class OptionsFlowService:
                 ),
                 implied_volatility_rank=iv_metrics['rank'],
                 implied_volatility_percentile=iv_metrics['percentile'],
-                recent_flows=sorted(
-                    flows,
-                    key=lambda x: x.timestamp,
-                    reverse=True
-                )[:100],
+                recent_flows=recent,
                 expiries=expiries,
                 unusual_activity=unusual,
                 bullish_flow_ratio=sentiment['bullish_ratio'],
@@ -114,7 +121,7 @@ class OptionsFlowService:
             )
             
             # Cache for 30 seconds
-            await redis_client.set_json(cache_key, analysis.dict(), 30)
+            await redis_client.set_json(cache_key, analysis.model_dump(mode="json"), 30)
             
             return analysis
             
@@ -122,7 +129,7 @@ class OptionsFlowService:
             logger.error(
                 f"Error analyzing options flow for {symbol}: {str(e)}"
             )
-            raise
+            raise UpstreamDataError(f"Error analyzing options flow for {symbol}") from e
 
     async def _get_options_chain(
         self,
@@ -248,7 +255,7 @@ class OptionsFlowService:
             expiries = []
             
             # Group by expiry
-            chain_df = pd.DataFrame([c.dict() for c in chain])
+            chain_df = pd.DataFrame([c.model_dump() for c in chain])
             for expiry, group in chain_df.groupby('expiry'):
                 # Calculate volumes and OI
                 call_data = group[group['type'] == 'call']
@@ -440,40 +447,28 @@ class OptionsFlowService:
 
     def _detect_unusual_activity(
         self,
-        flows_df: pd.DataFrame,
-        flows: List[OptionFlow]
-    ) -> List[OptionFlow]:
-        """Detect unusual options activity."""
+        flows: OptionFlowRing
+    ) -> OptionFlowRing:
+        """Detect unusual options activity, largest premium first."""
         try:
-            unusual = []
-            
             # Calculate volume Z-scores
-            volume_mean = flows_df['size'].mean()
-            volume_std = flows_df['size'].std()
-            
-            for flow in flows:
-                # Check if volume is unusual
-                if volume_std > 0:
-                    z_score = (
-                        flow.size - volume_mean
-                    ) / volume_std
-                    
-                    if (
-                        abs(z_score) >= self.UNUSUAL_VOLUME_THRESHOLD or
-                        flow.is_block or
-                        flow.is_sweep
-                    ):
-                        unusual.append(flow)
-            
-            return sorted(
-                unusual,
-                key=lambda x: x.premium,
-                reverse=True
+            sizes = flows.column("sizes")
+            volume_std = sizes.std(ddof=1) if len(sizes) > 1 else 0.0
+            if not volume_std > 0:
+                return flows.filter(np.empty(0, dtype=np.intp))
+            z_scores = (sizes - sizes.mean()) / volume_std
+            
+            side_flags = flows.column("side_flags")
+            unusual = np.flatnonzero(
+                (np.abs(z_scores) >= self.UNUSUAL_VOLUME_THRESHOLD)
+                | (side_flags & (FLOW_BLOCK | FLOW_SWEEP) != 0)
             )
+            premiums = flows.column("premiums")[unusual]
+            return flows.filter(unusual[np.argsort(-premiums, kind="stable")])
             
         except Exception as e:
             logger.error(f"Error detecting unusual activity: {str(e)}")
-            return []
+            return flows.filter(np.empty(0, dtype=np.intp))
 
     def _calculate_sentiment_metrics(
         self,
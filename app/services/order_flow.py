@@ -6,11 +6,16 @@ import logging
 
 from app.services.market_data import market_data_service
 from app.models.technical import (
+    FLAG_AGGRESSIVE,
+    FLAG_BLOCK,
+    SIDE_BUY,
+    SIDE_SELL,
     TimeFrame,
-    OrderFlowTrade,
+    OrderFlowTradeBatch,
     OrderFlowImbalance,
     OrderFlowAnalysis
 )
+from app.core.exceptions import UpstreamDataError
 from app.core.redis import redis_client
 
 logger = logging.getLogger(__name__)
@@ -45,14 +50,20 @@ class OrderFlowService:
             if trades_data.empty:
                 raise ValueError(f"No trade data available for {symbol}")
 
+            # Calculate large trade threshold
+            volume_threshold = float(np.percentile(
+                trades_data['volume'],
+                self.LARGE_TRADE_PERCENTILE
+            ))
+            
             # Process trades
-            trades = self._process_trades(trades_data)
+            trades = self._process_trades(trades_data, volume_threshold)
             
             # Calculate imbalances
             imbalances = self._calculate_imbalances(trades_data)
             
             # Calculate metrics
-            metrics = self._calculate_metrics(trades_data)
+            metrics = self._calculate_metrics(trades, volume_threshold)
             
             # Create analysis
             analysis = OrderFlowAnalysis(
@@ -66,42 +77,39 @@ class OrderFlowService:
             )
             
             # Cache for 1 minute (trade data updates frequently)
-            await redis_client.set_json(cache_key, analysis.dict(), 60)
+            await redis_client.set_json(cache_key, analysis.model_dump(mode="json"), 60)
             
             return analysis
             
         except Exception as e:
             logger.error(f"Error analyzing order flow for {symbol}: {str(e)}")
-            raise
+            raise UpstreamDataError(f"Error analyzing order flow for {symbol}") from e
 
-    def _process_trades(self, trades_data: pd.DataFrame) -> List[OrderFlowTrade]:
-        """Process raw trade data into OrderFlowTrade objects."""
+    def _process_trades(
+        self,
+        trades_data: pd.DataFrame,
+        volume_threshold: float
+    ) -> OrderFlowTradeBatch:
+        """Pack raw trade data into an OrderFlowTradeBatch, column by column."""
         try:
-            trades = []
-            
-            # Calculate large trade threshold
-            volume_threshold = np.percentile(
-                trades_data['volume'],
-                self.LARGE_TRADE_PERCENTILE
+            volumes = trades_data['volume'].to_numpy(dtype=np.float64)
+            aggressive = trades_data['is_aggressive'].to_numpy(dtype=bool)
+            
+            return OrderFlowTradeBatch.model_construct(
+                timestamps=pd.to_datetime(
+                    trades_data['timestamp'], utc=True
+                ).dt.as_unit('ns').astype('int64').to_numpy(),
+                prices=trades_data['price'].to_numpy(dtype=np.float64),
+                volumes=volumes,
+                sides=np.where(
+                    trades_data['side'].to_numpy() == 'sell', SIDE_SELL, SIDE_BUY
+                ).astype(np.uint8),
+                flags=(
+                    np.where(aggressive, FLAG_AGGRESSIVE, 0)
+                    | np.where(volumes >= volume_threshold, FLAG_BLOCK, 0)
+                ).astype(np.uint8)
             )
             
-            for _, row in trades_data.iterrows():
-                trade = OrderFlowTrade(
-                    timestamp=row['timestamp'],
-                    price=float(row['price']),
-                    volume=float(row['volume']),
-                    side=row['side'],
-                    is_aggressive=row['is_aggressive'],
-                    is_block_trade=row['volume'] >= volume_threshold,
-                    metadata={
-                        "exchange": row.get('exchange'),
-                        "trade_id": row.get('trade_id')
-                    }
-                )
-                trades.append(trade)
-            
-            return trades
-            
         except Exception as e:
             logger.error(f"Error processing trades: {str(e)}")
             raise
@@ -170,42 +178,33 @@ class OrderFlowService:
             logger.error(f"Error calculating imbalances: {str(e)}")
             raise
 
-    def _calculate_metrics(self, trades_data: pd.DataFrame) -> Dict:
-        """Calculate overall order flow metrics."""
+    def _calculate_metrics(
+        self,
+        trades: OrderFlowTradeBatch,
+        volume_threshold: float
+    ) -> Dict:
+        """Calculate overall order flow metrics with vectorized passes."""
         try:
+            volumes = trades.volumes
+            is_buy = trades.sides == SIDE_BUY
+            is_aggressive = (trades.flags & FLAG_AGGRESSIVE) != 0
+            
             # Calculate volume metrics
-            total_volume = trades_data['volume'].sum()
-            buy_volume = trades_data[
-                trades_data['side'] == 'buy'
-            ]['volume'].sum()
-            sell_volume = trades_data[
-                trades_data['side'] == 'sell'
-            ]['volume'].sum()
+            total_volume = volumes.sum()
+            buy_volume = volumes[is_buy].sum()
+            sell_volume = total_volume - buy_volume
+            volume_delta = np.where(is_buy, volumes, -volumes).cumsum()
             
             # Calculate aggressive trade metrics
-            aggressive_trades = trades_data[trades_data['is_aggressive']]
-            aggressive_buy = aggressive_trades[
-                aggressive_trades['side'] == 'buy'
-            ]['volume'].sum()
-            aggressive_sell = aggressive_trades[
-                aggressive_trades['side'] == 'sell'
-            ]['volume'].sum()
-            
-            # Calculate block trade metrics
-            volume_threshold = np.percentile(
-                trades_data['volume'],
-                self.LARGE_TRADE_PERCENTILE
-            )
-            block_trades = trades_data[
-                trades_data['volume'] >= volume_threshold
-            ]
+            aggressive_buy = volumes[is_aggressive & is_buy].sum()
+            aggressive_sell = volumes[is_aggressive & ~is_buy].sum()
             
             metrics = {
-                "cumulative_volume_delta": float(buy_volume - sell_volume),
+                "cumulative_volume_delta": float(volume_delta[-1]),
                 "buy_volume_ratio": float(buy_volume / total_volume),
                 "sell_volume_ratio": float(sell_volume / total_volume),
-                "large_trade_threshold": float(volume_threshold),
-                "block_trade_count": len(block_trades),
+                "large_trade_threshold": volume_threshold,
+                "block_trade_count": int(np.count_nonzero(trades.flags & FLAG_BLOCK)),
                 "aggressive_buy_ratio": float(
                     aggressive_buy / buy_volume if buy_volume > 0 else 0
                 ),
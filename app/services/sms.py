@@ -1,5 +1,6 @@
 from typing import Optional
 import logging
+import re
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 
@@ -8,6 +9,8 @@ from app.core.config import get_settings
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+_NON_DIGITS = re.compile(r"\D")
+
 class SMSService:
     def __init__(self):
         self.client = Client(
@@ -68,7 +71,7 @@ class SMSService:
     def _clean_phone_number(self, phone_number: str) -> str:
         """Clean phone number to E.164 format."""
         # Remove any non-digit characters
-        cleaned = ''.join(filter(str.isdigit, phone_number))
+        cleaned = _NON_DIGITS.sub("", phone_number)
         
         # Add country code if missing
         if len(cleaned) == 10:  # US number without country code
@@ -85,7 +88,7 @@ class SMSService:
             return False
             
         # Should have between 10 and 15 digits
-        digits = ''.join(filter(str.isdigit, phone_number))
+        digits = _NON_DIGITS.sub("", phone_number)
         if not (10 <= len(digits) <= 15):
             return False
             
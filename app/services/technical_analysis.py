@@ -1,4 +1,5 @@
 from typing import List, Dict, Optional, Union, Tuple
+import asyncio
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -8,6 +9,7 @@ from uuid import UUID
 
 from app.services.market_data import market_data_service
 from app.core.redis import redis_client
+from app.utils.indicators import batch_close_indicators, stack_series
 from app.models.technical import (
     TechnicalIndicator,
     Pattern,
@@ -47,45 +49,55 @@ class TechnicalAnalysisService:
             if data.empty:
                 return {}
 
-            # Calculate indicators
-            indicators = {
-                # Trend Indicators
-                "sma_20": self._calculate_sma(data, 20),
-                "sma_50": self._calculate_sma(data, 50),
-                "sma_200": self._calculate_sma(data, 200),
-                "ema_12": self._calculate_ema(data, 12),
-                "ema_26": self._calculate_ema(data, 26),
-                "macd": self._calculate_macd(data),
-                "adx": self._calculate_adx(data),
-                
-                # Momentum Indicators
-                "rsi": self._calculate_rsi(data),
-                "stoch": self._calculate_stochastic(data),
-                "cci": self._calculate_cci(data),
-                "williams_r": self._calculate_williams_r(data),
-                
-                # Volume Indicators
-                "obv": self._calculate_obv(data),
-                "mfi": self._calculate_mfi(data),
-                "vwap": self._calculate_vwap(data),
-                
-                # Volatility Indicators
-                "bollinger_bands": self._calculate_bollinger_bands(data),
-                "atr": self._calculate_atr(data),
-                
-                # Trend Direction
-                "trend": self._determine_trend(data),
-                
-                # Support/Resistance
-                "support_resistance": self._calculate_support_resistance(data)
-            }
-            
-            return indicators
+            return self._compute_indicators(data)
             
         except Exception as e:
             logger.error(f"Error calculating technical indicators for {symbol}: {str(e)}")
             return {}
 
+    async def get_indicators_batch(
+        self,
+        symbols: List[str],
+        timeframe: TimeFrame = TimeFrame.DAILY,
+        lookback_periods: int = 100
+    ) -> Dict[str, Dict]:
+        """
+        Calculate core close-based indicators for many symbols at once.
+        
+        Histories are fetched concurrently and run through a single compiled
+        kernel, so its one-off compile cost is shared by the whole batch.
+        Symbols without data are left out of the result.
+        """
+        frames = await asyncio.gather(*[
+            self._get_historical_data(symbol, timeframe, lookback_periods)
+            for symbol in symbols
+        ])
+        loaded = [
+            (symbol, data) for symbol, data in zip(symbols, frames)
+            if not data.empty
+        ]
+        if not loaded:
+            return {}
+
+        values, offsets = stack_series(
+            [data['close'].to_numpy(dtype=np.float64) for _, data in loaded]
+        )
+        table = batch_close_indicators(values, offsets)
+        
+        return {
+            symbol: {
+                "sma_20": row[0],
+                "sma_50": row[1],
+                "rsi": row[2],
+                "bollinger_bands": {
+                    "upper": row[3],
+                    "middle": row[4],
+                    "lower": row[5]
+                }
+            }
+            for (symbol, _), row in zip(loaded, table.tolist())
+        }
+
     async def get_patterns(
         self,
         symbol: str,
@@ -99,29 +111,7 @@ class TechnicalAnalysisService:
             if data.empty:
                 return []
 
-            patterns = []
-            for pattern_name, pattern_func in self._pattern_functions.items():
-                # Calculate pattern
-                pattern_values = pattern_func(
-                    data['open'].values,
-                    data['high'].values,
-                    data['low'].values,
-                    data['close'].values
-                )
-                
-                # Find where pattern occurs
-                pattern_dates = data.index[pattern_values != 0]
-                pattern_signals = pattern_values[pattern_values != 0]
-                
-                for date, signal in zip(pattern_dates, pattern_signals):
-                    patterns.append({
-                        "pattern": pattern_name,
-                        "date": date,
-                        "signal": "bullish" if signal > 0 else "bearish",
-                        "strength": abs(signal)
-                    })
-            
-            return sorted(patterns, key=lambda x: x['date'], reverse=True)
+            return self._detect_patterns(data)
             
         except Exception as e:
             logger.error(f"Error detecting patterns for {symbol}: {str(e)}")
@@ -139,62 +129,157 @@ class TechnicalAnalysisService:
             if not indicators:
                 return []
 
-            signals = []
+            return self._compute_signals(indicators, timeframe)
             
-            # Trend Signals
-            if self._is_golden_cross(indicators):
-                signals.append(Signal(
-                    type="GOLDEN_CROSS",
-                    direction=TrendDirection.BULLISH,
-                    strength=SignalStrength.STRONG,
-                    timeframe=timeframe
-                ))
-                
-            if self._is_death_cross(indicators):
-                signals.append(Signal(
-                    type="DEATH_CROSS",
-                    direction=TrendDirection.BEARISH,
-                    strength=SignalStrength.STRONG,
-                    timeframe=timeframe
-                ))
-
-            # Momentum Signals
-            if self._is_oversold(indicators):
-                signals.append(Signal(
-                    type="OVERSOLD",
-                    direction=TrendDirection.BULLISH,
-                    strength=SignalStrength.MEDIUM,
-                    timeframe=timeframe
-                ))
-                
-            if self._is_overbought(indicators):
-                signals.append(Signal(
-                    type="OVERBOUGHT",
-                    direction=TrendDirection.BEARISH,
-                    strength=SignalStrength.MEDIUM,
-                    timeframe=timeframe
-                ))
-
-            # MACD Signals
-            macd_signal = self._get_macd_signal(indicators)
-            if macd_signal:
-                signals.append(macd_signal)
-
-            # Volume Signals
-            volume_signal = self._get_volume_signal(indicators)
-            if volume_signal:
-                signals.append(volume_signal)
+        except Exception as e:
+            logger.error(f"Error generating signals for {symbol}: {str(e)}")
+            return []
 
-            # Bollinger Band Signals
-            bb_signal = self._get_bollinger_signal(indicators)
-            if bb_signal:
-                signals.append(bb_signal)
+    async def get_full_analysis(
+        self,
+        symbol: str,
+        timeframe: TimeFrame = TimeFrame.DAILY,
+        lookback_periods: int = 100
+    ) -> Dict[str, Union[Dict, List]]:
+        """
+        Get indicators, signals and patterns for a symbol.
+        
+        Price history is loaded once and shared by all three computations,
+        instead of once per get_technical_indicators/get_signals/get_patterns.
+        """
+        try:
+            data = await self._get_historical_data(symbol, timeframe, lookback_periods)
+            if data.empty:
+                return {"indicators": {}, "signals": [], "patterns": []}
 
-            return signals
+            indicators = self._compute_indicators(data)
+            
+            return {
+                "indicators": indicators,
+                "signals": self._compute_signals(indicators, timeframe),
+                "patterns": self._detect_patterns(data)
+            }
             
         except Exception as e:
-            logger.error(f"Error generating signals for {symbol}: {str(e)}")
-            return []
+            logger.error(f"Error running technical analysis for {symbol}: {str(e)}")
+            return {"indicators": {}, "signals": [], "patterns": []}
+
+    def _compute_indicators(self, data: pd.DataFrame) -> Dict[str, Union[float, str]]:
+        """Calculate all technical indicators from price history."""
+        return {
+            # Trend Indicators
+            "sma_20": self._calculate_sma(data, 20),
+            "sma_50": self._calculate_sma(data, 50),
+            "sma_200": self._calculate_sma(data, 200),
+            "ema_12": self._calculate_ema(data, 12),
+            "ema_26": self._calculate_ema(data, 26),
+            "macd": self._calculate_macd(data),
+            "adx": self._calculate_adx(data),
+            
+            # Momentum Indicators
+            "rsi": self._calculate_rsi(data),
+            "stoch": self._calculate_stochastic(data),
+            "cci": self._calculate_cci(data),
+            "williams_r": self._calculate_williams_r(data),
+            
+            # Volume Indicators
+            "obv": self._calculate_obv(data),
+            "mfi": self._calculate_mfi(data),
+            "vwap": self._calculate_vwap(data),
+            
+            # Volatility Indicators
+            "bollinger_bands": self._calculate_bollinger_bands(data),
+            "atr": self._calculate_atr(data),
+            
+            # Trend Direction
+            "trend": self._determine_trend(data),
+            
+            # Support/Resistance
+            "support_resistance": self._calculate_support_resistance(data)
+        }
+
+    def _detect_patterns(self, data: pd.DataFrame) -> List[Dict[str, Union[str, datetime, float]]]:
+        """Detect candlestick patterns in price history, newest first."""
+        open_, high, low, close = (
+            data['open'].values,
+            data['high'].values,
+            data['low'].values,
+            data['close'].values
+        )
+        
+        patterns = []
+        for pattern_name, pattern_func in self._pattern_functions.items():
+            # Calculate pattern
+            pattern_values = pattern_func(open_, high, low, close)
+            
+            # Find where pattern occurs
+            pattern_dates = data.index[pattern_values != 0]
+            pattern_signals = pattern_values[pattern_values != 0]
+            
+            for date, signal in zip(pattern_dates, pattern_signals):
+                patterns.append({
+                    "pattern": pattern_name,
+                    "date": date,
+                    "signal": "bullish" if signal > 0 else "bearish",
+                    "strength": abs(signal)
+                })
+        
+        return sorted(patterns, key=lambda x: x['date'], reverse=True)
+
+    def _compute_signals(self, indicators: Dict, timeframe: TimeFrame) -> List[Signal]:
+        """Generate trading signals from calculated indicators."""
+        signals = []
+        
+        # Trend Signals
+        if self._is_golden_cross(indicators):
+            signals.append(Signal(
+                type="GOLDEN_CROSS",
+                direction=TrendDirection.BULLISH,
+                strength=SignalStrength.STRONG,
+                timeframe=timeframe
+            ))
+            
+        if self._is_death_cross(indicators):
+            signals.append(Signal(
+                type="DEATH_CROSS",
+                direction=TrendDirection.BEARISH,
+                strength=SignalStrength.STRONG,
+                timeframe=timeframe
+            ))
+
+        # Momentum Signals
+        if self._is_oversold(indicators):
+            signals.append(Signal(
+                type="OVERSOLD",
+                direction=TrendDirection.BULLISH,
+                strength=SignalStrength.MEDIUM,
+                timeframe=timeframe
+            ))
+            
+        if self._is_overbought(indicators):
+            signals.append(Signal(
+                type="OVERBOUGHT",
+                direction=TrendDirection.BEARISH,
+                strength=SignalStrength.MEDIUM,
+                timeframe=timeframe
+            ))
+
+        # MACD Signals
+        macd_signal = self._get_macd_signal(indicators)
+        if macd_signal:
+            signals.append(macd_signal)
+
+        # Volume Signals
+        volume_signal = self._get_volume_signal(indicators)
+        if volume_signal:
+            signals.append(volume_signal)
+
+        # Bollinger Band Signals
+        bb_signal = self._get_bollinger_signal(indicators)
+        if bb_signal:
+            signals.append(bb_signal)
+
+        return signals
 
     async def _get_historical_data(
         self,
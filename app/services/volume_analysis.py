@@ -1,12 +1,14 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
 
 from app.services.market_data import market_data_service
-from app.models.technical import TimeFrame, VolumeProfile
+from app.models.technical import PriceVolumeHistogram, TimeFrame, VolumeProfile
+from app.core.exceptions import UpstreamDataError
 from app.core.redis import redis_client
+from app.utils.buffer_pool import buffer_pool
 
 logger = logging.getLogger(__name__)
 
@@ -43,28 +45,25 @@ class VolumeAnalysisService:
                 raise ValueError(f"No data available for {symbol}")
 
             # Calculate price levels and volume distribution
-            price_levels, volume_at_price = self._calculate_volume_distribution(
+            volume_at_price = self._calculate_volume_distribution(
                 data=data,
                 num_bins=num_bins
             )
             
             # Calculate value area
-            vah, val, poc = self._calculate_value_area(
-                price_levels=price_levels,
-                volume_at_price=volume_at_price,
-                value_area_pct=value_area_pct
-            )
+            vah, val = volume_at_price.value_area(value_area_pct)
+            poc = volume_at_price.point_of_control()
             
             # Create volume profile
             profile = VolumeProfile(
                 symbol=symbol,
                 timeframe=timeframe,
                 timestamp=end_date,
-                price_levels=price_levels.tolist(),
-                volume_at_price={str(k): float(v) for k, v in volume_at_price.items()},
-                value_area_high=float(vah),
-                value_area_low=float(val),
-                point_of_control=float(poc),
+                price_levels=volume_at_price.prices.tolist(),
+                volume_at_price=volume_at_price,
+                value_area_high=vah,
+                value_area_low=val,
+                point_of_control=poc,
                 metadata={
                     "start_date": start_date.isoformat(),
                     "end_date": end_date.isoformat(),
@@ -74,111 +73,69 @@ class VolumeAnalysisService:
             )
             
             # Cache for 5 minutes
-            await redis_client.set_json(cache_key, profile.dict(), 300)
+            await redis_client.set_json(cache_key, profile.model_dump(mode="json"), 300)
             
             return profile
             
         except Exception as e:
             logger.error(f"Error calculating volume profile for {symbol}: {str(e)}")
-            raise
+            raise UpstreamDataError(f"Error calculating volume profile for {symbol}") from e
 
     def _calculate_volume_distribution(
         self,
         data: pd.DataFrame,
         num_bins: int
-    ) -> Tuple[np.ndarray, Dict[float, float]]:
-        """Calculate volume distribution across price levels."""
+    ) -> PriceVolumeHistogram:
+        """
+        Calculate volume distribution across price levels.
+        
+        Each bar's volume is spread evenly over the levels its low-high range
+        covers, accumulated through a difference array in pooled buffers.
+        """
         try:
+            low = data['low'].to_numpy(dtype=np.float64)
+            high = data['high'].to_numpy(dtype=np.float64)
+            volume = data['volume'].to_numpy(dtype=np.float64)
+
+            # A flat window has a single price level holding all the volume;
+            # linspace would repeat that price num_bins times
+            if low.min() == high.max():
+                return PriceVolumeHistogram.model_construct(
+                    prices=np.array([low.min()]),
+                    volumes=np.array([volume.sum()])
+                )
+
             # Calculate price levels
-            price_range = data['high'].max() - data['low'].min()
-            bin_size = price_range / num_bins
-            price_levels = np.linspace(
-                data['low'].min(),
-                data['high'].max(),
-                num_bins
-            )
-            
-            # Initialize volume distribution
-            volume_at_price = {}
-            
-            # Calculate volume for each price level
-            for i in range(len(data)):
-                row = data.iloc[i]
-                price_range_in_bar = np.arange(
-                    row['low'],
-                    row['high'] + bin_size,
-                    bin_size
+            price_levels = np.linspace(low.min(), high.max(), num_bins)
+            
+            # First and last level covered by each bar; a bar falling between
+            # two levels is credited to the one above its low
+            first = np.searchsorted(price_levels, low, side="left")
+            last = np.maximum(np.searchsorted(price_levels, high, side="right") - 1, first)
+            volume_per_level = volume / (last - first + 1)
+            
+            diff = buffer_pool.acquire((num_bins + 1,), np.float64)
+            volumes = buffer_pool.acquire((num_bins,), np.float64)
+            try:
+                diff.fill(0.0)
+                np.add.at(diff, first, volume_per_level)
+                np.add.at(diff, last + 1, -volume_per_level)
+                np.cumsum(diff[:-1], out=volumes)
+                # Copied out: the pooled buffer is reused by the next call
+                histogram = PriceVolumeHistogram.model_construct(
+                    prices=price_levels,
+                    volumes=volumes.copy()
                 )
-                volume_per_level = row['volume'] / len(price_range_in_bar)
-                
-                for price in price_range_in_bar:
-                    rounded_price = round(price, 4)
-                    if rounded_price in volume_at_price:
-                        volume_at_price[rounded_price] += volume_per_level
-                    else:
-                        volume_at_price[rounded_price] = volume_per_level
+            finally:
+                buffer_pool.release(diff)
+                buffer_pool.release(volumes)
             
-            return price_levels, volume_at_price
+            return histogram
             
         except Exception as e:
             logger.error(f"Error calculating volume distribution: {str(e)}")
             raise
 
-    def _calculate_value_area(
-        self,
-        price_levels: np.ndarray,
-        volume_at_price: Dict[float, float],
-        value_area_pct: float
-    ) -> Tuple[float, float, float]:
-        """Calculate Value Area High, Value Area Low, and Point of Control."""
-        try:
-            # Find Point of Control (price level with highest volume)
-            poc = max(volume_at_price.keys(), key=lambda k: volume_at_price[k])
-            
-            # Calculate total volume
-            total_volume = sum(volume_at_price.values())
-            target_volume = total_volume * value_area_pct
-            
-            # Initialize value area
-            cumulative_volume = volume_at_price[poc]
-            vah = poc
-            val = poc
-            
-            # Expand value area until target volume is reached
-            while cumulative_volume < target_volume:
-                # Get next prices above and below current value area
-                prices_above = [p for p in price_levels if p > vah]
-                prices_below = [p for p in price_levels if p < val]
-                
-                if not prices_above and not prices_below:
-                    break
-                
-                # Get volumes at next levels
-                vol_above = volume_at_price.get(
-                    min(prices_above, default=vah),
-                    0
-                )
-                vol_below = volume_at_price.get(
-                    max(prices_below, default=val),
-                    0
-                )
-                
-                # Add level with higher volume to value area
-                if vol_above > vol_below and prices_above:
-                    vah = min(prices_above)
-                    cumulative_volume += vol_above
-                elif prices_below:
-                    val = max(prices_below)
-                    cumulative_volume += vol_below
-                else:
-                    break
-            
-            return vah, val, poc
-            
-        except Exception as e:
-            logger.error(f"Error calculating value area: {str(e)}")
-            raise
-
     async def get_volume_analysis(
         self,
         symbol: str,
@@ -214,7 +171,7 @@ class VolumeAnalysisService:
                 "relative_volume": float(
                     data['volume'].iloc[-1] / data['volume'].mean()
                 ),
-                "volume_profile": profile.dict(),
+                "volume_profile": profile.model_dump(),
                 "price_volume_correlation": float(
                     data['close'].corr(data['volume'])
                 )
@@ -224,7 +181,7 @@ class VolumeAnalysisService:
             
         except Exception as e:
             logger.error(f"Error getting volume analysis for {symbol}: {str(e)}")
-            raise
+            raise UpstreamDataError(f"Error getting volume analysis for {symbol}") from e
 
     def _calculate_volume_trend(self, data: pd.DataFrame) -> str:
         """Calculate volume trend using linear regression."""
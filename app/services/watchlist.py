@@ -1,14 +1,18 @@
 from typing import List, Optional, Set
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
 from datetime import datetime, timedelta
 import logging
+import operator
 
+from app.models._fast import _from_orm_fast
 from app.models.watchlist import (
     Alert, AlertCreate, AlertType, AlertCondition, AlertPriority,
     WatchlistItem, WatchlistItemCreate,
-    Watchlist, WatchlistCreate, WatchlistType,
+    Watchlist, WatchlistCreate, WatchlistType, WatchlistResponse,
     DBAlert, DBWatchlistItem, DBWatchlist
 )
 from app.services.market_data import market_data_service
@@ -17,6 +21,28 @@ from app.core.redis import redis_client
 
 logger = logging.getLogger(__name__)
 
+# Threshold comparisons by condition, built once: test(value, threshold)
+_THRESHOLD_TESTS = {
+    AlertCondition.ABOVE: operator.gt,
+    AlertCondition.BELOW: operator.lt
+}
+
+# Crossing tests by condition: test(previous, value, threshold)
+_CROSSING_TESTS = {
+    AlertCondition.CROSSES_ABOVE: lambda previous, value, threshold: previous < threshold <= value,
+    AlertCondition.CROSSES_BELOW: lambda previous, value, threshold: previous > threshold >= value
+}
+
+def _watchlist_load_options() -> tuple:
+    """
+    Eager-load every relationship the Watchlist conversion reads, with one IN
+    query each instead of a lazy SELECT per watchlist and per item.
+    """
+    return (
+        selectinload(DBWatchlist.items).selectinload(DBWatchlistItem.alerts),
+        selectinload(DBWatchlist.alerts)
+    )
+
 class WatchlistService:
     def __init__(self):
         self._alert_handlers = {
@@ -31,63 +57,126 @@ class WatchlistService:
 
     async def create_watchlist(
         self,
-        db: Session,
+        db: AsyncSession,
         user_id: UUID,
         watchlist: WatchlistCreate
     ) -> Watchlist:
         """Create a new watchlist."""
+        # Empty collections are set up front so the conversion never lazy-loads them
         db_watchlist = DBWatchlist(
-            **watchlist.dict(),
-            user_id=user_id
+            **watchlist.model_dump(),
+            user_id=user_id,
+            items=[],
+            alerts=[]
         )
         db.add(db_watchlist)
-        db.commit()
-        db.refresh(db_watchlist)
-        return Watchlist.from_orm(db_watchlist)
+        await db.commit()
+        return _from_orm_fast(Watchlist, db_watchlist)
+
+    async def _get_owned_watchlist(
+        self,
+        db: AsyncSession,
+        watchlist_id: UUID,
+        user_id: UUID,
+        *options
+    ) -> Optional[DBWatchlist]:
+        """Get a watchlist row if it belongs to the user."""
+        result = await db.execute(
+            select(DBWatchlist).options(*options).where(
+                DBWatchlist.id == watchlist_id,
+                DBWatchlist.user_id == user_id
+            )
+        )
+        return result.scalars().first()
 
     async def get_watchlist(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID
     ) -> Optional[Watchlist]:
         """Get a watchlist by ID."""
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(
+            db, watchlist_id, user_id, *_watchlist_load_options()
+        )
         
         if not db_watchlist:
             return None
             
-        return Watchlist.from_orm(db_watchlist)
+        return _from_orm_fast(Watchlist, db_watchlist)
 
     async def get_watchlists(
         self,
-        db: Session,
+        db: AsyncSession,
         user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        type: Optional[WatchlistType] = None
     ) -> List[Watchlist]:
         """Get all watchlists for a user."""
-        db_watchlists = db.query(DBWatchlist).filter(
+        query = select(DBWatchlist).options(*_watchlist_load_options()).where(
+            DBWatchlist.user_id == user_id
+        )
+        if type:
+            query = query.where(DBWatchlist.type == type)
+        
+        result = await db.execute(query.offset(skip).limit(limit))
+        
+        return [_from_orm_fast(Watchlist, w) for w in result.scalars()]
+
+    async def get_watchlist_summaries(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        type: Optional[WatchlistType] = None
+    ) -> List[WatchlistResponse]:
+        """Get watchlists for a user with item and alert counts, without loading children."""
+        items_count = (
+            select(func.count(DBWatchlistItem.id))
+            .where(DBWatchlistItem.watchlist_id == DBWatchlist.id)
+            .correlate(DBWatchlist)
+            .scalar_subquery()
+        )
+        alerts_count = (
+            select(func.count(DBAlert.id))
+            .where(DBAlert.watchlist_id == DBWatchlist.id)
+            .correlate(DBWatchlist)
+            .scalar_subquery()
+        )
+        
+        query = select(
+            DBWatchlist.id,
+            DBWatchlist.name,
+            DBWatchlist.description,
+            DBWatchlist.type,
+            DBWatchlist.is_public,
+            DBWatchlist.created_at,
+            DBWatchlist.updated_at,
+            items_count.label("items_count"),
+            alerts_count.label("alerts_count")
+        ).where(
             DBWatchlist.user_id == user_id
-        ).offset(skip).limit(limit).all()
+        )
+        if type:
+            query = query.where(DBWatchlist.type == type)
         
-        return [Watchlist.from_orm(w) for w in db_watchlists]
+        result = await db.execute(query.offset(skip).limit(limit))
+        
+        return [WatchlistResponse(**row._asdict()) for row in result]
 
     async def update_watchlist(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID,
         updates: dict
     ) -> Optional[Watchlist]:
         """Update a watchlist."""
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(
+            db, watchlist_id, user_id, *_watchlist_load_options()
+        )
         
         if not db_watchlist:
             return None
@@ -96,42 +185,38 @@ class WatchlistService:
             setattr(db_watchlist, key, value)
         
         db_watchlist.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(db_watchlist)
-        return Watchlist.from_orm(db_watchlist)
+        await db.commit()
+        return _from_orm_fast(Watchlist, db_watchlist)
 
     async def delete_watchlist(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID
     ) -> bool:
         """Delete a watchlist."""
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        # Children are loaded so the delete-orphan cascade can remove them
+        db_watchlist = await self._get_owned_watchlist(
+            db, watchlist_id, user_id, *_watchlist_load_options()
+        )
         
         if not db_watchlist:
             return False
             
-        db.delete(db_watchlist)
-        db.commit()
+        await db.delete(db_watchlist)
+        await db.commit()
         return True
 
     async def add_watchlist_item(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID,
         item: WatchlistItemCreate
     ) -> Optional[WatchlistItem]:
         """Add an item to a watchlist."""
         # Verify watchlist exists and belongs to user
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(db, watchlist_id, user_id)
         
         if not db_watchlist:
             return None
@@ -145,101 +230,100 @@ class WatchlistService:
 
         # Create watchlist item
         db_item = DBWatchlistItem(
-            **item.dict(),
-            watchlist_id=watchlist_id
+            **item.model_dump(),
+            watchlist_id=watchlist_id,
+            alerts=[]
         )
         db.add(db_item)
-        db.commit()
-        db.refresh(db_item)
-        return WatchlistItem.from_orm(db_item)
+        await db.commit()
+        return _from_orm_fast(WatchlistItem, db_item)
 
     async def remove_watchlist_item(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID,
         item_id: UUID
     ) -> bool:
         """Remove an item from a watchlist."""
         # Verify watchlist exists and belongs to user
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(db, watchlist_id, user_id)
         
         if not db_watchlist:
             return False
 
         # Delete item
-        result = db.query(DBWatchlistItem).filter(
-            DBWatchlistItem.id == item_id,
-            DBWatchlistItem.watchlist_id == watchlist_id
-        ).delete()
+        result = await db.execute(
+            delete(DBWatchlistItem).where(
+                DBWatchlistItem.id == item_id,
+                DBWatchlistItem.watchlist_id == watchlist_id
+            )
+        )
         
-        db.commit()
-        return result > 0
+        await db.commit()
+        return result.rowcount > 0
 
     async def add_alert(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID,
         alert: AlertCreate
     ) -> Optional[Alert]:
         """Add an alert to a watchlist."""
         # Verify watchlist exists and belongs to user
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(db, watchlist_id, user_id)
         
         if not db_watchlist:
             return None
 
         # Create alert
         db_alert = DBAlert(
-            **alert.dict(),
+            **alert.model_dump(),
             watchlist_id=watchlist_id
         )
         db.add(db_alert)
-        db.commit()
-        db.refresh(db_alert)
-        return Alert.from_orm(db_alert)
+        await db.commit()
+        return _from_orm_fast(Alert, db_alert)
 
     async def remove_alert(
         self,
-        db: Session,
+        db: AsyncSession,
         watchlist_id: UUID,
         user_id: UUID,
         alert_id: UUID
     ) -> bool:
         """Remove an alert from a watchlist."""
         # Verify watchlist exists and belongs to user
-        db_watchlist = db.query(DBWatchlist).filter(
-            DBWatchlist.id == watchlist_id,
-            DBWatchlist.user_id == user_id
-        ).first()
+        db_watchlist = await self._get_owned_watchlist(db, watchlist_id, user_id)
         
         if not db_watchlist:
             return False
 
         # Delete alert
-        result = db.query(DBAlert).filter(
-            DBAlert.id == alert_id,
-            DBAlert.watchlist_id == watchlist_id
-        ).delete()
+        result = await db.execute(
+            delete(DBAlert).where(
+                DBAlert.id == alert_id,
+                DBAlert.watchlist_id == watchlist_id
+            )
+        )
         
-        db.commit()
-        return result > 0
+        await db.commit()
+        return result.rowcount > 0
 
-    async def check_alerts(self, db: Session) -> List[dict]:
+    async def check_alerts(self, db: AsyncSession) -> List[dict]:
         """Check all active alerts and return triggered ones."""
         triggered_alerts = []
         
-        # Get all active alerts
-        active_alerts = db.query(DBAlert).filter(
-            DBAlert.enabled == True
-        ).all()
+        # Get all active alerts, with the watchlists the handlers read
+        result = await db.execute(
+            select(DBAlert).options(
+                selectinload(DBAlert.watchlist).options(*_watchlist_load_options())
+            ).where(
+                DBAlert.enabled == True
+            )
+        )
+        active_alerts = result.scalars().all()
         
         for alert in active_alerts:
             # Skip if in cooldown
@@ -252,11 +336,11 @@ class WatchlistService:
                 # Update alert
                 alert.last_triggered = datetime.utcnow()
                 alert.trigger_count += 1
-                db.commit()
+                await db.commit()
                 
                 triggered_alerts.append({
-                    "alert": Alert.from_orm(alert),
-                    "watchlist": Watchlist.from_orm(alert.watchlist),
+                    "alert": _from_orm_fast(Alert, alert),
+                    "watchlist": _from_orm_fast(Watchlist, alert.watchlist),
                     "triggered_at": datetime.utcnow()
                 })
         
@@ -276,11 +360,10 @@ class WatchlistService:
             
             alert_value = float(alert.value)
             
-            if alert.condition == AlertCondition.ABOVE:
-                return price > alert_value
-            elif alert.condition == AlertCondition.BELOW:
-                return price < alert_value
-            elif alert.condition == AlertCondition.PERCENT_CHANGE:
+            test = _THRESHOLD_TESTS.get(alert.condition)
+            if test is not None:
+                return test(price, alert_value)
+            if alert.condition == AlertCondition.PERCENT_CHANGE:
                 prev_price = await market_data_service.get_previous_close(symbol)
                 if not prev_price:
                     return False
@@ -420,16 +503,13 @@ class WatchlistService:
             
             value = indicators[indicator]
             
-            if alert.condition == AlertCondition.ABOVE:
-                return value > threshold
-            elif alert.condition == AlertCondition.BELOW:
-                return value < threshold
-            elif alert.condition == AlertCondition.CROSSES_ABOVE:
-                prev_value = await market_data_service.get_previous_indicator(symbol, indicator)
-                return prev_value < threshold and value >= threshold
-            elif alert.condition == AlertCondition.CROSSES_BELOW:
+            test = _THRESHOLD_TESTS.get(alert.condition)
+            if test is not None:
+                return test(value, threshold)
+            crossing = _CROSSING_TESTS.get(alert.condition)
+            if crossing is not None:
                 prev_value = await market_data_service.get_previous_indicator(symbol, indicator)
-                return prev_value > threshold and value <= threshold
+                return crossing(prev_value, value, threshold)
             
             return False
             
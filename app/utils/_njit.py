@@ -0,0 +1,10 @@
+# numba is optional: without it, kernels decorated with njit run as plain
+# Python over numpy arrays and return the same results, only slower.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
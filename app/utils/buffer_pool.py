@@ -0,0 +1,29 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+import numpy as np
+
+class BufferPool:
+    """
+    Per-process pool of reusable numpy scratch buffers.
+    
+    Buffers are keyed by shape and dtype. Acquire and release them within
+    one synchronous block (no await in between) so coroutines sharing the
+    event loop never see the same buffer; their contents are not cleared.
+    """
+    def __init__(self, max_per_key: int = 8):
+        self.max_per_key = max_per_key
+        self._free: Dict[Tuple[Tuple[int, ...], np.dtype], List[np.ndarray]] = defaultdict(list)
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        """Get a buffer of the given shape and dtype, reusing a released one."""
+        free = self._free[(shape, np.dtype(dtype))]
+        return free.pop() if free else np.empty(shape, dtype=dtype)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool; extras beyond max_per_key are dropped."""
+        free = self._free[(buffer.shape, buffer.dtype)]
+        if len(free) < self.max_per_key:
+            free.append(buffer)
+
+# Global buffer pool instance
+buffer_pool = BufferPool()
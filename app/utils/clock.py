@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+import time
+
+@lru_cache(maxsize=1)
+def _minute_start(minute: int) -> datetime:
+    return datetime.fromtimestamp(minute * 60, timezone.utc).replace(tzinfo=None)
+
+def coarse_utcnow_minute() -> datetime:
+    """
+    Current UTC time (naive, like datetime.utcnow()) floored to the minute.
+    
+    Lookback windows built from it are identical for every request within
+    the same minute, so their cache keys match. The datetime is built once
+    per minute.
+    """
+    return _minute_start(int(time.time() // 60))
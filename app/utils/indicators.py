@@ -0,0 +1,78 @@
+import numpy as np
+
+from app.utils._njit import njit
+
+# Column order of the table returned by batch_close_indicators
+BATCH_COLUMNS = ("sma_20", "sma_50", "rsi", "bb_upper", "bb_middle", "bb_lower")
+
+@njit(cache=True)
+def _sma(values, start, end, period):
+    if end - start < period:
+        return np.nan
+    total = 0.0
+    for j in range(end - period, end):
+        total += values[j]
+    return total / period
+
+@njit(cache=True)
+def _std(values, start, end, period, mean):
+    if end - start < period:
+        return np.nan
+    total = 0.0
+    for j in range(end - period, end):
+        total += (values[j] - mean) ** 2
+    return np.sqrt(total / period)
+
+@njit(cache=True)
+def _rsi(values, start, end, period):
+    """Wilder RSI of the last value, seeded like TA-Lib."""
+    if end - start <= period:
+        return np.nan
+    gain = 0.0
+    loss = 0.0
+    for j in range(start + 1, start + period + 1):
+        change = values[j] - values[j - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+    gain /= period
+    loss /= period
+    for j in range(start + period + 1, end):
+        change = values[j] - values[j - 1]
+        gain = (gain * (period - 1) + max(change, 0.0)) / period
+        loss = (loss * (period - 1) + max(-change, 0.0)) / period
+    if gain + loss == 0:
+        return 0.0
+    return 100.0 * gain / (gain + loss)
+
+@njit(cache=True)
+def batch_close_indicators(values, offsets):
+    """
+    Latest close-based indicators for many symbols in one pass.
+
+    values holds every symbol's closes back to back; symbol i spans
+    values[offsets[i]:offsets[i + 1]]. Returns one row per symbol with
+    the columns in BATCH_COLUMNS; NaN where a series is too short.
+    """
+    n = len(offsets) - 1
+    out = np.empty((n, 6))
+    for i in range(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+        middle = _sma(values, start, end, 20)
+        band = 2.0 * _std(values, start, end, 20, middle)
+        out[i, 0] = middle
+        out[i, 1] = _sma(values, start, end, 50)
+        out[i, 2] = _rsi(values, start, end, 14)
+        out[i, 3] = middle + band
+        out[i, 4] = middle
+        out[i, 5] = middle - band
+    return out
+
+def stack_series(series):
+    """Concatenate 1-D series into the (values, offsets) layout used above."""
+    offsets = np.zeros(len(series) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in series], out=offsets[1:])
+    values = np.concatenate(series).astype(np.float64) if series else np.empty(0)
+    return values, offsets
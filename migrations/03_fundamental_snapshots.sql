@@ -0,0 +1,18 @@
+-- Precomputed fundamental analysis, one row per symbol. Rows are upserted by
+-- the API whenever it runs the live pipeline, and read back while fresh.
+CREATE TABLE IF NOT EXISTS fundamental_snapshots (
+    symbol TEXT PRIMARY KEY,
+    snapshot JSONB NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT timezone('utc'::text, now())
+);
+
+CREATE INDEX IF NOT EXISTS idx_fundamental_snapshots_refreshed ON fundamental_snapshots(refreshed_at);
+
+-- Enable Row Level Security
+ALTER TABLE fundamental_snapshots ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow read for authenticated users" ON fundamental_snapshots
+    FOR SELECT TO authenticated USING (true);
+
+CREATE POLICY "Allow all for service role" ON fundamental_snapshots
+    FOR ALL TO service_role USING (true) WITH CHECK (true);
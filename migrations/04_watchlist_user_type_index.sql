@@ -0,0 +1,5 @@
+-- Watchlist listings filter by owner and optionally by type before paging.
+-- The composite index serves both; its user_id prefix replaces idx_watchlists_user.
+CREATE INDEX IF NOT EXISTS idx_watchlists_user_type ON watchlists(user_id, type);
+
+DROP INDEX IF EXISTS idx_watchlists_user;
@@ -3,6 +3,11 @@ import os
 
 port = int(os.getenv("PORT", 10000))
 
+# uvicorn picks up uvloop and httptools automatically when they are
+# installed (uvloop is not on Windows). Production runs several workers
+# under gunicorn:
+#   gunicorn app.main:app -k uvicorn.workers.UvicornWorker --worker-connections 2000
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app", host="0.0.0.0", port=port)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=port)
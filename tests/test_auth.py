@@ -0,0 +1,121 @@
+import pytest
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+
+from app.api.dependencies import auth
+from app.core.security import create_access_token
+
+TEST_USER = {"id": "test_user_id", "email": "test@example.com", "is_active": True}
+
+@pytest.fixture
+def mock_supabase():
+    """Mock Supabase client returning a single active user."""
+    mock = MagicMock()
+    mock.table.return_value.select.return_value.eq.return_value.execute = AsyncMock(
+        return_value=MagicMock(data=[TEST_USER])
+    )
+    with patch('app.api.dependencies.auth.get_supabase_client', return_value=mock):
+        yield mock
+
+@pytest.fixture(autouse=True)
+def mock_user_cache():
+    """Mock the Redis user cache as empty."""
+    with patch('app.api.dependencies.auth.redis_client') as mock:
+        mock.get_cached_user = AsyncMock(return_value=None)
+        mock.cache_user = AsyncMock(return_value=True)
+        yield mock
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+def _lookups(mock_supabase) -> int:
+    return mock_supabase.table.return_value.select.return_value.eq.return_value.execute.await_count
+
+@pytest.mark.asyncio
+async def test_get_current_user_caches_resolved_user(mock_supabase):
+    """Repeated calls with the same token skip verification and lookup."""
+    token = create_access_token(TEST_USER["id"])
+
+    first = await auth.get_current_user(MagicMock(), token)
+    second = await auth.get_current_user(MagicMock(), token)
+
+    assert first == second == TEST_USER
+    assert _lookups(mock_supabase) == 1
+
+@pytest.mark.asyncio
+async def test_cached_user_does_not_outlive_token(mock_supabase):
+    """Cache entries expire with the token even inside the cache TTL."""
+    token = create_access_token(TEST_USER["id"], expires_delta=timedelta(seconds=2))
+    await auth.get_current_user(MagicMock(), token)
+
+    with patch('app.api.dependencies.auth.time.time', return_value=time.time() + 5):
+        assert auth._get_cached_user(auth._token_cache_key(token)) is None
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached(mock_supabase):
+    with pytest.raises(HTTPException):
+        await auth.get_current_user(MagicMock(), "not-a-jwt")
+
+    assert len(auth._token_cache) == 0
+    assert _lookups(mock_supabase) == 0
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_redis_user_cache(mock_supabase, mock_user_cache):
+    """A Redis hit resolves the user without querying Supabase."""
+    mock_user_cache.get_cached_user.return_value = TEST_USER
+    token = create_access_token(TEST_USER["id"])
+
+    assert await auth.get_current_user(MagicMock(), token) == TEST_USER
+    assert _lookups(mock_supabase) == 0
+
+@pytest.mark.asyncio
+async def test_get_current_user_fills_redis_user_cache(mock_supabase, mock_user_cache):
+    token = create_access_token(TEST_USER["id"])
+
+    await auth.get_current_user(MagicMock(), token)
+
+    mock_user_cache.cache_user.assert_awaited_once_with(TEST_USER["id"], TEST_USER)
+
+@pytest.mark.asyncio
+async def test_get_current_user_sets_request_state(mock_supabase):
+    """The resolved user is exposed on request.state for downstream code."""
+    request = MagicMock()
+    token = create_access_token(TEST_USER["id"])
+
+    await auth.get_current_user(request, token)
+
+    assert request.state.user == TEST_USER
+
+def test_decode_token_rechecks_exp_on_memoized_payload():
+    """A memoized payload is rejected once the token expires."""
+    from app.core.security import decode_token
+
+    token = create_access_token(TEST_USER["id"], expires_delta=timedelta(seconds=2))
+    assert decode_token(token)["sub"] == TEST_USER["id"]
+
+    with patch('app.core.security.time.time', return_value=time.time() + 5):
+        assert decode_token(token) is None
+
+@pytest.mark.asyncio
+async def test_inactive_user_rejected(mock_supabase):
+    inactive = {**TEST_USER, "is_active": False}
+    mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[inactive])
+    token = create_access_token(TEST_USER["id"])
+
+    with pytest.raises(HTTPException) as exc:
+        await auth.get_current_active_user(MagicMock(), token)
+
+    assert exc.value.status_code == 403
+
+def test_decode_token_does_not_memoize_invalid_tokens():
+    from app.core.security import _decode_verified, decode_token
+
+    _decode_verified.cache_clear()
+    assert decode_token("not-a-jwt") is None
+    assert _decode_verified.cache_info().currsize == 0
@@ -0,0 +1,207 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.dependencies.auth import get_current_user
+from app.api.endpoints import backtest
+from app.models import backtest as backtest_models
+from app.models.backtest import BacktestResultDB, BacktestStrategyDB, EquityCurve, StrategyConfig
+
+USER_ID = str(uuid4())
+
+app = FastAPI()
+app.include_router(backtest.router)
+app.dependency_overrides[get_current_user] = lambda: {"id": USER_ID}
+client = TestClient(app)
+
+CONFIG = {
+    "name": "Crossover",
+    "description": "SMA crossover",
+    "indicators": {"sma": {"period": 20}},
+    "entry_conditions": [{"indicator": "sma", "operator": ">", "value": 100.0}],
+    "exit_conditions": [{"indicator": "sma", "operator": "<", "value": 95.0}]
+}
+
+def _strategy_row(**values) -> BacktestStrategyDB:
+    """A strategy row as the model's queries build it."""
+    row = {
+        "id": uuid4(),
+        "user_id": USER_ID,
+        "name": "Crossover",
+        "description": "SMA crossover",
+        "config": CONFIG,
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+        "is_active": True,
+        "is_public": False,
+        "performance": None,
+        "meta": None
+    }
+    row.update(values)
+    return BacktestStrategyDB(**row)
+
+def test_list_strategies_returns_db_rows():
+    row = _strategy_row()
+
+    with patch.object(BacktestStrategyDB, "get_for_user", AsyncMock(return_value=[row])) as get_for_user:
+        response = client.get("/backtest/strategy", params={"include_public": True})
+
+    assert response.status_code == 200
+    assert [strategy["id"] for strategy in response.json()] == [str(row.id)]
+    assert response.json()[0]["config"]["name"] == "Crossover"
+    get_for_user.assert_awaited_once_with(USER_ID, include_public=True)
+
+def test_update_strategy_writes_owned_row():
+    row = _strategy_row(name="Renamed")
+
+    with patch.object(BacktestStrategyDB, "update_owned", AsyncMock(return_value=row)) as update_owned:
+        response = client.put(f"/backtest/strategy/{row.id}", json={**CONFIG, "name": "Renamed"})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert update_owned.await_args.args == (row.id, USER_ID)
+
+def test_delete_strategy_not_owned_is_forbidden():
+    row = _strategy_row(user_id=str(uuid4()))
+
+    # A fresh loader picks up the patched batch query
+    with patch.object(BacktestStrategyDB, "delete_owned", AsyncMock(return_value=False)), \
+         patch.object(BacktestStrategyDB, "get_by_ids", AsyncMock(return_value=[row])), \
+         patch("app.api.dependencies.loaders._strategy_loader", None):
+        response = client.delete(f"/backtest/strategy/{row.id}")
+
+    assert response.status_code == 403
+
+def test_run_backtest_passes_validated_strategy():
+    row = _strategy_row()
+    # Stop at the service call; only its arguments are checked
+    run = AsyncMock(side_effect=HTTPException(status_code=418))
+
+    with patch.object(BacktestStrategyDB, "get_by_ids", AsyncMock(return_value=[row])), \
+         patch("app.api.dependencies.loaders._strategy_loader", None), \
+         patch.object(backtest.backtest_service, "run_backtest", run):
+        response = client.post(
+            "/backtest/run",
+            params={"strategy_id": str(row.id)},
+            json={
+                "start_date": "2025-01-01T00:00:00",
+                "end_date": "2025-02-01T00:00:00",
+                "initial_capital": 10000,
+                "symbols": ["AAPL"],
+                "timeframe": "1d"
+            }
+        )
+
+    assert response.status_code == 418
+    strategy = run.await_args.kwargs["strategy"]
+    assert isinstance(strategy.config, StrategyConfig)
+    assert strategy.config.entry_conditions == CONFIG["entry_conditions"]
+
+def test_equity_curve_accepts_legacy_points():
+    curve = EquityCurve.model_validate([
+        {"timestamp": "2025-01-01T00:00:00", "equity": 10000.0, "cash": 10000.0, "positions_value": 0.0},
+        {"timestamp": datetime(2025, 1, 2), "equity": 10100.0, "cash": 4100.0, "positions_value": 6000.0}
+    ])
+
+    assert curve.t == [1735689600, 1735776000]
+    assert curve.equity == [10000.0, 10100.0]
+    assert curve.cash == [10000.0, 4100.0]
+    assert curve.positions_value == [0.0, 6000.0]
+    assert EquityCurve.model_validate(curve.model_dump()) == curve
+
+class _FakeConnection:
+    """Records statements and keeps them only if the transaction commits."""
+
+    def __init__(self, fail_copy: bool = False):
+        self.fail_copy = fail_copy
+        self.pending = []
+        self.committed = []
+
+    def transaction(self):
+        return _FakeTransaction(self)
+
+    async def execute(self, sql, *args):
+        self.pending.append(("execute", sql))
+
+    async def executemany(self, sql, records):
+        self.pending.append(("executemany", sql))
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.fail_copy:
+            raise ConnectionResetError("COPY interrupted")
+        self.pending.append(("copy", table))
+
+class _FakeTransaction:
+    def __init__(self, con: _FakeConnection):
+        self.con = con
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.con.committed.extend(self.con.pending)
+        self.con.pending = []
+
+class _FakePool:
+    def __init__(self, con: _FakeConnection):
+        self.con = con
+
+    def acquire(self):
+        return _FakeAcquire(self.con)
+
+class _FakeAcquire:
+    def __init__(self, con: _FakeConnection):
+        self.con = con
+
+    async def __aenter__(self):
+        return self.con
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+def _result_row(points: int) -> BacktestResultDB:
+    return BacktestResultDB(
+        strategy_id=uuid4(),
+        user_id=USER_ID,
+        config={},
+        stats={"total_pnl": 0.0},
+        equity_curve={
+            "t": [1735689600 + 86400 * i for i in range(points)],
+            "equity": [10000.0] * points,
+            "cash": [10000.0] * points,
+            "positions_value": [0.0] * points
+        },
+        trades=[],
+        positions=[],
+        orders=[],
+        metrics={"sharpe_ratio": 0.0}
+    )
+
+@pytest.mark.asyncio
+async def test_result_save_commits_row_and_equity_points_together():
+    con = _FakeConnection()
+    result = _result_row(points=150)
+
+    with patch.object(backtest_models, "get_pool", lambda: _FakePool(con)):
+        await result.save()
+
+    assert result.id is not None
+    assert [kind for kind, _ in con.committed] == ["execute", "copy"]
+    assert con.committed[0][1].startswith("INSERT INTO backtest_results")
+    assert con.committed[1][1] == "backtest_equity_points"
+
+@pytest.mark.asyncio
+async def test_result_bulk_save_rolls_back_rows_when_points_fail():
+    con = _FakeConnection(fail_copy=True)
+    results = [_result_row(points=60), _result_row(points=60)]
+
+    with patch.object(backtest_models, "get_pool", lambda: _FakePool(con)):
+        with pytest.raises(ConnectionResetError):
+            await BacktestResultDB.bulk_save(results)
+
+    assert con.committed == []
@@ -0,0 +1,50 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from app.db import bulk
+from app.models.technical import DarkPoolTrade, OrderFlowTrade, OrderFlowTradeBatch
+
+def test_trade_batch_records_are_naive_utc_rows():
+    trades = [
+        OrderFlowTrade(
+            timestamp=datetime(2024, 1, 2, 15, 30, 0, 250),
+            price=101.25,
+            volume=200,
+            side="sell",
+            is_aggressive=True
+        ),
+        OrderFlowTrade(
+            timestamp=datetime(2024, 1, 2, 10, 31, tzinfo=timezone(timedelta(hours=-5))),
+            price=101.5,
+            volume=15000,
+            side="buy",
+            is_aggressive=False,
+            is_block_trade=True
+        )
+    ]
+
+    records = bulk._trade_batch_records(OrderFlowTradeBatch.from_trades(trades))
+
+    assert records == [
+        (datetime(2024, 1, 2, 15, 30, 0, 250), 101.25, 200.0, "sell", True, False),
+        (datetime(2024, 1, 2, 15, 31), 101.5, 15000.0, "buy", False, True)
+    ]
+    assert all(record[0].tzinfo is None for record in records)
+
+@pytest.mark.asyncio
+async def test_copy_dark_pool_trades_writes_naive_utc():
+    trade = DarkPoolTrade(
+        timestamp=datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc),
+        symbol="AAPL",
+        price=101.25,
+        volume=5000,
+        venue="XADF",
+        trade_id="t1"
+    )
+
+    with patch.object(bulk, "copy_records", AsyncMock()) as copy_records:
+        await bulk.copy_dark_pool_trades("dark_pool_trades", [trade])
+
+    table, columns, records = copy_records.await_args.args
+    assert records == [(datetime(2024, 1, 2, 15, 30), "AAPL", 101.25, 5000.0, "XADF", "t1", False)]
@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.cache import cache_response, default_key_builder, filter_key_builder, symbol_key_builder, user_key_builder
+
+@pytest.fixture
+def mock_cache():
+    """Mock the Redis response cache as an in-memory dict."""
+    store = {}
+
+    async def cache_get(key):
+        return store.get(key)
+
+    async def cache_set(key, value, expire=300):
+        store[key] = value
+        return True
+
+    with patch('app.core.cache.redis_client') as mock:
+        mock.cache_get = AsyncMock(side_effect=cache_get)
+        mock.cache_set = AsyncMock(side_effect=cache_set)
+        yield store
+
+async def get_analysis(symbol: str, lookback_minutes: int = 60, current_user=None):
+    return {"symbol": symbol, "lookback_minutes": lookback_minutes}
+
+def test_symbol_key_builder_ignores_current_user():
+    key_a = symbol_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "a"}})
+    key_b = symbol_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "b"}})
+
+    assert key_a == key_b
+    assert "get_analysis" in key_a
+
+def test_symbol_key_builder_keeps_query_params():
+    key_a = symbol_key_builder(get_analysis, (), {"symbol": "AAPL", "lookback_minutes": 60})
+    key_b = symbol_key_builder(get_analysis, (), {"symbol": "AAPL", "lookback_minutes": 120})
+
+    assert key_a != key_b
+
+def test_filter_key_builder_ignores_filter_order():
+    key_a = filter_key_builder(get_analysis, (), {"symbol": {"AAPL", "MSFT"}, "current_user": {"id": "a"}})
+    key_b = filter_key_builder(get_analysis, (), {"symbol": ["MSFT", "AAPL"], "current_user": {"id": "b"}})
+
+    assert key_a == key_b
+
+def test_user_key_builder_scopes_by_user_id():
+    key_a = user_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "a", "email": "a@x"}})
+    key_a2 = user_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "a"}})
+    key_b = user_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "b"}})
+
+    assert key_a == key_a2
+    assert key_a != key_b
+
+@pytest.mark.asyncio
+async def test_cache_response_serves_repeat_calls_from_cache(mock_cache):
+    calls = []
+
+    @cache_response(expire=60, key_builder=symbol_key_builder)
+    async def endpoint(symbol: str, current_user=None):
+        calls.append(symbol)
+        return {"symbol": symbol}
+
+    first = await endpoint(symbol="AAPL", current_user={"id": "a"})
+    second = await endpoint(symbol="AAPL", current_user={"id": "b"})
+
+    assert first == second == {"symbol": "AAPL"}
+    assert calls == ["AAPL"]
+
+@pytest.mark.asyncio
+async def test_cache_response_prefixes_namespace(mock_cache):
+    @cache_response(expire=30, key_builder=user_key_builder, namespace="watchlist")
+    async def endpoint(watchlist_id: str, current_user=None):
+        return {"id": watchlist_id}
+
+    await endpoint(watchlist_id="w1", current_user={"id": "a"})
+
+    assert [key.split(":")[0] for key in mock_cache] == ["watchlist"]
+
+@pytest.mark.asyncio
+async def test_cache_response_builds_namespace_per_user(mock_cache):
+    @cache_response(
+        expire=30,
+        key_builder=user_key_builder,
+        namespace=lambda kwargs: f"watchlist:{kwargs['current_user']['id']}"
+    )
+    async def endpoint(watchlist_id: str, current_user=None):
+        return {"id": watchlist_id}
+
+    await endpoint(watchlist_id="w1", current_user={"id": "a"})
+    await endpoint(watchlist_id="w1", current_user={"id": "b"})
+
+    assert sorted(key.rsplit(":", 1)[0] for key in mock_cache) == ["watchlist:a", "watchlist:b"]
+
+def test_default_key_builder_skips_dependencies():
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    key_a = default_key_builder(get_analysis, (), {"symbol": "AAPL", "db": AsyncSession(), "current_user": {"id": "a", "email": "a@x"}})
+    key_a2 = default_key_builder(get_analysis, (AsyncSession(),), {"symbol": "AAPL", "session": AsyncSession(), "current_user": {"id": "a"}})
+    key_b = default_key_builder(get_analysis, (), {"symbol": "AAPL", "current_user": {"id": "b"}})
+
+    assert key_a == key_a2
+    assert key_a != key_b
@@ -295,3 +295,48 @@ async def test_dividend_analysis(mock_market_data, mock_fundamental):
     assert dividend.symbol == symbol
     assert dividend.dividend_yield >= 0
     assert dividend.payout_ratio >= 0
+
+@pytest.mark.asyncio
+async def test_fundamental_analysis_memoized():
+    """Test concurrent analysis requests share one pipeline run."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    fundamental_service._analysis_memo.clear()
+    build = AsyncMock(return_value=Mock(spec=FundamentalAnalysis))
+
+    with patch.object(fundamental_service, '_build_fundamental_analysis', build):
+        results = await asyncio.gather(*[
+            fundamental_service.get_fundamental_analysis("AAPL")
+            for _ in range(5)
+        ])
+        await fundamental_service.get_fundamental_analysis("AAPL")
+
+    assert all(r is results[0] for r in results)
+    build.assert_awaited_once_with("AAPL")
+    assert not fundamental_service._inflight
+    fundamental_service._analysis_memo.clear()
+
+@pytest.mark.asyncio
+async def test_fundamental_analysis_single_flight_shares_errors():
+    """Test concurrent waiters receive the leader's error and nothing is memoized."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    async def failing_build(symbol):
+        await asyncio.sleep(0)
+        raise ValueError("upstream down")
+
+    fundamental_service._analysis_memo.clear()
+    build = AsyncMock(side_effect=failing_build)
+
+    with patch.object(fundamental_service, '_build_fundamental_analysis', build):
+        results = await asyncio.gather(*[
+            fundamental_service.get_fundamental_analysis("AAPL")
+            for _ in range(3)
+        ], return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    build.assert_awaited_once_with("AAPL")
+    assert not fundamental_service._inflight
+    assert "AAPL" not in fundamental_service._analysis_memo
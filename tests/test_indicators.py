@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from app.models._technical_kernels import _compute_ofi_loop, mlofi
+from app.utils.indicators import BATCH_COLUMNS, batch_close_indicators, stack_series
+
+def _wilder_rsi(closes: np.ndarray, period: int = 14) -> float:
+    changes = np.diff(closes)
+    gain = np.clip(changes, 0, None)
+    loss = np.clip(-changes, 0, None)
+    avg_gain, avg_loss = gain[:period].mean(), loss[:period].mean()
+    for g, l in zip(gain[period:], loss[period:]):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+    return 100 * avg_gain / (avg_gain + avg_loss)
+
+def test_batch_matches_per_symbol_reference():
+    rng = np.random.default_rng(0)
+    series = [100 + rng.standard_normal(n).cumsum() for n in (120, 60, 250)]
+
+    table = batch_close_indicators(*stack_series(series))
+
+    assert table.shape == (3, len(BATCH_COLUMNS))
+    for closes, row in zip(series, table):
+        close = pd.Series(closes)
+        middle = close.tail(20).mean()
+        band = 2 * close.tail(20).std(ddof=0)
+        np.testing.assert_allclose(
+            row,
+            [middle, close.tail(50).mean(), _wilder_rsi(closes), middle + band, middle, middle - band]
+        )
+
+def test_short_series_yield_nan():
+    table = batch_close_indicators(*stack_series([np.arange(10.0), np.arange(30.0)]))
+
+    assert np.isnan(table[0]).all()
+    assert np.isnan(table[1, 1])  # sma_50
+    assert table[1, 2] == 100.0  # strictly rising closes
+
+def test_ofi_loop_covers_price_moves():
+    # Levels: price up, unchanged, down on both sides
+    bid_px = np.array([[100.0, 99.0, 98.0], [100.5, 99.0, 97.5]])
+    ask_px = np.array([[101.0, 102.0, 103.0], [100.5, 102.0, 103.5]])
+    bid_q = np.array([[5.0, 3.0, 4.0], [2.0, 7.0, 1.0]])
+    ask_q = np.array([[4.0, 6.0, 2.0], [1.0, 9.0, 8.0]])
+
+    bof, aof = _compute_ofi_loop(bid_px, bid_q, ask_px, ask_q)
+
+    np.testing.assert_array_equal(bof, [[2.0, 4.0, -4.0]])
+    np.testing.assert_array_equal(aof, [[1.0, 3.0, -2.0]])
+
+def test_mlofi_sums_ofi_loop_per_bucket():
+    rng = np.random.default_rng(1)
+    bid_px = 100 - rng.integers(0, 2, (9, 3)).cumsum(axis=1).astype(float)
+    ask_px = 101 + rng.integers(0, 2, (9, 3)).cumsum(axis=1).astype(float)
+    bid_q, ask_q = rng.uniform(1, 10, (2, 9, 3))
+    bucket_idx = np.array([0, 0, 0, 1, 1, 3, 3, 3, 3])
+
+    bof, aof = _compute_ofi_loop(bid_px, bid_q, ask_px, ask_q)
+    per_event = bof - aof
+    expected = [per_event[0:2].sum(0), per_event[2:4].sum(0), per_event[4:8].sum(0)]
+
+    np.testing.assert_allclose(mlofi(bid_px, bid_q, ask_px, ask_q, bucket_idx, levels=3), expected)
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services import market_data
+from app.services.market_data import DataSource, TimeFrame, market_data_service
+
+BARS = [
+    {"timestamp": f"2025-01-{day:02d}", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100}
+    for day in range(1, 6)
+]
+
+@pytest.mark.asyncio
+async def test_historical_data_is_the_streamed_pages_joined():
+    with patch.object(market_data.redis_client, "get_market_data", AsyncMock(return_value=BARS)):
+        pages = [
+            page
+            async for page in market_data_service.stream_historical_data(
+                "AAPL", period="1mo", interval="1d", page_size=2
+            )
+        ]
+        bars = await market_data_service.get_historical_data("AAPL", TimeFrame.DAY_1)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert bars == BARS
+
+@pytest.mark.asyncio
+async def test_historical_data_rejects_finnhub():
+    pages = market_data_service.stream_historical_data("AAPL", source=DataSource.FINNHUB)
+
+    with pytest.raises(ValueError):
+        await anext(pages)
@@ -0,0 +1,31 @@
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import middleware
+from app.core.middleware import RateLimitMiddleware
+
+app = FastAPI()
+app.add_middleware(RateLimitMiddleware)
+
+@app.get("/ping")
+async def ping():
+    return {"ok": True}
+
+client = TestClient(app)
+
+def test_rate_limit_allows_request_within_limit():
+    with patch.object(middleware.redis_client, "check_rate_limit", AsyncMock(return_value=(True, 1))):
+        response = client.get("/ping")
+
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Limit"] == str(middleware.settings.RATE_LIMIT_PER_SECOND)
+
+def test_rate_limit_throttled_request_gets_429():
+    with patch.object(middleware.redis_client, "check_rate_limit", AsyncMock(return_value=(False, 99))):
+        response = client.get("/ping")
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too many requests"}
+    assert response.headers["Retry-After"] == "1"
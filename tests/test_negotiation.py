@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import orjson
+import ormsgpack
+from pydantic import BaseModel
+
+from app.api.dependencies.negotiation import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    dumps_json,
+    negotiated_media_type,
+    negotiated_response
+)
+from app.models.technical import OrderFlowTrade, OrderFlowTradeBatch
+
+class Bar(BaseModel):
+    timestamp: datetime
+    close: float
+
+def test_negotiated_media_type():
+    assert negotiated_media_type(None) == JSON_MEDIA_TYPE
+    assert negotiated_media_type("application/json") == JSON_MEDIA_TYPE
+    assert negotiated_media_type("application/msgpack, */*;q=0.1") == MSGPACK_MEDIA_TYPE
+    assert negotiated_media_type("application/x-msgpack") == MSGPACK_MEDIA_TYPE
+
+def test_negotiated_response_packs_models():
+    bar = Bar(timestamp=datetime(2024, 1, 2, 15, 30), close=101.25)
+
+    assert negotiated_response(bar, JSON_MEDIA_TYPE) is bar
+
+    response = negotiated_response(bar, MSGPACK_MEDIA_TYPE)
+    assert response.media_type == MSGPACK_MEDIA_TYPE
+    assert ormsgpack.unpackb(response.body) == {
+        "timestamp": "2024-01-02T15:30:00+00:00",
+        "close": 101.25
+    }
+
+def test_negotiated_response_packs_trade_batches():
+    trade = OrderFlowTrade(
+        timestamp=datetime(2024, 1, 2, 15, 30),
+        price=101.25,
+        volume=200,
+        side="sell",
+        is_aggressive=True
+    )
+    batch = OrderFlowTradeBatch.from_trades([trade])
+
+    assert batch[0] == trade
+
+    response = negotiated_response(batch, MSGPACK_MEDIA_TYPE)
+    assert ormsgpack.unpackb(response.body) == batch.model_dump()
+
+def test_dumps_json_matches_pydantic_json():
+    trade = OrderFlowTrade(
+        timestamp=datetime(2024, 1, 2, 15, 30),
+        price=101.25,
+        volume=200,
+        side="buy",
+        is_aggressive=False
+    )
+    batch = OrderFlowTradeBatch.from_trades([trade, trade])
+
+    assert orjson.loads(dumps_json(batch)) == orjson.loads(batch.model_dump_json())
+
+    response = negotiated_response(batch, JSON_MEDIA_TYPE, fast_json=True)
+    assert response.media_type == JSON_MEDIA_TYPE
+    assert response.body == dumps_json(batch)
@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"price": 150.0}
+
+    results = await asyncio.gather(*[flight.do("quote:AAPL", fetch) for _ in range(10)])
+
+    assert all(r is results[0] for r in results)
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+@pytest.mark.asyncio
+async def test_distinct_keys_run_separately():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0)
+        return symbol
+
+    results = await asyncio.gather(
+        flight.do("quote:AAPL", lambda: fetch("AAPL")),
+        flight.do("quote:MSFT", lambda: fetch("MSFT"))
+    )
+
+    assert results == ["AAPL", "MSFT"]
+    assert sorted(calls) == ["AAPL", "MSFT"]
+
+@pytest.mark.asyncio
+async def test_errors_reach_all_waiters_and_are_not_retained():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(
+        *[flight.do("quote:AAPL", fail) for _ in range(3)],
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(flight) == 0
+    assert await flight.do("quote:AAPL", lambda: asyncio.sleep(0, result="ok")) == "ok"
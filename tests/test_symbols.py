@@ -0,0 +1,18 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies.symbols import validated_symbol
+
+@pytest.mark.parametrize("raw, expected", [("aapl", "AAPL"), ("BRK.B", "BRK.B"), ("bf-b", "BF-B")])
+def test_validated_symbol_uppercases(raw, expected):
+    assert validated_symbol(raw) == expected
+
+def test_validated_symbol_returns_interned_string():
+    assert validated_symbol("spy") is validated_symbol("SPY")
+
+@pytest.mark.parametrize("raw", ["", "1ABC", "AAPL$", "TOOLONGSYMBOL", "ÄPFEL"])
+def test_validated_symbol_rejects_invalid(raw):
+    with pytest.raises(HTTPException) as exc:
+        validated_symbol(raw)
+
+    assert exc.value.status_code == 422
@@ -10,6 +10,7 @@ from app.services.order_flow import order_flow_service
 from app.services.dark_pool import dark_pool_service
 from app.services.options_flow import options_flow_service
 from app.services.market_data import market_data_service
+from app.services.volume_analysis import volume_analysis_service
 from app.models.technical import (
     TimeFrame,
     VolumeProfile,
@@ -19,7 +20,12 @@ from app.models.technical import (
     LiquidityAnalysis,
     DarkPoolAnalysis,
     OptionsFlowAnalysis,
+    OptionContract,
+    OptionFlow,
+    OptionFlowRing,
+    OrderBookSnapshot,
     PatternSignal,
+    PriceVolumeHistogram,
     TrendAnalysis,
     Signal
 )
@@ -381,3 +387,152 @@ async def test_signal_generation(mock_market_data):
         assert "type" in signal
         assert "confidence" in signal
         assert 0 <= signal["confidence"] <= 1
+
+def _option_flows(count: int) -> list:
+    contract = OptionContract(
+        symbol="AAPL", expiry=datetime(2025, 3, 21), strike=200.0, type="call",
+        bid=1.0, ask=1.1, last=1.05, volume=10, open_interest=5,
+        implied_volatility=0.3, delta=0.5, gamma=0.1, theta=-0.1, vega=0.2, rho=0.01
+    )
+    return [
+        OptionFlow(
+            timestamp=datetime(2025, 1, 2, 15, i),
+            contract=contract,
+            side="sell" if i % 2 else "buy",
+            size=10 * (i + 1),
+            premium=100.0 * (i + 1),
+            is_sweep=i == 3,
+            sentiment="bearish" if i % 2 else "bullish",
+            execution_type="market"
+        )
+        for i in range(count)
+    ]
+
+def test_option_flow_ring_wraps_oldest_first():
+    flows = _option_flows(6)
+    ring = OptionFlowRing(capacity=4)
+
+    ring.extend(flows[:3])
+    assert np.shares_memory(ring.column("sizes"), ring.sizes)
+    assert list(ring.column("sizes")) == [10, 20, 30]
+
+    ring.extend(flows[3:])
+    assert len(ring) == 4
+    assert list(ring.column("sizes")) == [30, 40, 50, 60]
+    assert list(ring) == flows[2:]
+    assert ring[-1] == flows[-1]
+
+    # The list form round-trips through serialization
+    assert list(OptionFlowRing.model_validate(ring.model_dump())) == flows[2:]
+
+def test_option_flow_ring_filter_keeps_selection_order():
+    flows = _option_flows(6)
+    ring = OptionFlowRing(capacity=4)
+    ring.extend(flows)
+
+    premiums = ring.column("premiums")
+    by_premium = ring.filter(np.argsort(-premiums, kind="stable"))
+    assert [flow.premium for flow in by_premium] == [600.0, 500.0, 400.0, 300.0]
+
+    sweeps = ring.filter(premiums == 400.0)
+    assert list(sweeps) == [flows[3]]
+    assert sweeps[0].is_sweep
+
+def test_option_flow_ring_without_capacity():
+    ring = OptionFlowRing.model_validate([])
+    ring.append(_option_flows(1)[0])
+    assert len(ring) == 0
+
+    with pytest.raises(ValueError):
+        OptionFlowRing.model_validate({})
+
+def test_price_volume_histogram_round_trips_mapping():
+    histogram = PriceVolumeHistogram.model_validate({"101.5": 3.0, "100.0": 5.0, "100.5": 0.0})
+
+    assert list(histogram.prices) == [100.0, 100.5, 101.5]
+    assert histogram.model_dump() == {"100.0": 5.0, "100.5": 0.0, "101.5": 3.0}
+    assert PriceVolumeHistogram.model_validate(histogram.model_dump()).model_dump() == histogram.model_dump()
+
+def test_value_area_keeps_growing_past_an_exhausted_side():
+    histogram = PriceVolumeHistogram(
+        prices=[10.0, 11.0, 12.0, 13.0, 14.0],
+        volumes=[4.0, 3.0, 2.0, 1.0, 30.0]
+    )
+
+    assert histogram.point_of_control() == 14.0
+    # Nothing above the top level, so the range extends downwards only
+    assert histogram.value_area(0.9) == (14.0, 11.0)
+    # Ties extend towards the lower level
+    assert PriceVolumeHistogram(prices=[1.0, 2.0, 3.0], volumes=[1.0, 5.0, 1.0]).value_area(0.8) == (2.0, 1.0)
+
+def test_volume_distribution_spreads_bars_over_their_levels():
+    data = pd.DataFrame({
+        "low": [10.0, 11.0, 12.0],
+        "high": [12.0, 11.0, 14.0],
+        "volume": [300.0, 50.0, 90.0]
+    })
+
+    # Run twice: the second call gets the pooled buffers back and must not
+    # see the first call's totals
+    for _ in range(2):
+        histogram = volume_analysis_service._calculate_volume_distribution(data, num_bins=5)
+        assert list(histogram.prices) == [10.0, 11.0, 12.0, 13.0, 14.0]
+        assert list(histogram.volumes) == pytest.approx([100.0, 150.0, 130.0, 30.0, 30.0])
+
+def test_volume_distribution_flat_window_is_one_level():
+    data = pd.DataFrame({"low": [50.0, 50.0], "high": [50.0, 50.0], "volume": [10.0, 5.0]})
+
+    histogram = volume_analysis_service._calculate_volume_distribution(data, num_bins=20)
+
+    assert histogram.model_dump() == {"50.0": 15.0}
+    assert histogram.point_of_control() == 50.0
+    assert histogram.value_area(0.7) == (50.0, 50.0)
+
+def _dict_walk(levels: dict, size: float, best_first_descending: bool):
+    """The per-level walk over a price -> size map that the arrays replace."""
+    remaining, total_cost, max_price = size, 0.0, 0.0
+    for price in sorted(levels, reverse=best_first_descending):
+        taken = min(remaining, levels[price])
+        total_cost += taken * price
+        remaining -= taken
+        max_price = price
+        if remaining <= 0:
+            break
+    return total_cost, remaining, max_price
+
+def test_order_book_walk_matches_dict_walk():
+    bids = {99.5: 300.0, 100.0: 100.0, 98.0: 50.0, 99.0: 200.0}
+    asks = {101.0: 150.0, 100.5: 100.0, 102.5: 400.0}
+    book = OrderBookSnapshot.from_dict(datetime(2025, 1, 2, 15, 30), bids, asks)
+
+    assert list(book.bid_prices) == [100.0, 99.5, 99.0, 98.0]
+    assert list(book.ask_prices) == [100.5, 101.0, 102.5]
+    assert book.spread == 0.5
+    assert book.bid_depth == 600.0  # levels within 1% of the best bid
+
+    # Within one level, ending exactly on a level, and past the whole side
+    for size in (50.0, 250.0, 400.0, 1000.0):
+        assert book.walk("buy", size) == pytest.approx(_dict_walk(asks, size, False))
+        assert book.walk("sell", size) == pytest.approx(_dict_walk(bids, size, True))
+
+def test_order_book_needs_both_sides():
+    with pytest.raises(ValueError):
+        OrderBookSnapshot.from_dict(datetime(2025, 1, 2, 15, 30), {100.0: 1.0}, {})
+
+def test_order_flow_imbalance_buckets_naive_timestamps_as_utc(monkeypatch):
+    import time
+    # A half-hour UTC offset would move 10:20 and 10:40 UTC into different hours
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    try:
+        snapshots = [
+            OrderBookSnapshot.from_dict(datetime(2025, 1, 2, 10, minute), {100.0: 10.0 + minute}, {100.5: 10.0})
+            for minute in (0, 20, 40)
+        ]
+        rows = OrderFlowImbalance.batch_from_buckets(snapshots, timedelta(hours=1), levels=1)
+    finally:
+        monkeypatch.delenv("TZ")
+        time.tzset()
+
+    assert [row.timestamp for row in rows] == [datetime(2025, 1, 2, 10, 40)]
+    assert rows[0].buy_volume == 40.0